@@ -4,8 +4,12 @@
 import sys
 import os
 import logging
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+from debug_walk import compile_extension_pattern, walk
+
 # Add python-backend to the path
 sys.path.insert(0, 'python-backend')
 
@@ -16,45 +20,64 @@ logger = logging.getLogger(__name__)
 # Set minimal environment
 os.environ['OPENAI_API_KEY'] = 'sk-test-debug'
 
-try:
-    from core.config import config
-    from llama_index.core import SimpleDirectoryReader
-
-    logger.info("Testing document discovery...")
-
-    # Test document discovery
-    documents_found = []
-    for directory in config.target_directories:
-        dir_path = Path(directory)
-        if not dir_path.exists():
-            logger.warning(f"Directory does not exist: {directory}")
-            continue
-
-        for ext in config.file_extensions:
-            found = list(dir_path.rglob(f"*{ext}"))
-            documents_found.extend(found)
-            logger.info(f"Found {len(found)} {ext} files in {directory}")
-
-    logger.info(f"Total documents found: {len(documents_found)}")
-
-    # Test loading a small subset (first 3 files)
-    test_files = [str(doc) for doc in documents_found[:3]]
-    logger.info(f"Testing with first 3 files: {test_files}")
-
-    loaded_docs = []
-    for file_path in test_files:
-        try:
-            logger.info(f"Attempting to load: {file_path}")
-            reader = SimpleDirectoryReader(input_files=[file_path])
-            docs = reader.load_data()
-            loaded_docs.extend(docs)
-            logger.info(f"✅ Successfully loaded: {file_path} ({len(docs)} chunks)")
-        except Exception as e:
-            logger.error(f"❌ Failed to load {file_path}: {e}")
-
-    logger.info(f"Total loaded documents: {len(loaded_docs)}")
-
-except Exception as e:
-    logger.error(f"Script failed: {e}")
-    import traceback
-    traceback.print_exc()
\ No newline at end of file
+
+def main():
+    """Run document discovery and a small batched load."""
+    try:
+        from core.config import config
+        from llama_index.core import SimpleDirectoryReader
+
+        logger.info("Testing document discovery...")
+
+        # Test document discovery: one walk per directory, directories in parallel
+        pattern = compile_extension_pattern(config.file_extensions)
+        directories = []
+        for directory in config.target_directories:
+            if not Path(directory).exists():
+                logger.warning(f"Directory does not exist: {directory}")
+                continue
+            directories.append(directory)
+
+        documents_found = []
+        if directories:
+            with ThreadPoolExecutor(max_workers=min(32, len(directories) * 4)) as executor:
+                for directory, found in zip(directories, executor.map(lambda d: walk(d, pattern), directories)):
+                    documents_found.extend(found)
+                    logger.info(f"Found {len(found)} files in {directory}")
+
+        logger.info(f"Total documents found: {len(documents_found)}")
+
+        # Test loading a small subset (first 3 files)
+        test_files = [str(doc) for doc in documents_found[:3]]
+        logger.info(f"Testing with first 3 files: {test_files}")
+
+        loaded_docs = []
+        if test_files:
+            try:
+                # One shared reader for every file; fan out only when there are cores to use
+                reader = SimpleDirectoryReader(input_files=test_files, filename_as_id=True)
+                num_workers = min(len(test_files), os.cpu_count() or 1)
+                if num_workers > 1:
+                    loaded_docs = reader.load_data(num_workers=num_workers)
+                else:
+                    for docs in reader.iter_data():
+                        loaded_docs.extend(docs)
+
+                chunks_by_file = Counter(doc.metadata.get('file_path') for doc in loaded_docs)
+                for file_path in test_files:
+                    chunks = chunks_by_file[file_path]
+                    if chunks:
+                        logger.info(f"✅ Successfully loaded: {file_path} ({chunks} chunks)")
+                    else:
+                        logger.error(f"❌ Failed to load {file_path}: no documents returned")
+            except Exception as e:
+                logger.error(f"❌ Failed to load batch: {e}")
+
+        logger.info(f"Total loaded documents: {len(loaded_docs)}")
+
+    except Exception as e:
+        logger.exception("Script failed: %s", e)
+
+
+if __name__ == "__main__":
+    main()
@@ -19,13 +19,14 @@ os.environ['OPENAI_API_KEY'] = 'sk-test-debug'
 try:
     from core.config import config
     from llama_index.core import SimpleDirectoryReader
+    from debug_walk import compile_extension_pattern, walk
 
-    # Find PDF files
+    # Find PDF files (case-insensitive, one walk per directory)
+    pdf_pattern = compile_extension_pattern(['.pdf'])
     pdf_files = []
     for directory in config.target_directories:
-        dir_path = Path(directory)
-        if dir_path.exists():
-            pdf_files.extend(list(dir_path.rglob("*.pdf")))
+        if Path(directory).exists():
+            pdf_files.extend(walk(directory, pdf_pattern))
 
     logger.info(f"Found {len(pdf_files)} PDF files")
 
@@ -39,11 +40,7 @@ try:
             docs = reader.load_data()
             logger.info(f"✅ Successfully loaded PDF: {len(docs)} chunks")
         except Exception as e:
-            logger.error(f"❌ Failed to load PDF: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("❌ Failed to load PDF: %s", e)
 
 except Exception as e:
-    logger.error(f"Script failed: {e}")
-    import traceback
-    traceback.print_exc()
\ No newline at end of file
+    logger.exception("Script failed: %s", e)
\ No newline at end of file
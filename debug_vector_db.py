@@ -35,28 +35,35 @@ try:
     try:
         collection = client.get_collection("knowledge_base")
         print(f"\n=== Knowledge Base Collection ===")
-        print(f"Document count: {collection.count()}")
+        count = collection.count()
+        print(f"Document count: {count}")
 
-        if collection.count() > 0:
-            # Get first few documents for inspection
-            limit = min(5, collection.count())
-            results = collection.get(
-                limit=limit,
-                include=["documents", "metadatas"]
-            )
+        if count > 0:
+            # Inspect the first few documents (pass a number to inspect more),
+            # paging through the collection so large stores aren't loaded at once
+            limit = min(int(sys.argv[1]) if len(sys.argv) > 1 else 5, count)
+            page_size = 100
 
             print(f"\n=== Sample Documents (first {limit}) ===")
-            for i, (doc_id, doc, metadata) in enumerate(zip(
-                results["ids"],
-                results["documents"],
-                results["metadatas"]
-            )):
-                print(f"\n--- Document {i+1} ---")
-                print(f"ID: {doc_id}")
-                print(f"Metadata: {json.dumps(metadata, indent=2)}")
-                print(f"Content preview: {doc[:200]}...")
-                if len(doc) > 200:
-                    print(f"[Content truncated - full length: {len(doc)} chars]")
+            for offset in range(0, limit, page_size):
+                results = collection.get(
+                    limit=min(page_size, limit - offset),
+                    offset=offset,
+                    include=["documents", "metadatas"]
+                )
+                ids = results["ids"]
+                docs = results["documents"]
+                metas = results["metadatas"]
+
+                for i in range(len(ids)):
+                    doc = docs[i]
+                    doc_len = len(doc)
+                    print(f"\n--- Document {offset + i + 1} ---")
+                    print(f"ID: {ids[i]}")
+                    print(f"Metadata: {json.dumps(metas[i], indent=2)}")
+                    print(f"Content preview: {doc[:200]}...")
+                    if doc_len > 200:
+                        print(f"[Content truncated - full length: {doc_len} chars]")
 
     except Exception as e:
         print(f"❌ Error accessing knowledge_base collection: {e}")
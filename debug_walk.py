@@ -0,0 +1,34 @@
+"""Directory walk helpers shared by the debug scripts.
+
+Kept free of side effects (no environment or path changes) so any script can
+import it.
+"""
+
+import logging
+import os
+import re
+
+logger = logging.getLogger(__name__)
+
+
+def compile_extension_pattern(extensions):
+    """Compile the extensions into one case-insensitive suffix regex."""
+    alternatives = '|'.join(re.escape(ext.lstrip('.').lower()) for ext in extensions)
+    return re.compile(r'\.(?:' + alternatives + r')$', re.IGNORECASE)
+
+
+def walk(root, pattern):
+    """Collect files under root whose name matches pattern, in a single pass."""
+    stack = [root]
+    out = []
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file() and pattern.search(entry.name):
+                        out.append(entry.path)
+        except OSError as e:
+            logger.warning(f"Cannot scan directory: {e}")
+    return out
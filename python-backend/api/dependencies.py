@@ -0,0 +1,25 @@
+"""Shared FastAPI dependencies for API routes."""
+
+from fastapi import HTTPException, Request
+
+from core.knowledge_system import KnowledgeSystem
+
+
+def get_knowledge_system(request: Request) -> KnowledgeSystem:
+    """Return the knowledge system attached to the app, or 503 if missing."""
+    knowledge_system = getattr(request.app.state, "knowledge_system", None)
+    if not knowledge_system:
+        raise HTTPException(status_code=503, detail="Knowledge system not available")
+    return knowledge_system
+
+
+def require_ready(request: Request) -> KnowledgeSystem:
+    """Return the knowledge system once it is ready, or 503 otherwise.
+
+    KnowledgeSystem.is_ready() returns readiness it caches and refreshes on
+    index updates, so the guard does not walk every service on each request.
+    """
+    knowledge_system = get_knowledge_system(request)
+    if not knowledge_system.is_ready():
+        raise HTTPException(status_code=503, detail="Knowledge system not ready")
+    return knowledge_system
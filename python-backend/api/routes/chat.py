@@ -1,31 +1,36 @@
 """Chat API routes."""
 
-from fastapi import APIRouter, Request, HTTPException
-from pydantic import BaseModel
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, ConfigDict
 from typing import Dict, Any
+import json
 import logging
 
+from api.dependencies import require_ready
+from core.knowledge_system import KnowledgeSystem
+
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
 class ChatRequest(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
     message: str
 
 class QueryRequest(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
     query: str
 
 @router.post("/message")
-async def chat_message(request: Request, chat_request: ChatRequest) -> Dict[str, Any]:
+async def chat_message(
+    chat_request: ChatRequest,
+    knowledge_system: KnowledgeSystem = Depends(require_ready)
+) -> Dict[str, Any]:
     """Process a chat message with the knowledge agent."""
     try:
-        knowledge_system = request.app.state.knowledge_system
-        if not knowledge_system:
-            raise HTTPException(status_code=503, detail="Knowledge system not available")
-
-        if not knowledge_system.is_ready():
-            raise HTTPException(status_code=503, detail="Knowledge system not ready")
-
         if not chat_request.message.strip():
             raise HTTPException(status_code=400, detail="Message cannot be empty")
 
@@ -34,20 +39,39 @@ async def chat_message(request: Request, chat_request: ChatRequest) -> Dict[str,
         return result
 
     except Exception as e:
-        logger.error(f"Chat message failed: {e}")
+        logger.error("Chat message failed: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
+@router.post("/message/stream")
+async def chat_message_stream(
+    chat_request: ChatRequest,
+    knowledge_system: KnowledgeSystem = Depends(require_ready)
+) -> StreamingResponse:
+    """Stream a chat response as server-sent events.
+
+    Each event carries a ``delta`` text chunk; the stream ends with ``[DONE]``.
+    """
+    if not chat_request.message.strip():
+        raise HTTPException(status_code=400, detail="Message cannot be empty")
+
+    async def event_stream():
+        try:
+            async for chunk in knowledge_system.chat_stream(chat_request.message):
+                yield f"data: {json.dumps({'delta': chunk})}\n\n"
+        except Exception as e:
+            logger.error("Chat stream failed: %s", e)
+            yield f"data: {json.dumps({'error': str(e)})}\n\n"
+        yield "data: [DONE]\n\n"
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
+
 @router.post("/query")
-async def query_documents(request: Request, query_request: QueryRequest) -> Dict[str, Any]:
+async def query_documents(
+    query_request: QueryRequest,
+    knowledge_system: KnowledgeSystem = Depends(require_ready)
+) -> Dict[str, Any]:
     """Query documents directly (without agent processing)."""
     try:
-        knowledge_system = request.app.state.knowledge_system
-        if not knowledge_system:
-            raise HTTPException(status_code=503, detail="Knowledge system not available")
-
-        if not knowledge_system.is_ready():
-            raise HTTPException(status_code=503, detail="Knowledge system not ready")
-
         if not query_request.query.strip():
             raise HTTPException(status_code=400, detail="Query cannot be empty")
 
@@ -56,5 +80,5 @@ async def query_documents(request: Request, query_request: QueryRequest) -> Dict
         return result
 
     except Exception as e:
-        logger.error(f"Document query failed: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
\ No newline at end of file
+        logger.error("Document query failed: %s", e)
+        raise HTTPException(status_code=500, detail=str(e))
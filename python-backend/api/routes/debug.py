@@ -0,0 +1,106 @@
+"""Debug API routes that inspect the live knowledge system.
+
+These mirror the standalone debug scripts but reuse the already-initialized
+ChromaDB client and indexer, so no cold imports are needed per invocation.
+Only available when ``system.enable_debug`` is set.
+"""
+
+import asyncio
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict
+
+from fastapi import APIRouter, Depends, HTTPException
+
+from api.dependencies import get_knowledge_system
+from core.config import config
+from core.knowledge_system import KnowledgeSystem
+
+router = APIRouter()
+
+
+def require_debug() -> None:
+    """Hide debug routes unless debug mode is enabled."""
+    if not config.enable_debug:
+        raise HTTPException(status_code=404, detail="Not Found")
+
+
+@router.get("/vector_db", dependencies=[Depends(require_debug)])
+async def inspect_vector_db(
+    limit: int = 5,
+    knowledge_system: KnowledgeSystem = Depends(get_knowledge_system)
+) -> Dict[str, Any]:
+    """Inspect the indexed ChromaDB collection.
+
+    Args:
+        limit: Number of sample documents to return (default 5)
+        knowledge_system: Knowledge system injected by get_knowledge_system
+
+    Returns:
+        Collection names, document count, and sample documents
+    """
+    if not knowledge_system.document_service:
+        raise HTTPException(status_code=503, detail="Document service not available")
+
+    indexer = knowledge_system.document_service.indexer
+
+    def _inspect() -> Dict[str, Any]:
+        collection = indexer.chroma_collection
+        count = collection.count()
+        samples = []
+
+        if count > 0:
+            results = collection.get(
+                limit=min(limit, count),
+                include=["documents", "metadatas"]
+            )
+            ids = results["ids"]
+            docs = results["documents"]
+            metas = results["metadatas"]
+            for i in range(len(ids)):
+                doc = docs[i] or ""
+                samples.append({
+                    "id": ids[i],
+                    "metadata": metas[i],
+                    "preview": doc[:200],
+                    "length": len(doc),
+                })
+
+        return {
+            "storage_path": config.storage_path,
+            "collections": [col.name for col in indexer.chroma_client.list_collections()],
+            "collection_name": indexer.collection_name,
+            "document_count": count,
+            "samples": samples,
+        }
+
+    try:
+        return await asyncio.to_thread(_inspect)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/scan", dependencies=[Depends(require_debug)])
+async def scan_documents(
+    knowledge_system: KnowledgeSystem = Depends(get_knowledge_system)
+) -> Dict[str, Any]:
+    """Run document discovery over the target directories and report counts.
+
+    Counts every supported file found, whether or not it is already indexed.
+    """
+    document_service = knowledge_system.document_service
+    if not document_service:
+        raise HTTPException(status_code=503, detail="Document service not available")
+
+    try:
+        documents = await document_service.list_documents()
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+    by_extension = Counter(Path(doc).suffix.lower() for doc in documents)
+    return {
+        "target_directories": config.target_directories,
+        "document_count": len(documents),
+        "by_extension": dict(by_extension),
+        "sample": documents[:10],
+    }
@@ -1,60 +1,59 @@
 """Document management API routes."""
 
-from fastapi import APIRouter, Request, HTTPException, BackgroundTasks
-from pydantic import BaseModel
+from fastapi import APIRouter, Depends, HTTPException
+from pydantic import BaseModel, ConfigDict
 from typing import List, Dict, Any
 import logging
 
+from api.dependencies import get_knowledge_system, require_ready
+from core.knowledge_system import KnowledgeSystem
+
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
 class AddDocumentsRequest(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
     file_paths: List[str]
 
 class SearchDocumentsRequest(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
     query: str
     top_k: int = 10
+    preview_only: bool = False
+
+# Characters of text kept per result when preview_only is set
+PREVIEW_LENGTH = 200
 
 @router.post("/refresh")
-async def refresh_index(request: Request) -> Dict[str, Any]:
+async def refresh_index(
+    knowledge_system: KnowledgeSystem = Depends(require_ready)
+) -> Dict[str, Any]:
     """Start an asynchronous index refresh operation.
 
     Returns operation_id to track progress via GET /operations/{operation_id}
     """
     try:
-        knowledge_system = request.app.state.knowledge_system
-        if not knowledge_system:
-            raise HTTPException(status_code=503, detail="Knowledge system not available")
-
-        if not knowledge_system.is_ready():
-            raise HTTPException(status_code=503, detail="Knowledge system not ready")
-
         # Start async refresh operation
         result = await knowledge_system.refresh_index()
         return result
 
     except Exception as e:
-        logger.error(f"Index refresh failed: {e}")
+        logger.error("Index refresh failed: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.post("/add")
 async def add_documents(
-    request: Request,
-    add_request: AddDocumentsRequest
+    add_request: AddDocumentsRequest,
+    knowledge_system: KnowledgeSystem = Depends(require_ready)
 ) -> Dict[str, Any]:
     """Start an asynchronous add documents operation.
 
     Returns operation_id to track progress via GET /operations/{operation_id}
     """
     try:
-        knowledge_system = request.app.state.knowledge_system
-        if not knowledge_system:
-            raise HTTPException(status_code=503, detail="Knowledge system not available")
-
-        if not knowledge_system.is_ready():
-            raise HTTPException(status_code=503, detail="Knowledge system not ready")
-
         if not add_request.file_paths:
             raise HTTPException(status_code=400, detail="No file paths provided")
 
@@ -63,32 +62,29 @@ async def add_documents(
         return result
 
     except Exception as e:
-        logger.error(f"Add documents failed: {e}")
+        logger.error("Add documents failed: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.post("/search")
 async def search_documents(
-    request: Request,
-    search_request: SearchDocumentsRequest
+    search_request: SearchDocumentsRequest,
+    knowledge_system: KnowledgeSystem = Depends(require_ready)
 ) -> Dict[str, Any]:
     """Search for documents similar to the query."""
     try:
-        knowledge_system = request.app.state.knowledge_system
-        if not knowledge_system:
-            raise HTTPException(status_code=503, detail="Knowledge system not available")
-
-        if not knowledge_system.is_ready():
-            raise HTTPException(status_code=503, detail="Knowledge system not ready")
-
         if not search_request.query.strip():
             raise HTTPException(status_code=400, detail="Query cannot be empty")
 
         # Search documents via Agno knowledge
-        results = knowledge_system.search_documents(
+        results = await knowledge_system.search_documents(
             search_request.query,
             search_request.top_k
         )
 
+        if search_request.preview_only:
+            for result in results:
+                result["text"] = result["text"][:PREVIEW_LENGTH]
+
         return {
             "success": True,
             "query": search_request.query,
@@ -97,23 +93,21 @@ async def search_documents(
         }
 
     except Exception as e:
-        logger.error(f"Document search failed: {e}")
+        logger.error("Document search failed: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/stats")
-async def get_document_stats(request: Request) -> Dict[str, Any]:
+async def get_document_stats(
+    knowledge_system: KnowledgeSystem = Depends(get_knowledge_system)
+) -> Dict[str, Any]:
     """Get document index statistics."""
     try:
-        knowledge_system = request.app.state.knowledge_system
-        if not knowledge_system:
-            raise HTTPException(status_code=503, detail="Knowledge system not available")
-
         if not knowledge_system.is_ready():
             return {"status": "not_ready", "document_count": 0}
 
-        stats = knowledge_system.document_service.get_index_stats()
+        stats = await knowledge_system.document_service.get_cached_index_stats()
         return stats
 
     except Exception as e:
-        logger.error(f"Get stats failed: {e}")
+        logger.error("Get stats failed: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
@@ -1,9 +1,12 @@
 """Operations API routes for tracking long-running operations."""
 
-from fastapi import APIRouter, Request, HTTPException
+from fastapi import APIRouter, Depends, HTTPException
 from typing import Dict, Any, Optional
 import logging
 
+from api.dependencies import require_ready
+from core.knowledge_system import KnowledgeSystem
+
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
@@ -11,26 +14,19 @@ router = APIRouter()
 
 @router.get("/operations/{operation_id}")
 async def get_operation_status(
-    request: Request,
-    operation_id: str
+    operation_id: str,
+    knowledge_system: KnowledgeSystem = Depends(require_ready)
 ) -> Dict[str, Any]:
     """Get the status of a specific operation.
 
     Args:
-        request: FastAPI request object
         operation_id: The operation ID to check
+        knowledge_system: Ready knowledge system injected by require_ready
 
     Returns:
         Operation details including status, progress, and results
     """
     try:
-        knowledge_system = request.app.state.knowledge_system
-        if not knowledge_system:
-            raise HTTPException(status_code=503, detail="Knowledge system not available")
-
-        if not knowledge_system.is_ready():
-            raise HTTPException(status_code=503, detail="Knowledge system not ready")
-
         # Get operation from document service
         operation = await knowledge_system.document_service.operation_manager.get_operation(
             operation_id
@@ -47,34 +43,27 @@ async def get_operation_status(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to get operation status: {e}")
+        logger.error("Failed to get operation status: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.get("/operations")
 async def list_operations(
-    request: Request,
     limit: int = 50,
-    status: Optional[str] = None
+    status: Optional[str] = None,
+    knowledge_system: KnowledgeSystem = Depends(require_ready)
 ) -> Dict[str, Any]:
     """List recent operations.
 
     Args:
-        request: FastAPI request object
         limit: Maximum number of operations to return (default 50)
         status: Filter by status (optional)
+        knowledge_system: Ready knowledge system injected by require_ready
 
     Returns:
         List of recent operations
     """
     try:
-        knowledge_system = request.app.state.knowledge_system
-        if not knowledge_system:
-            raise HTTPException(status_code=503, detail="Knowledge system not available")
-
-        if not knowledge_system.is_ready():
-            raise HTTPException(status_code=503, detail="Knowledge system not ready")
-
         # List operations from document service
         operations = await knowledge_system.document_service.operation_manager.list_operations(
             limit=limit,
@@ -88,32 +77,25 @@ async def list_operations(
         }
 
     except Exception as e:
-        logger.error(f"Failed to list operations: {e}")
+        logger.error("Failed to list operations: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.post("/operations/{operation_id}/cancel")
 async def cancel_operation(
-    request: Request,
-    operation_id: str
+    operation_id: str,
+    knowledge_system: KnowledgeSystem = Depends(require_ready)
 ) -> Dict[str, Any]:
     """Cancel a running operation.
 
     Args:
-        request: FastAPI request object
         operation_id: The operation ID to cancel
+        knowledge_system: Ready knowledge system injected by require_ready
 
     Returns:
         Cancellation confirmation
     """
     try:
-        knowledge_system = request.app.state.knowledge_system
-        if not knowledge_system:
-            raise HTTPException(status_code=503, detail="Knowledge system not available")
-
-        if not knowledge_system.is_ready():
-            raise HTTPException(status_code=503, detail="Knowledge system not ready")
-
         # Check if operation exists
         operation = await knowledge_system.document_service.operation_manager.get_operation(
             operation_id
@@ -139,5 +121,5 @@ async def cancel_operation(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to cancel operation: {e}")
+        logger.error("Failed to cancel operation: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
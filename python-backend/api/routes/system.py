@@ -1,18 +1,19 @@
 """System and health check API routes."""
 
-from fastapi import APIRouter, Request, HTTPException
+from fastapi import APIRouter, Depends, HTTPException
 from typing import Dict, Any
 
+from api.dependencies import get_knowledge_system
+from core.knowledge_system import KnowledgeSystem
+
 router = APIRouter()
 
 @router.get("/status")
-async def get_system_status(request: Request) -> Dict[str, Any]:
+async def get_system_status(
+    knowledge_system: KnowledgeSystem = Depends(get_knowledge_system)
+) -> Dict[str, Any]:
     """Get the current system status and statistics."""
     try:
-        knowledge_system = request.app.state.knowledge_system
-        if not knowledge_system:
-            raise HTTPException(status_code=503, detail="Knowledge system not available")
-
         status = await knowledge_system.get_system_status()
         return status
 
@@ -25,13 +26,11 @@ async def health_check() -> Dict[str, str]:
     return {"status": "healthy", "service": "knowledge-management-api"}
 
 @router.get("/config")
-async def get_config(request: Request) -> Dict[str, Any]:
+async def get_config(
+    knowledge_system: KnowledgeSystem = Depends(get_knowledge_system)
+) -> Dict[str, Any]:
     """Get configuration information (non-sensitive)."""
     try:
-        knowledge_system = request.app.state.knowledge_system
-        if not knowledge_system:
-            raise HTTPException(status_code=503, detail="Knowledge system not available")
-
         config = knowledge_system.config
         return {
             "target_directories": config.target_directories,
@@ -1,39 +1,110 @@
 """Native Agno knowledge integration for read-only querying of existing ChromaDB."""
 
+import asyncio
 import logging
-from typing import Dict, Any, Optional
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Sequence
 
+import numpy as np
 from agno.knowledge.knowledge import Knowledge
 from agno.knowledge.embedder.openai import OpenAIEmbedder
 from agno.vectordb.chroma import ChromaDb
+from openai import AsyncOpenAI
 
-from .config import config
+from .chroma_client import get_chroma_client
+from .config import get_config
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class QueryCachingEmbedder(OpenAIEmbedder):
+    """OpenAIEmbedder that remembers recently embedded texts.
+
+    Lets callers embed a query up front (e.g. for the search cache) without the
+    vector search that follows paying for a second embeddings request.
+    """
+
+    cache_size: int = 256
+    _cache: "OrderedDict[str, List[float]]" = field(default_factory=OrderedDict, init=False, repr=False)
+    _cache_lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    def get_embedding(self, text: str) -> List[float]:
+        with self._cache_lock:
+            cached = self._cache.get(text)
+            if cached is not None:
+                self._cache.move_to_end(text)
+                return cached
+
+        embedding = super().get_embedding(text)
+        if embedding:
+            with self._cache_lock:
+                self._cache[text] = embedding
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+        return embedding
+
+
+class SharedClientChromaDb(ChromaDb):
+    """ChromaDb that runs on an existing client instead of opening its own.
+
+    ChromaDb takes no client argument and creates a persistent client on first
+    use; overriding the public client property shares one across refreshes.
+    """
+
+    def __init__(self, client: Any, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self._shared_client = client
+
+    @property
+    def client(self) -> Any:
+        return self._shared_client
+
+
 class AgnoKnowledgeManager:
     """Read-only interface to existing ChromaDB using Agno's Knowledge class."""
 
+    # Texts per embeddings request and concurrent requests in flight
+    EMBEDDING_BATCH_SIZE = 128
+    EMBEDDING_CONCURRENCY = 8
+
     def __init__(self) -> None:
         """Initialize the Agno knowledge manager."""
-        self.config = config
+        self.config = get_config()
         self.knowledge: Optional[Knowledge] = None
+        self.vector_db: Optional[SharedClientChromaDb] = None
+        # Reused across refresh() so only the Knowledge wrapper is rebuilt
+        self._chroma_client: Optional[Any] = None
+        self._embedder: Optional[QueryCachingEmbedder] = None
+        self._openai_client: Optional[AsyncOpenAI] = None
         self._setup_knowledge()
 
     def _setup_knowledge(self) -> None:
         """Create the Agno Knowledge instance using the existing ChromaDB store."""
         try:
-            vector_db = ChromaDb(
+            if self._embedder is None:
+                self._embedder = QueryCachingEmbedder(
+                    id=self.config.embedding_model,
+                    dimensions=self.config.embedding_dimensions,
+                    api_key=self.config.get_openai_api_key()
+                )
+            if self._chroma_client is None:
+                self._chroma_client = get_chroma_client()
+
+            # Reuse the shared client so a refresh doesn't open a new one
+            vector_db = SharedClientChromaDb(
+                self._chroma_client,
                 collection=self.config.collection_name,
                 path=self.config.storage_path,
                 persistent_client=True,
-                embedder=OpenAIEmbedder(
-                    id=self.config.embedding_model,
-                    api_key=self.config.get_openai_api_key()
-                ),
+                embedder=self._embedder,
             )
 
+            self.vector_db = vector_db
             self.knowledge = Knowledge(vector_db=vector_db)
             logger.info("Connected Agno Knowledge to existing ChromaDB collection")
 
@@ -41,6 +112,162 @@ class AgnoKnowledgeManager:
             logger.error("Failed to initialize Agno Knowledge: %s", exc)
             raise
 
+    def embed_query(self, query: str) -> List[float]:
+        """Embed a search query with the embedder used for vector search."""
+        if not self._embedder:
+            raise RuntimeError("Knowledge manager is not ready")
+        return self._embedder.get_embedding(query)
+
+    async def embed_batch(
+        self,
+        texts: List[str],
+        batch_size: int = EMBEDDING_BATCH_SIZE,
+    ) -> np.ndarray:
+        """Embed texts in batched OpenAI requests issued concurrently.
+
+        Args:
+            texts: Texts to embed
+            batch_size: Number of texts sent per embeddings request
+
+        Returns:
+            Array of shape (len(texts), dimensions) in input order
+        """
+        if not texts:
+            return np.empty((0, 0), dtype=np.float32)
+
+        if self._openai_client is None:
+            self._openai_client = AsyncOpenAI(api_key=self.config.get_openai_api_key())
+
+        client = self._openai_client
+        semaphore = asyncio.Semaphore(self.EMBEDDING_CONCURRENCY)
+        dimensions = self.config.embedding_dimensions
+        extra = {"dimensions": dimensions} if dimensions else {}
+
+        async def _embed(batch: List[str]) -> List[List[float]]:
+            async with semaphore:
+                response = await client.embeddings.create(
+                    input=batch,
+                    model=self.config.embedding_model,
+                    **extra,
+                )
+            return [item.embedding for item in sorted(response.data, key=lambda item: item.index)]
+
+        batches = [texts[i:i + batch_size] for i in range(0, len(texts), batch_size)]
+        results = await asyncio.gather(*(_embed(batch) for batch in batches))
+        return np.asarray([vector for batch in results for vector in batch], dtype=np.float32)
+
+    def _get_collection(self) -> Any:
+        """Return the indexed collection.
+
+        Looked up per call rather than kept, since a refresh drops and
+        recreates the collection under the same name. Blocking.
+        """
+        return self.vector_db.client.get_or_create_collection(
+            self.config.collection_name, embedding_function=None
+        )
+
+    async def search_batch(
+        self,
+        queries: List[str],
+        limit: int,
+        embeddings: Optional[List[Optional[Sequence[float]]]] = None,
+    ) -> List[List[Dict[str, Any]]]:
+        """Run several vector searches with one embeddings request and one query.
+
+        Args:
+            queries: Search query texts
+            limit: Number of results to return per query
+            embeddings: Optional precomputed embeddings aligned with queries;
+                None entries are embedded here
+
+        Returns:
+            One list of formatted results per query, in input order
+        """
+        if not self.vector_db:
+            raise RuntimeError("Knowledge manager is not ready")
+        if not queries:
+            return []
+
+        vectors = list(embeddings) if embeddings else [None] * len(queries)
+        missing = [i for i, vector in enumerate(vectors) if vector is None]
+        if missing:
+            fresh = await self.embed_batch([queries[i] for i in missing])
+            for i, vector in zip(missing, fresh):
+                vectors[i] = vector.tolist()
+
+        # The collection lookup is a Chroma call too, so it shares the thread
+        result = await asyncio.to_thread(
+            lambda: self._get_collection().query(
+                query_embeddings=vectors,
+                n_results=limit,
+                include=["metadatas", "documents", "distances"],
+            )
+        )
+
+        batches: List[List[Dict[str, Any]]] = []
+        for ids, documents, metadatas, distances in zip(
+            result["ids"], result["documents"], result["metadatas"], result["distances"]
+        ):
+            formatted = []
+            for doc_id, text, metadata, distance in zip(ids, documents, metadatas, distances):
+                # Same shape as Agno's Document: name/content_id are fields, not metadata
+                metadata = dict(metadata or {})
+                metadata.pop("name", None)
+                metadata.pop("content_id", None)
+                metadata["distances"] = distance
+                metadata["similarity_score"] = distance
+                formatted.append(
+                    {
+                        "text": text or "",
+                        # No reranker is configured, matching Document.reranking_score
+                        "score": None,
+                        "metadata": metadata,
+                        "document_id": doc_id,
+                    }
+                )
+            batches.append(formatted)
+
+        return batches
+
+    def _prefetch_index_files(self) -> None:
+        """Ask the kernel to read the HNSW segment files into the page cache."""
+        if not hasattr(os, "posix_fadvise"):
+            return
+
+        for path in Path(self.config.storage_path).glob("*/*.bin"):
+            try:
+                fd = os.open(path, os.O_RDONLY)
+                try:
+                    os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+                finally:
+                    os.close(fd)
+            except OSError as exc:
+                logger.debug("Could not prefetch %s: %s", path, exc)
+
+    def warm_index(self) -> None:
+        """Load the HNSW index ahead of the first user query.
+
+        Runs a one-result query using a stored embedding so Chroma loads the
+        index now instead of on the first chat after startup. Blocking; run it
+        on a worker thread.
+        """
+        if not self.vector_db:
+            return
+
+        self._prefetch_index_files()
+
+        collection = self._get_collection()
+        if collection.count() == 0:
+            return
+
+        sample = collection.get(limit=1, include=["embeddings"])
+        embeddings = sample.get("embeddings")
+        if embeddings is None or len(embeddings) == 0:
+            return
+
+        collection.query(query_embeddings=[embeddings[0]], n_results=1, include=[])
+        logger.info("Warmed vector index for %s", self.config.collection_name)
+
     def get_knowledge_instance(self) -> Optional[Knowledge]:
         """Return the underlying Knowledge instance."""
         return self.knowledge
@@ -0,0 +1,202 @@
+"""Response cache for chat messages with exact-match and semantic lookup."""
+
+import asyncio
+import hashlib
+import logging
+import uuid
+from collections import OrderedDict
+from typing import Any, List, Optional
+
+from agno.knowledge.embedder.openai import OpenAIEmbedder
+
+from .chroma_client import get_chroma_client
+from .config import get_config
+
+logger = logging.getLogger(__name__)
+
+
+class SemanticChatCache:
+    """Cache chat responses so repeated or near-duplicate questions skip the LLM.
+
+    Lookups first hit an in-memory LRU keyed by the message hash. On a miss the
+    message is embedded and matched against a dedicated ChromaDB collection;
+    a stored answer is returned when its cosine distance is under the threshold.
+    The collection is emptied when first opened, so answers cached against an
+    earlier run's knowledge base are never served.
+    """
+
+    COLLECTION_NAME = "chat_cache"
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        similarity_threshold: Optional[float] = None,
+        semantic: Optional[bool] = None,
+    ) -> None:
+        """Initialize the chat cache.
+
+        Args:
+            max_entries: Maximum number of exact-match entries kept in memory
+            similarity_threshold: Maximum cosine distance for a semantic hit
+            semantic: Whether to fall back to embedding similarity on a miss
+        """
+        self.config = get_config()
+        self.max_entries = max_entries or self.config.chat_cache_max_entries
+        self.similarity_threshold = (
+            similarity_threshold
+            if similarity_threshold is not None
+            else self.config.chat_cache_similarity_threshold
+        )
+        self.semantic = self.config.chat_cache_semantic if semantic is None else semantic
+        self._entries: "OrderedDict[str, str]" = OrderedDict()
+        self._embedder: Optional[OpenAIEmbedder] = None
+        self._client: Optional[Any] = None
+        self._collection: Optional[Any] = None
+        # Whether this process has dropped the collection a previous run left
+        self._started_fresh = False
+        # Last embedded message, so a miss followed by put() embeds only once
+        self._last_embedding: Optional[tuple] = None
+
+    @staticmethod
+    def _key(message: str) -> str:
+        """Return the exact-match key for a message, ignoring case and spacing."""
+        normalized = " ".join(message.split()).lower()
+        return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+    def _get_client(self) -> Any:
+        """Return the ChromaDB client backing the semantic cache."""
+        if self._client is None:
+            self._client = get_chroma_client()
+        return self._client
+
+    def _get_collection(self) -> Any:
+        """Return the semantic cache collection, creating it on first use."""
+        if self._collection is None:
+            if not self._started_fresh:
+                self._drop_previous_run()
+            self._collection = self._get_client().get_or_create_collection(
+                self.COLLECTION_NAME,
+                metadata={"hnsw:space": "cosine"},
+                embedding_function=None,
+            )
+        return self._collection
+
+    def _drop_previous_run(self) -> None:
+        """Delete the collection persisted by an earlier run of the backend.
+
+        The documents may have changed while the backend was down, and
+        refresh_knowledge only clears the cache for changes made while it runs.
+        """
+        client = self._get_client()
+        try:
+            client.get_collection(self.COLLECTION_NAME)
+        except Exception:
+            # Nothing cached yet
+            self._started_fresh = True
+            return
+
+        # A failed delete raises, so the next lookup tries again
+        client.delete_collection(self.COLLECTION_NAME)
+        self._started_fresh = True
+        logger.info("Dropped semantic chat cache from a previous run")
+
+    def _embed(self, message: str) -> List[float]:
+        """Embed a message with the configured OpenAI embedding model."""
+        if self._embedder is None:
+            self._embedder = OpenAIEmbedder(
+                id=self.config.embedding_model,
+                dimensions=self.config.embedding_dimensions,
+                api_key=self.config.get_openai_api_key(),
+            )
+
+        if self._last_embedding and self._last_embedding[0] == message:
+            return self._last_embedding[1]
+
+        embedding = self._embedder.get_embedding(message)
+        self._last_embedding = (message, embedding)
+        return embedding
+
+    def _remember(self, key: str, response: str) -> None:
+        """Store a response in the exact-match LRU."""
+        self._entries[key] = response
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _semantic_lookup(self, message: str) -> Optional[str]:
+        """Return the closest cached response within the similarity threshold."""
+        collection = self._get_collection()
+        if collection.count() == 0:
+            return None
+
+        results = collection.query(
+            query_embeddings=[self._embed(message)],
+            n_results=1,
+            include=["metadatas", "distances"],
+        )
+        distances = results.get("distances") or [[]]
+        metadatas = results.get("metadatas") or [[]]
+        if not distances[0] or distances[0][0] > self.similarity_threshold:
+            return None
+
+        return metadatas[0][0].get("response")
+
+    def _semantic_store(self, message: str, response: str) -> None:
+        """Persist a message/response pair in the semantic cache collection."""
+        self._get_collection().add(
+            ids=[uuid.uuid4().hex],
+            embeddings=[self._embed(message)],
+            documents=[message],
+            metadatas=[{"response": response}],
+        )
+
+    async def get(self, message: str) -> Optional[str]:
+        """Return a cached response for the message, or None on a miss."""
+        key = self._key(message)
+        cached = self._entries.get(key)
+        if cached is not None:
+            self._entries.move_to_end(key)
+            logger.debug("Chat cache exact hit")
+            return cached
+
+        if not self.semantic:
+            return None
+
+        try:
+            cached = await asyncio.to_thread(self._semantic_lookup, message)
+        except Exception as exc:
+            logger.warning("Semantic chat cache lookup failed: %s", exc)
+            return None
+
+        if cached is not None:
+            logger.debug("Chat cache semantic hit")
+            self._remember(key, cached)
+        return cached
+
+    async def put(self, message: str, response: str) -> None:
+        """Cache a response for the message."""
+        if not response:
+            return
+
+        self._remember(self._key(message), response)
+
+        if not self.semantic:
+            return
+
+        try:
+            await asyncio.to_thread(self._semantic_store, message, response)
+        except Exception as exc:
+            logger.warning("Semantic chat cache store failed: %s", exc)
+
+    def clear(self) -> None:
+        """Drop every cached response, e.g. after the knowledge base changes."""
+        self._entries.clear()
+        self._collection = None
+
+        if not self.semantic:
+            return
+
+        try:
+            self._get_client().delete_collection(self.COLLECTION_NAME)
+        except Exception as exc:
+            logger.warning("Could not clear semantic chat cache: %s", exc)
@@ -1,11 +1,15 @@
 """Knowledge chat service - focused on chat operations and agent management."""
 
+import asyncio
 import logging
+from collections.abc import AsyncIterator
 from typing import Optional, Dict, Any, List
 
-from .config import config
+from .config import get_config
 from .agno_knowledge import AgnoKnowledgeManager
 from .knowledge_team import KnowledgePlanningTeam
+from .search_batcher import SearchBatcher
+from .search_cache import SemanticSearchCache
 
 logger = logging.getLogger(__name__)
 
@@ -13,11 +17,32 @@ logger = logging.getLogger(__name__)
 class KnowledgeChatService:
     """Service focused solely on chat operations and knowledge agent management."""
 
+    # Seconds without further index updates before the team is rebuilt
+    REFRESH_DELAY = 0.5
+
     def __init__(self, knowledge_manager: Optional[AgnoKnowledgeManager] = None) -> None:
         """Initialize the knowledge chat service."""
-        self.config = config
+        self.config = get_config()
         self.knowledge_manager = knowledge_manager or AgnoKnowledgeManager()
         self.planning_team: Optional[KnowledgePlanningTeam] = None
+        self.search_cache = (
+            SemanticSearchCache(self.config.search_cache_similarity_threshold)
+            if self.config.search_cache_enabled
+            else None
+        )
+        self.search_batcher = (
+            SearchBatcher(
+                self.knowledge_manager,
+                window_ms=self.config.search_batch_window_ms,
+                max_batch_size=self.config.search_batch_max_size,
+            )
+            if self.config.search_batch_enabled
+            else None
+        )
+        # Debounced team refresh, scheduled on the loop that initialized us
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._refresh_task: Optional[asyncio.Task] = None
+        self._refresh_due = 0.0
         self._initialized = False
 
     async def initialize(self) -> None:
@@ -38,6 +63,7 @@ class KnowledgeChatService:
             if not self.planning_team.is_ready():
                 raise RuntimeError("Failed to initialize knowledge planning team")
 
+            self._loop = asyncio.get_running_loop()
             self._initialized = True
             logger.info("Knowledge chat service initialized successfully")
 
@@ -46,14 +72,47 @@ class KnowledgeChatService:
             raise
 
     def on_knowledge_updated(self) -> None:
-        """Callback for when the knowledge base is updated."""
-        if self._initialized and self.planning_team:
-            try:
-                logger.info("Refreshing chat service due to knowledge update...")
-                self.planning_team.refresh_knowledge()
-                logger.info("Chat service refreshed successfully")
-            except Exception as e:
-                logger.error(f"Failed to refresh chat service: {e}")
+        """Callback for when the knowledge base is updated.
+
+        Cached searches are dropped at once. Rebuilding the team is debounced,
+        so a burst of back-to-back updates costs a single refresh. May be
+        called from a worker thread.
+        """
+        if self.search_cache is not None:
+            self.search_cache.clear()
+
+        if self._initialized and self.planning_team and self._loop is not None:
+            self._loop.call_soon_threadsafe(self._schedule_refresh)
+
+    def _schedule_refresh(self) -> None:
+        """Push back the pending team refresh, starting one if none is waiting."""
+        self._refresh_due = self._loop.time() + self.REFRESH_DELAY
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._debounced_refresh())
+
+    async def _debounced_refresh(self) -> None:
+        """Refresh the team once updates stop arriving for REFRESH_DELAY."""
+        while True:
+            while (delay := self._refresh_due - self._loop.time()) > 0:
+                await asyncio.sleep(delay)
+
+            due = self._refresh_due
+            await asyncio.to_thread(self._refresh_team)
+            # Run again if another update came in during the refresh
+            if self._refresh_due == due:
+                return
+
+    def _refresh_team(self) -> None:
+        """Reconnect the planning team to the updated knowledge base."""
+        if not self._initialized or not self.planning_team:
+            return
+
+        try:
+            logger.info("Refreshing chat service due to knowledge update...")
+            self.planning_team.refresh_knowledge()
+            logger.info("Chat service refreshed successfully")
+        except Exception as e:
+            logger.error(f"Failed to refresh chat service: {e}")
 
     async def chat(self, message: str, stream: bool = False) -> str:
         """Process a chat message and return the response."""
@@ -72,6 +131,19 @@ class KnowledgeChatService:
             logger.error(f"Error processing chat message: {e}")
             return f"Sorry, I encountered an error: {str(e)}"
 
+    async def chat_stream(self, message: str) -> AsyncIterator[str]:
+        """Process a chat message and stream the response text."""
+        if not self._initialized:
+            raise RuntimeError("Chat service not initialized")
+
+        if not self.planning_team:
+            yield "Error: Knowledge planning team is not available."
+            return
+
+        logger.info(f"Streaming chat message: {message}")
+        async for chunk in self.planning_team.chat_stream(message):
+            yield chunk
+
     def is_ready(self) -> bool:
         """Check if the service is ready to process requests."""
         return (
@@ -111,31 +183,52 @@ class KnowledgeChatService:
             logger.error("Knowledge instance not available for search")
             return []
 
-        try:
-            results = knowledge.search(
+        max_results = top_k or self.config.max_results
+
+        embedding = None
+        if self.search_cache is not None:
+            # Embedded once here; the vector search below reuses it
+            embedding = await asyncio.to_thread(self.knowledge_manager.embed_query, query)
+            cached = self.search_cache.get(embedding, max_results)
+            if cached is not None:
+                logger.debug("Search cache hit")
+                return cached
+
+        formatted: List[Dict[str, Any]]
+        if self.search_batcher is not None:
+            formatted = await self.search_batcher.search(query, max_results, embedding)
+        else:
+            # Chroma queries are synchronous; keep them off the event loop
+            results = await asyncio.to_thread(
+                knowledge.search,
                 query=query,
-                max_results=top_k or self.config.max_results,
+                max_results=max_results,
             )
 
-            formatted: List[Dict[str, Any]] = []
-            for doc in results:
-                formatted.append(
-                    {
-                        "text": doc.content,
-                        "score": doc.reranking_score,
-                        "metadata": doc.meta_data,
-                        "document_id": doc.id,
-                    }
-                )
+            # Build the response list in one sized pass rather than appending
+            formatted = [
+                {
+                    "text": doc.content,
+                    "score": doc.reranking_score,
+                    "metadata": doc.meta_data,
+                    "document_id": doc.id,
+                }
+                for doc in results
+            ]
 
-            return formatted
+        if self.search_cache is not None:
+            self.search_cache.put(embedding, max_results, formatted)
 
-        except Exception as e:
-            logger.error(f"Error searching documents: {e}")
-            return []
+        return formatted
 
     async def cleanup(self) -> None:
         """Clean up resources."""
         logger.info("Cleaning up knowledge chat service...")
+        if self._refresh_task is not None and not self._refresh_task.done():
+            self._refresh_task.cancel()
+        if self.planning_team:
+            self.planning_team.shutdown()
+        if self.search_batcher is not None:
+            await self.search_batcher.close()
         self.planning_team = None
         self._initialized = False
\ No newline at end of file
@@ -0,0 +1,48 @@
+"""Shared ChromaDB client, embedded or connected to a Chroma server."""
+
+import logging
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+import chromadb
+
+from .config import get_config
+
+logger = logging.getLogger(__name__)
+
+# One client per storage path or server address, shared by the whole process
+_clients: Dict[Tuple[str, ...], Any] = {}
+_clients_lock = threading.Lock()
+
+
+def get_chroma_client(path: Optional[str] = None) -> Any:
+    """Return the process-wide ChromaDB client.
+
+    When indexing.chroma_host is set the client talks to that Chroma server
+    over HTTP, so writes are handled out of process; otherwise the store is
+    opened in-process at the given path.
+
+    Args:
+        path: Storage directory for the embedded store. If None, uses config value.
+
+    Returns:
+        Shared chromadb client
+    """
+    config = get_config()
+    host = config.chroma_host
+
+    if host:
+        key = ("http", host, str(config.chroma_port))
+    else:
+        key = ("path", path or config.storage_path)
+
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None:
+            if host:
+                client = chromadb.HttpClient(host=host, port=config.chroma_port)
+                logger.info(f"Connected to Chroma server at {host}:{config.chroma_port}")
+            else:
+                client = chromadb.PersistentClient(path=key[1])
+            _clients[key] = client
+        return client
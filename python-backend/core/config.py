@@ -1,16 +1,28 @@
 """Configuration management for the knowledge management system."""
 
+import json
 import logging
 import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 import yaml
 from dotenv import load_dotenv
 
+# Prefer the libyaml C bindings when PyYAML was built with them
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+
+# Sentinels for Config.get's lookup cache
+_MISSING = object()
+_NOT_FOUND = object()
+
 class Config:
     """Configuration manager for the knowledge management system."""
 
+    __slots__ = ('config_path', 'config', '_get_cache')
+
     def __init__(self, config_path: str = "../config.yaml"):
         """Initialize configuration manager.
 
@@ -20,15 +32,21 @@ class Config:
         load_dotenv()
         # Resolve path relative to the python-backend directory
         self.config_path = Path(__file__).parent.parent / config_path
+        self._get_cache: Dict[str, Any] = {}
         self.config = self._load_config()
 
     def _load_config(self) -> Dict[str, Any]:
         """Load configuration from YAML file."""
+        self._get_cache.clear()
         if not self.config_path.exists():
             raise FileNotFoundError(f"Configuration file not found: {self.config_path}")
 
-        with open(self.config_path, 'r') as f:
-            config = yaml.safe_load(f)
+        config = self._load_cached_config()
+        if config is None:
+            # Binary mode lets libyaml detect the encoding and decode in C
+            with open(self.config_path, 'rb') as f:
+                config = yaml.load(f, Loader=_YAML_LOADER)
+            self._write_cached_config(config)
 
         # Expand user paths in target directories
         if 'indexing' in config and 'target_directories' in config['indexing']:
@@ -39,6 +57,42 @@ class Config:
 
         return config
 
+    @property
+    def _cache_path(self) -> Path:
+        """Path of the parsed-config JSON sidecar."""
+        return self.config_path.with_name(self.config_path.name + '.cache.json')
+
+    def _cache_key(self) -> List[int]:
+        """Return the (mtime, size) key identifying the current YAML contents."""
+        stat = self.config_path.stat()
+        return [stat.st_mtime_ns, stat.st_size]
+
+    def _load_cached_config(self) -> Optional[Dict[str, Any]]:
+        """Load the parsed config from the JSON sidecar if it is still fresh."""
+        try:
+            with open(self._cache_path, 'r') as f:
+                cached = json.load(f)
+            if cached.get('key') == self._cache_key():
+                return cached['data']
+        except (OSError, ValueError, KeyError, AttributeError):
+            pass
+        return None
+
+    def _write_cached_config(self, config: Dict[str, Any]) -> None:
+        """Atomically write the parsed config to the JSON sidecar."""
+        tmp_path = self._cache_path.with_name(self._cache_path.name + f'.{os.getpid()}.tmp')
+        try:
+            with open(tmp_path, 'w') as f:
+                json.dump({'key': self._cache_key(), 'data': config}, f)
+            os.replace(tmp_path, self._cache_path)
+        except (OSError, TypeError, ValueError) as e:
+            # The sidecar is only an optimization; fall back to YAML next time
+            logging.getLogger(__name__).debug("Could not write config cache: %s", e)
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+
     def get(self, key_path: str, default: Any = None) -> Any:
         """Get configuration value using dot notation.
 
@@ -49,15 +103,17 @@ class Config:
         Returns:
             Configuration value or default
         """
-        keys = key_path.split('.')
-        value = self.config
-
-        try:
-            for key in keys:
-                value = value[key]
-            return value
-        except (KeyError, TypeError):
-            return default
+        value = self._get_cache.get(key_path, _MISSING)
+        if value is _MISSING:
+            value = self.config
+            try:
+                for key in key_path.split('.'):
+                    value = value[key]
+            except (KeyError, TypeError):
+                value = _NOT_FOUND
+            self._get_cache[key_path] = value
+
+        return default if value is _NOT_FOUND else value
 
     def get_openai_api_key(self) -> str:
         """Get OpenAI API key from environment variables."""
@@ -89,6 +145,16 @@ class Config:
             storage_path = str(Path(__file__).parent.parent / storage_path)
         return storage_path
 
+    @property
+    def chroma_host(self) -> Optional[str]:
+        """Get the Chroma server host, or None to use the embedded store."""
+        return self.get('indexing.chroma_host', None)
+
+    @property
+    def chroma_port(self) -> int:
+        """Get the Chroma server port."""
+        return self.get('indexing.chroma_port', 8001)
+
     @property
     def collection_name(self) -> str:
         """Get ChromaDB collection name."""
@@ -150,6 +216,14 @@ class Config:
         """Get OpenAI embedding model name."""
         return self.get('openai.embedding_model', 'text-embedding-ada-002')
 
+    @property
+    def embedding_dimensions(self) -> Optional[int]:
+        """Get the requested embedding size, or None for the model's native size.
+
+        Only text-embedding-3 models accept a reduced size.
+        """
+        return self.get('openai.embedding_dimensions', None)
+
     @property
     def temperature(self) -> float:
         """Get OpenAI temperature setting."""
@@ -160,11 +234,91 @@ class Config:
         """Get OpenAI max tokens setting."""
         return self.get('openai.max_tokens', 1000)
 
+    @property
+    def stats_cache_ttl(self) -> float:
+        """Get how long index stats and operation listings are cached, in seconds."""
+        return self.get('system.stats_cache_ttl_seconds', 2.0)
+
+    @property
+    def max_concurrent_agents(self) -> int:
+        """Get maximum number of concurrent team runs."""
+        return self.get('team.max_concurrent_runs', 4)
+
     @property
     def max_results(self) -> int:
         """Get maximum number of search results."""
         return self.get('system.max_results', 10)
 
+    @property
+    def chat_cache_enabled(self) -> bool:
+        """Check if the chat response cache is enabled."""
+        return self.get('chat_cache.enabled', True)
+
+    @property
+    def chat_cache_max_entries(self) -> int:
+        """Get maximum number of in-memory chat cache entries."""
+        return self.get('chat_cache.max_entries', 1024)
+
+    @property
+    def chat_cache_semantic(self) -> bool:
+        """Check if semantic (embedding similarity) cache lookups are enabled."""
+        return self.get('chat_cache.semantic', False)
+
+    @property
+    def chat_cache_similarity_threshold(self) -> float:
+        """Get maximum cosine distance for a semantic cache hit."""
+        return self.get('chat_cache.similarity_threshold', 0.05)
+
+    @property
+    def search_cache_enabled(self) -> bool:
+        """Check if the semantic document search cache is enabled."""
+        return self.get('system.enable_semantic_cache', False)
+
+    @property
+    def search_cache_similarity_threshold(self) -> float:
+        """Get minimum cosine similarity for a search cache hit."""
+        return self.get('system.semantic_cache_threshold', 0.95)
+
+    @property
+    def search_batch_enabled(self) -> bool:
+        """Check if concurrent document searches are coalesced into batches."""
+        return self.get('system.search_batching.enabled', True)
+
+    @property
+    def search_batch_window_ms(self) -> float:
+        """Get how long a search batch waits for more queries, in milliseconds."""
+        return self.get('system.search_batching.window_ms', 5)
+
+    @property
+    def search_batch_max_size(self) -> int:
+        """Get maximum number of queries per search batch."""
+        return self.get('system.search_batching.max_batch_size', 16)
+
+    @property
+    def hnsw_m(self) -> int:
+        """Get HNSW max neighbors per node for new collections."""
+        return self.get('indexing.hnsw.M', 16)
+
+    @property
+    def hnsw_construction_ef(self) -> int:
+        """Get HNSW ef_construction for new collections."""
+        return self.get('indexing.hnsw.construction_ef', 100)
+
+    @property
+    def hnsw_search_ef(self) -> int:
+        """Get HNSW ef_search used at query time."""
+        return self.get('indexing.hnsw.search_ef', 64)
+
+    @property
+    def index_batch_size(self) -> int:
+        """Get number of files loaded and inserted per add-documents batch."""
+        return self.get('indexing.batch_size', 500)
+
+    @property
+    def max_concurrent_operations(self) -> int:
+        """Get maximum number of index operations running at once."""
+        return self.get('system.max_concurrent_ops', 2)
+
     @property
     def pdf_enabled(self) -> bool:
         """Check if PDF processing is enabled."""
@@ -190,10 +344,26 @@ class Config:
         """Get PDF processing timeout in seconds."""
         return self.get('indexing.pdf.timeout_seconds', 60)
 
+    @property
+    def pdf_max_workers(self) -> int:
+        """Get the number of processes used to parse PDFs (1 parses in-process)."""
+        return self.get('indexing.pdf.max_workers', 4)
+
     def save_config(self) -> None:
         """Save current configuration to file."""
+        self._get_cache.clear()
         with open(self.config_path, 'w') as f:
-            yaml.safe_dump(self.config, f, default_flow_style=False)
+            yaml.dump(self.config, f, Dumper=_YAML_DUMPER, default_flow_style=False)
+
+
+@lru_cache(maxsize=1)
+def get_config() -> Config:
+    """Return the shared configuration instance, loading it on first use."""
+    return Config()
+
 
-# Global configuration instance
-config = Config()
+def __getattr__(name: str) -> Any:
+    """Resolve the legacy ``config`` global lazily via get_config()."""
+    if name == "config":
+        return get_config()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,12 +2,15 @@
 
 import asyncio
 import logging
-from pathlib import Path
+import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional, Dict, Any, Callable
 
-from .indexer import DocumentIndexer
+from .file_manifest import FileManifest
+from .indexer import get_indexer
 from .operation_manager import OperationManager
-from .config import config
+from .config import get_config
+from .ttl_cache import AsyncTTLCache
 
 logger = logging.getLogger(__name__)
 
@@ -21,25 +24,47 @@ class DocumentIndexingService:
         Args:
             operation_manager: Optional OperationManager instance for LRO tracking
         """
-        self.config = config
-        self.indexer = DocumentIndexer()
+        self.config = get_config()
+        self.indexer = get_indexer()
         self.operation_manager = operation_manager or OperationManager()
+        self.manifest = FileManifest()
         self._index_update_callbacks: List[Callable[[], None]] = []
         self._initialized = False
         self._running_operations: Dict[str, asyncio.Task] = {}
+        # Caps how many refresh/add operations run at once; the rest queue up
+        self._operation_slots = asyncio.Semaphore(self.config.max_concurrent_operations)
+        # Single writer: refresh and add operations must not touch Chroma concurrently
+        self._write_lock = asyncio.Lock()
+        # Whether the manifest was checked against the index since startup
+        self._manifest_checked = False
+        # Index stats are polled by the UI; cache them briefly
+        self._stats_cache = AsyncTTLCache(ttl=self.config.stats_cache_ttl)
 
     def on_index_updated(self, callback: Callable[[], None]) -> None:
-        """Register a callback to be called when the index is updated."""
-        self._index_update_callbacks.append(callback)
+        """Register a callback to be called when the index is updated.
 
-    def _notify_index_updated(self) -> None:
-        """Notify all registered callbacks that the index has been updated."""
-        for callback in self._index_update_callbacks:
+        The callback is wrapped here so a failure is logged without the
+        notify path needing its own error handling.
+        """
+        def safe_callback() -> None:
             try:
                 callback()
             except Exception as e:
                 logger.error(f"Error in index update callback: {e}")
 
+        self._index_update_callbacks.append(safe_callback)
+
+    async def _notify_index_updated(self) -> None:
+        """Notify all registered callbacks that the index has been updated.
+
+        Callbacks may rebuild heavy objects (e.g. the agent team), so each runs
+        in a worker thread and a slow one doesn't hold up the others.
+        """
+        self._stats_cache.invalidate()
+        await asyncio.gather(
+            *(asyncio.to_thread(callback) for callback in self._index_update_callbacks)
+        )
+
     async def initialize(self) -> None:
         """Initialize the document indexing service."""
         if self._initialized:
@@ -72,6 +97,13 @@ class DocumentIndexingService:
 
         return self.indexer.get_index_stats()
 
+    async def get_cached_index_stats(self) -> Dict[str, Any]:
+        """Get index statistics, served from a short-lived cache."""
+        return await self._stats_cache.get_or_load(
+            "stats",
+            lambda: asyncio.to_thread(self.get_index_stats),
+        )
+
     async def refresh_index(self) -> Dict[str, Any]:
         """Start an asynchronous index refresh operation.
 
@@ -103,20 +135,25 @@ class DocumentIndexingService:
             operation_id: Operation ID to track
         """
         try:
-            await self.operation_manager.start_operation(operation_id)
-
-            logger.info(f"Starting index refresh for operation {operation_id}...")
-            # Run the blocking refresh in a thread pool
-            await asyncio.to_thread(self.indexer.refresh_index)
-
-            # Notify that index has been updated
-            self._notify_index_updated()
-
-            # Get stats and complete operation
-            stats = self.indexer.get_index_stats()
-            await self.operation_manager.complete_operation(operation_id, stats)
-
-            logger.info(f"Index refresh completed for operation {operation_id}")
+            # Wait for a free slot; the operation stays pending until then
+            async with self._operation_slots:
+                await self.operation_manager.start_operation(operation_id)
+
+                logger.info(f"Starting index refresh for operation {operation_id}...")
+                async with self._write_lock:
+                    indexed_files = await self.indexer.arefresh_index()
+                    await self.manifest.record(indexed_files, replace=True)
+                    self._manifest_checked = True
+
+                # Notify that index has been updated while collecting stats;
+                # neither depends on the other
+                _, stats = await asyncio.gather(
+                    self._notify_index_updated(),
+                    asyncio.to_thread(self.indexer.get_index_stats),
+                )
+                await self.operation_manager.complete_operation(operation_id, stats)
+
+                logger.info(f"Index refresh completed for operation {operation_id}")
 
         except Exception as exc:
             error_msg = str(exc)
@@ -139,10 +176,11 @@ class DocumentIndexingService:
         if not self._initialized:
             raise RuntimeError("Service not initialized")
 
-        # Validate file paths
+        # Validate file paths; stat them concurrently off the event loop
+        exists = await asyncio.to_thread(self._paths_exist, file_paths)
         valid_paths = []
-        for path in file_paths:
-            if Path(path).exists():
+        for path, found in zip(file_paths, exists):
+            if found:
                 valid_paths.append(path)
             else:
                 logger.warning(f"File not found: {path}")
@@ -179,20 +217,22 @@ class DocumentIndexingService:
             file_paths: List of file paths to add
         """
         try:
-            await self.operation_manager.start_operation(operation_id)
-
-            logger.info(f"Adding {len(file_paths)} documents for operation {operation_id}...")
-            # Run the blocking add_documents in a thread pool
-            await asyncio.to_thread(self.indexer.add_documents, file_paths)
+            # Wait for a free slot; the operation stays pending until then
+            async with self._operation_slots:
+                await self.operation_manager.start_operation(operation_id)
 
-            # Notify that index has been updated
-            self._notify_index_updated()
+                logger.info(f"Adding {len(file_paths)} documents for operation {operation_id}...")
+                await self._add_in_batches(operation_id, file_paths)
 
-            # Get stats and complete operation
-            stats = self.indexer.get_index_stats()
-            await self.operation_manager.complete_operation(operation_id, stats)
+                # Notify that index has been updated while collecting stats;
+                # neither depends on the other
+                _, stats = await asyncio.gather(
+                    self._notify_index_updated(),
+                    asyncio.to_thread(self.indexer.get_index_stats),
+                )
+                await self.operation_manager.complete_operation(operation_id, stats)
 
-            logger.info(f"Documents added for operation {operation_id}")
+                logger.info(f"Documents added for operation {operation_id}")
 
         except Exception as exc:
             error_msg = str(exc)
@@ -203,6 +243,118 @@ class DocumentIndexingService:
             # Clean up task reference
             self._running_operations.pop(operation_id, None)
 
+    async def _add_in_batches(self, operation_id: str, file_paths: List[str]) -> None:
+        """Load and insert files in fixed-size batches, reporting progress per batch.
+
+        Files already indexed at their current mtime and size are skipped, so
+        re-adding an unchanged file is neither re-parsed nor re-embedded; a
+        changed file's old chunks are replaced by the new ones.
+        The batches form a pipeline: while one batch is written to the index,
+        the next is embedded and the one after that is loaded, so at most
+        three batches are held in memory. Only the writes take the write
+        lock, so concurrent operations can embed at the same time.
+
+        Args:
+            operation_id: Operation ID to report progress on
+            file_paths: List of file paths to add
+        """
+        await self._backfill_manifest()
+        changed = await self.manifest.filter_unindexed(file_paths)
+        processed = len(file_paths) - len(changed)
+        if processed:
+            logger.info(f"Skipping {processed} unchanged files already in the index")
+        if not changed:
+            await self.operation_manager.update_progress(operation_id, processed_items=processed)
+            return
+
+        batch_size = self.config.index_batch_size
+        batches = [changed[i:i + batch_size] for i in range(0, len(changed), batch_size)]
+
+        next_load = asyncio.create_task(
+            self.indexer.run_blocking(self.indexer.load_documents, batches[0])
+        )
+        write: Optional[asyncio.Task] = None
+        try:
+            for index, batch in enumerate(batches):
+                documents = await next_load
+                if index + 1 < len(batches):
+                    next_load = asyncio.create_task(
+                        self.indexer.run_blocking(self.indexer.load_documents, batches[index + 1])
+                    )
+
+                nodes = await self.indexer.aembed_documents(documents)
+
+                # Writes stay in batch order: wait for the previous one first
+                if write is not None:
+                    processed = await write
+                write = asyncio.create_task(
+                    self._write_batch(
+                        operation_id,
+                        batch,
+                        self.indexer.document_file_paths(documents),
+                        nodes,
+                        processed,
+                    )
+                )
+
+            await write
+        finally:
+            if not next_load.done():
+                next_load.cancel()
+            # Let an in-flight Chroma write finish so the manifest matches it
+            if write is not None and not write.done():
+                await asyncio.wait([write])
+
+    async def _write_batch(
+        self,
+        operation_id: str,
+        batch: List[str],
+        loaded: List[str],
+        nodes: List[Any],
+        processed: int,
+    ) -> int:
+        """Write one embedded batch, record it in the manifest and report progress.
+
+        Args:
+            operation_id: Operation ID to report progress on
+            batch: File paths in the batch
+            loaded: Paths in the batch that produced documents
+            nodes: Embedded nodes for the batch
+            processed: Files processed before this batch
+
+        Returns:
+            Files processed including this batch
+        """
+        async with self._write_lock:
+            # Changed files are re-indexed in full, so drop their old chunks
+            await self.indexer.aadd_nodes(nodes, replace_files=loaded)
+        # Files that failed to load or were skipped stay unrecorded, so the
+        # next scan offers them again
+        await self.manifest.record(loaded)
+
+        processed += len(batch)
+        await self.operation_manager.update_progress(
+            operation_id,
+            processed_items=processed,
+            current_item=batch[-1],
+        )
+        return processed
+
+    # Concurrent stat calls when validating paths
+    PATH_CHECK_WORKERS = 32
+
+    @classmethod
+    def _paths_exist(cls, file_paths: List[str]) -> List[bool]:
+        """Return whether each path exists, checking them on a thread pool.
+
+        One pool for the whole batch keeps a large request from queueing a
+        task per path on the event loop and the default executor.
+        """
+        if not file_paths:
+            return []
+        with ThreadPoolExecutor(max_workers=min(cls.PATH_CHECK_WORKERS, len(file_paths))) as executor:
+            return list(executor.map(os.path.exists, file_paths))
+
     def get_supported_extensions(self) -> List[str]:
         """Get list of supported file extensions."""
         return self.config.file_extensions
@@ -211,19 +363,50 @@ class DocumentIndexingService:
         """Get list of target directories for indexing."""
         return self.config.target_directories
 
+    async def list_documents(self) -> List[str]:
+        """List every supported file in the target directories, indexed or not."""
+        return await self.indexer.run_blocking(self.indexer._get_documents_from_directories)
+
+    async def _backfill_manifest(self) -> None:
+        """Seed an empty manifest from the files already in the index.
+
+        Indexes built before the manifest existed, or by the initial build,
+        would otherwise have every file reported as new and indexed twice.
+        Files are recorded at their current mtime and size, so edits made
+        before the backfill are not picked up until the next refresh.
+        """
+        if self._manifest_checked:
+            return
+
+        async with self._write_lock:
+            if self._manifest_checked:
+                return
+            if await self.manifest.is_empty():
+                indexed_files = await self.indexer.run_blocking(
+                    lambda: list(self.indexer.get_indexed_source_files())
+                )
+                if indexed_files:
+                    await self.manifest.record(indexed_files)
+                    logger.info(f"Backfilled index manifest with {len(indexed_files)} indexed files")
+            self._manifest_checked = True
+
     async def scan_for_new_documents(self) -> List[str]:
         """Scan target directories for documents that aren't indexed yet."""
         if not self._initialized:
             raise RuntimeError("Service not initialized")
 
         try:
-            # Get all documents from target directories
-            all_docs = self.indexer._get_documents_from_directories()
+            await self._backfill_manifest()
 
-            # For now, return all found documents
-            # In a more advanced version, we could track which are already indexed
-            logger.info(f"Found {len(all_docs)} documents in target directories")
-            return all_docs
+            all_docs = await self.list_documents()
+
+            # Skip files whose mtime/size match what was last indexed
+            new_docs = await self.manifest.filter_unindexed(all_docs)
+            logger.info(
+                f"Found {len(new_docs)} new or changed documents "
+                f"({len(all_docs)} in target directories)"
+            )
+            return new_docs
 
         except Exception as exc:
             logger.error("Failed to scan for documents: %s", exc)
@@ -245,5 +428,8 @@ class DocumentIndexingService:
         # Clean up old operations from database
         await self.operation_manager.cleanup_old_operations()
 
+        # Stop PDF worker processes
+        await asyncio.to_thread(self.indexer.close)
+
         self._index_update_callbacks.clear()
         self._initialized = False
\ No newline at end of file
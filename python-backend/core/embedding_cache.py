@@ -0,0 +1,200 @@
+"""Persistent embedding cache so unchanged chunks are never re-embedded."""
+
+import asyncio
+import hashlib
+import logging
+import random
+import sqlite3
+from pathlib import Path
+from typing import ClassVar, Dict, List, Optional
+
+import numpy as np
+import openai
+from llama_index.embeddings.openai import OpenAIEmbedding
+from llama_index.embeddings.openai.base import aget_embeddings
+from pydantic import PrivateAttr
+
+from .rate_limiter import AdaptiveConcurrencyLimiter
+
+logger = logging.getLogger(__name__)
+
+
+class EmbeddingCache:
+    """SQLite table of embeddings keyed by (sha256 of text, model)."""
+
+    # Keep IN (...) lists well under SQLite's bound-parameter limit
+    LOOKUP_CHUNK_SIZE = 500
+
+    def __init__(self, db_path: str):
+        """Initialize the embedding cache.
+
+        Args:
+            db_path: Path to SQLite database file
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._initialize_db()
+
+    def _initialize_db(self) -> None:
+        """Initialize the SQLite database schema."""
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS embedding_cache (
+                    hash TEXT NOT NULL,
+                    model TEXT NOT NULL,
+                    vec BLOB NOT NULL,
+                    PRIMARY KEY (hash, model)
+                )
+            """)
+            conn.commit()
+
+    @staticmethod
+    def hash_text(text: str) -> str:
+        """Return the cache key for a text."""
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    def get_many(self, hashes: List[str], model: str) -> Dict[str, List[float]]:
+        """Return cached embeddings for the given hashes, keyed by hash."""
+        found: Dict[str, List[float]] = {}
+        unique = list(dict.fromkeys(hashes))
+
+        with sqlite3.connect(self.db_path) as conn:
+            for i in range(0, len(unique), self.LOOKUP_CHUNK_SIZE):
+                chunk = unique[i:i + self.LOOKUP_CHUNK_SIZE]
+                placeholders = ",".join("?" * len(chunk))
+                rows = conn.execute(
+                    f"SELECT hash, vec FROM embedding_cache WHERE model = ? AND hash IN ({placeholders})",
+                    (model, *chunk),
+                )
+                for text_hash, vec in rows:
+                    found[text_hash] = np.frombuffer(vec, dtype=np.float32).tolist()
+
+        return found
+
+    def put_many(self, entries: Dict[str, List[float]], model: str) -> None:
+        """Store embeddings keyed by text hash."""
+        if not entries:
+            return
+
+        with sqlite3.connect(self.db_path) as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO embedding_cache (hash, model, vec) VALUES (?, ?, ?)",
+                [
+                    (text_hash, model, np.asarray(vector, dtype=np.float32).tobytes())
+                    for text_hash, vector in entries.items()
+                ],
+            )
+            conn.commit()
+
+
+class CachedOpenAIEmbedding(OpenAIEmbedding):
+    """OpenAIEmbedding that only calls the API for texts it hasn't embedded before.
+
+    Async requests share an adaptive concurrency limit: a 429 halves the
+    number of requests in flight and each success adds one back.
+    """
+
+    # Longest wait between retries when the API gives no Retry-After
+    MAX_BACKOFF_SECONDS: ClassVar[float] = 60.0
+
+    _cache: Optional[EmbeddingCache] = PrivateAttr(default=None)
+    _limiter: Optional[AdaptiveConcurrencyLimiter] = PrivateAttr(default=None)
+
+    def __init__(self, cache: EmbeddingCache, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self._cache = cache
+        self._limiter = AdaptiveConcurrencyLimiter(self.num_workers or 1)
+
+    @property
+    def _cache_model(self) -> str:
+        """Cache key for the model, distinguishing reduced embedding sizes."""
+        if self.dimensions:
+            return f"{self.model_name}@{self.dimensions}"
+        return self.model_name
+
+    def _split_cached(self, texts: List[str]):
+        """Return (hashes, cached embeddings, texts that still need embedding)."""
+        hashes = [EmbeddingCache.hash_text(text) for text in texts]
+        cached = self._cache.get_many(hashes, self._cache_model)
+        missing: Dict[str, str] = {}
+        for text_hash, text in zip(hashes, texts):
+            if text_hash not in cached:
+                missing.setdefault(text_hash, text)
+        return hashes, cached, missing
+
+    def _merge(
+        self,
+        hashes: List[str],
+        cached: Dict[str, List[float]],
+        missing: Dict[str, str],
+        fresh: List[List[float]],
+    ) -> List[List[float]]:
+        """Store fresh embeddings and return all embeddings in input order."""
+        new_entries = dict(zip(missing, fresh))
+        self._cache.put_many(new_entries, self._cache_model)
+        cached.update(new_entries)
+
+        if missing:
+            logger.debug(
+                f"Embedding cache: {len(hashes) - len(missing)} hits, {len(missing)} misses"
+            )
+        return [cached[text_hash] for text_hash in hashes]
+
+    def _get_text_embeddings(self, texts: List[str]) -> List[List[float]]:
+        hashes, cached, missing = self._split_cached(texts)
+        fresh = super()._get_text_embeddings(list(missing.values())) if missing else []
+        return self._merge(hashes, cached, missing, fresh)
+
+    async def _aget_text_embeddings(self, texts: List[str]) -> List[List[float]]:
+        # Cache lookups and writes are blocking SQLite calls; keep them off the loop
+        hashes, cached, missing = await asyncio.to_thread(self._split_cached, texts)
+        fresh = await self._aembed_with_backoff(list(missing.values())) if missing else []
+        return await asyncio.to_thread(self._merge, hashes, cached, missing, fresh)
+
+    @staticmethod
+    def _retry_after(error: openai.APIStatusError) -> Optional[float]:
+        """Return the server's requested wait in seconds, if it sent one."""
+        headers = error.response.headers
+        try:
+            if "retry-after-ms" in headers:
+                return float(headers["retry-after-ms"]) / 1000
+            if "retry-after" in headers:
+                return float(headers["retry-after"])
+        except ValueError:
+            pass
+        return None
+
+    async def _aembed_with_backoff(self, texts: List[str]) -> List[List[float]]:
+        """Embed texts, retrying rate limits and transient errors with backoff.
+
+        The client's own retries are disabled so 429s reach the limiter
+        instead of being retried blindly at full concurrency.
+        """
+        aclient = self._get_aclient().with_options(max_retries=0)
+
+        attempt = 0
+        while True:
+            async with self._limiter:
+                try:
+                    embeddings = await aget_embeddings(
+                        aclient, texts, engine=self._text_engine, **self.additional_kwargs
+                    )
+                except openai.RateLimitError as e:
+                    self._limiter.on_rate_limited()
+                    if attempt == self.max_retries:
+                        raise
+                    delay = self._retry_after(e)
+                except (openai.APIConnectionError, openai.InternalServerError):
+                    if attempt == self.max_retries:
+                        raise
+                    delay = None
+                else:
+                    self._limiter.on_success()
+                    return embeddings
+
+            if delay is None:
+                # Exponential backoff with jitter
+                delay = random.uniform(0, min(self.MAX_BACKOFF_SECONDS, 2 ** attempt))
+            # Wait outside the limiter so the slot is free for other requests
+            await asyncio.sleep(delay)
+            attempt += 1
@@ -0,0 +1,114 @@
+"""Persistent manifest of indexed files for incremental document scans."""
+
+import asyncio
+import logging
+import os
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from .config import get_config
+
+logger = logging.getLogger(__name__)
+
+
+class FileManifest:
+    """Tracks (path, mtime, size) of indexed files in SQLite.
+
+    A file counts as indexed while its current mtime and size match the
+    recorded ones, so scans only report files that are new or have changed.
+    """
+
+    def __init__(self, db_path: Optional[str] = None):
+        """Initialize the file manifest.
+
+        Args:
+            db_path: Path to SQLite database file. If None, uses config value.
+        """
+        if db_path is None:
+            db_path = get_config().get('indexing.manifest_file', 'tmp/index_manifest.db')
+
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._initialize_db()
+
+    def _initialize_db(self) -> None:
+        """Initialize the SQLite database schema."""
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS indexed_files (
+                    path TEXT PRIMARY KEY,
+                    mtime_ns INTEGER NOT NULL,
+                    size INTEGER NOT NULL,
+                    indexed_at REAL NOT NULL
+                )
+            """)
+            conn.commit()
+        logger.info(f"Index manifest initialized at {self.db_path}")
+
+    @staticmethod
+    def _stat(paths: List[str]) -> Dict[str, Tuple[int, int]]:
+        """Return {path: (mtime_ns, size)} for the paths that still exist."""
+        stats = {}
+        for path in paths:
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            stats[path] = (st.st_mtime_ns, st.st_size)
+        return stats
+
+    async def record(self, paths: List[str], replace: bool = False) -> None:
+        """Record files as indexed at their current mtime and size.
+
+        Args:
+            paths: Files that were just indexed
+            replace: Drop every existing entry first, e.g. after a full rebuild
+        """
+        now = datetime.now().timestamp()
+
+        def _upsert():
+            stats = self._stat(paths)
+            with sqlite3.connect(self.db_path) as conn:
+                if replace:
+                    conn.execute("DELETE FROM indexed_files")
+                conn.executemany("""
+                    INSERT OR REPLACE INTO indexed_files (path, mtime_ns, size, indexed_at)
+                    VALUES (?, ?, ?, ?)
+                """, [(path, mtime_ns, size, now) for path, (mtime_ns, size) in stats.items()])
+                conn.commit()
+            return len(stats)
+
+        recorded = await asyncio.to_thread(_upsert)
+        logger.debug(f"Recorded {recorded} files in index manifest")
+
+    async def is_empty(self) -> bool:
+        """Return whether no file has been recorded yet."""
+        def _query():
+            with sqlite3.connect(self.db_path) as conn:
+                return conn.execute("SELECT 1 FROM indexed_files LIMIT 1").fetchone() is None
+
+        return await asyncio.to_thread(_query)
+
+    async def filter_unindexed(self, paths: List[str]) -> List[str]:
+        """Return the paths that are new or changed since they were indexed.
+
+        Args:
+            paths: Candidate file paths
+
+        Returns:
+            Paths missing from the manifest or whose mtime/size changed
+        """
+        def _filter():
+            with sqlite3.connect(self.db_path) as conn:
+                indexed = {
+                    path: (mtime_ns, size)
+                    for path, mtime_ns, size in conn.execute(
+                        "SELECT path, mtime_ns, size FROM indexed_files"
+                    )
+                }
+            stats = self._stat(paths)
+            return [path for path, stat in stats.items() if indexed.get(path) != stat]
+
+        return await asyncio.to_thread(_filter)
@@ -1,20 +1,36 @@
 """Document indexing system using LlamaIndex and ChromaDB."""
 
+import asyncio
 import os
 import logging
+import sqlite3
+import threading
 from pathlib import Path
-from typing import List, Optional, Dict, Any, Tuple
+from typing import List, Optional, Dict, Any, Callable, Iterable, Iterator, Set, Tuple
+from collections import Counter
+from contextlib import closing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache, partial
+import multiprocessing
 import time
 
 from llama_index.core import VectorStoreIndex, SimpleDirectoryReader, Settings
 from llama_index.core.node_parser import SentenceSplitter
+from llama_index.core.schema import MetadataMode
+from llama_index.core.vector_stores.utils import node_to_metadata_dict
 from llama_index.vector_stores.chroma import ChromaVectorStore
 from llama_index.core import StorageContext
-from llama_index.embeddings.openai import OpenAIEmbedding
-from llama_index.readers.file import PyMuPDFReader
-import chromadb
+import numpy as np
+try:
+    from chromadb.errors import NotFoundError
+except ImportError:  # ChromaDB < 0.5 raises ValueError for missing collections
+    NotFoundError = ValueError
 
-from .config import config
+from .chroma_client import get_chroma_client
+from .config import get_config
+from .embedding_cache import CachedOpenAIEmbedding, EmbeddingCache
+from .pdf_loader import PdfOptions, PdfResult, init_worker as init_pdf_worker, load_pdf, validate_pdf
 
 logger = logging.getLogger(__name__)
 
@@ -33,12 +49,30 @@ class DocumentIndexer:
         'invalid': 'Not a valid PDF',
     }
 
+    # LlamaIndex Settings are process-global; configure them only once
+    _settings_configured = False
+    _settings_lock = threading.Lock()
+
     def __init__(self):
-        """Initialize the document indexer."""
-        self.config = config
+        """Initialize the document indexer.
 
-        # Initialize PDF reader placeholder
-        self._pdf_reader: Optional[PyMuPDFReader] = None
+        Prefer get_indexer(), which shares one instance across services.
+        """
+        self.config = get_config()
+
+        # Lower-cased extensions, matched against each file name while scanning
+        self._ext_set: Set[str] = {ext.lower() for ext in self.config.file_extensions}
+        # (target directories, directory mtimes, file list) from the last walk
+        self._scan_cache: Optional[Tuple[List[str], Dict[str, int], List[str]]] = None
+        # (monotonic timestamp, count) of the last collection count
+        self._count_cache: Optional[Tuple[float, int]] = None
+        # (collection count, file paths) from the last source file scan
+        self._source_files_cache: Optional[Tuple[int, Set[str]]] = None
+        # PDF worker processes and indexing threads, started on first use and
+        # kept until close()
+        self._pdf_pool: Optional[ProcessPoolExecutor] = None
+        self._index_executor: Optional[ThreadPoolExecutor] = None
+        self._pool_lock = threading.Lock()
 
         # Tracking for PDF processing statistics
         self._pdf_stats: Dict[str, Any] = {
@@ -49,17 +83,50 @@ class DocumentIndexer:
             'failed_files': [],  # List of (filename, error_category, error_message)
             'total_processing_time': 0.0,
         }
+        # (stats dict, counters, rendered stats) from the last get_index_stats
+        self._pdf_stats_render: Optional[Tuple[Dict[str, Any], Tuple[int, int, int], Dict[str, Any]]] = None
 
-        self._setup_settings()
         self._initialize_chroma()
         self.index: Optional[VectorStoreIndex] = None
 
+    # Texts per OpenAI embeddings request (LlamaIndex defaults to 10)
+    EMBED_BATCH_SIZE = 256
+    # Embeddings requests in flight at once on the async indexing path
+    EMBED_CONCURRENCY = 8
+    # Threads parsing non-PDF files in load_documents
+    LOAD_WORKERS = 8
+    # Most non-PDF files handed to one reader while streaming a directory walk
+    LOAD_SLICE_SIZE = 32
+    # Fewest PDFs worth starting worker processes for
+    PDF_PROCESS_MIN_FILES = 16
+    # Threads for blocking indexing calls made from async code
+    INDEX_WORKERS = 2
+
     def _setup_settings(self) -> None:
-        """Configure LlamaIndex global settings."""
-        # Set up OpenAI embedding
-        Settings.embed_model = OpenAIEmbedding(
+        """Configure LlamaIndex global settings on first use.
+
+        Building the embedding model resolves the API key and opens the
+        embedding cache, so it waits until something chunks, embeds or opens
+        the index; stats and directory scans never pay for it.
+        """
+        with DocumentIndexer._settings_lock:
+            if not DocumentIndexer._settings_configured:
+                self._configure_settings()
+                DocumentIndexer._settings_configured = True
+
+    def _configure_settings(self) -> None:
+        """Set the embedding model and text splitter on LlamaIndex Settings."""
+        # Set up OpenAI embedding, reusing stored vectors for unchanged chunks
+        embedding_cache = EmbeddingCache(
+            str(Path(self.config.storage_path) / "embedding_cache.db")
+        )
+        Settings.embed_model = CachedOpenAIEmbedding(
+            cache=embedding_cache,
             model=self.config.embedding_model,
-            api_key=self.config.get_openai_api_key()
+            dimensions=self.config.embedding_dimensions,
+            api_key=self.config.get_openai_api_key(),
+            embed_batch_size=self.EMBED_BATCH_SIZE,
+            num_workers=self.EMBED_CONCURRENCY
         )
 
         # Set up text splitter
@@ -68,11 +135,6 @@ class DocumentIndexer:
             chunk_overlap=self.config.chunk_overlap
         )
 
-        # Initialize PDF reader if enabled
-        if self.config.pdf_enabled:
-            self._pdf_reader = PyMuPDFReader()
-            logger.info("PyMuPDFReader initialized for PDF processing")
-
     def _validate_pdf(self, file_path: str) -> Tuple[bool, Optional[str], Optional[str]]:
         """Validate PDF file before processing.
 
@@ -82,51 +144,9 @@ class DocumentIndexer:
         Returns:
             Tuple of (is_valid, error_category, error_message)
         """
-        path = Path(file_path)
-
-        # Check file exists and is readable
-        if not path.exists():
-            return False, 'invalid', 'File does not exist'
-
-        if not path.is_file():
-            return False, 'invalid', 'Not a file'
-
-        try:
-            # Check file permissions
-            if not os.access(path, os.R_OK):
-                return False, 'permission', 'File is not readable'
-
-            # Check file size
-            file_size_mb = path.stat().st_size / (1024 * 1024)
-            max_size = self.config.pdf_max_file_size_mb
-            if file_size_mb > max_size:
-                return False, 'oversized', f'File size {file_size_mb:.1f}MB exceeds limit {max_size}MB'
-
-            # Check if it's a PDF (magic bytes check)
-            with open(path, 'rb') as f:
-                header = f.read(4)
-                if header != b'%PDF':
-                    return False, 'invalid', 'Not a valid PDF file (invalid header)'
-
-            # Check if PDF is encrypted (basic check)
-            if self.config.pdf_skip_encrypted:
-                try:
-                    import fitz
-                    pdf_doc = fitz.open(path)
-                    if pdf_doc.is_pdf and pdf_doc.needs_pass:
-                        pdf_doc.close()
-                        return False, 'encrypted', 'PDF is password-protected'
-                    pdf_doc.close()
-                except Exception as e:
-                    logger.warning(f"Could not check if PDF is encrypted: {e}")
-                    # Continue anyway, let the parser handle it
-
-            return True, None, None
-
-        except OSError as e:
-            return False, 'permission', f'Cannot access file: {str(e)}'
-        except Exception as e:
-            return False, 'corrupted', f'Validation error: {str(e)}'
+        return validate_pdf(
+            file_path, self.config.pdf_max_file_size_mb, self.config.pdf_skip_encrypted
+        )
 
     def _track_pdf_error(self, file_path: str, error_category: str, error_message: str) -> None:
         """Track a PDF processing error.
@@ -156,34 +176,192 @@ class DocumentIndexer:
         storage_path.mkdir(parents=True, exist_ok=True)
 
         # Initialize ChromaDB client
-        self.chroma_client = chromadb.PersistentClient(path=str(storage_path))
+        self.chroma_client = get_chroma_client(str(storage_path))
+        if not self.config.chroma_host:
+            self._tune_sqlite(storage_path / "chroma.sqlite3")
 
-        # Get or create collection
+        # Get or create collection; the HNSW metadata only applies on creation.
+        # Embeddings always come from our own model, so Chroma's default
+        # embedding function is never built
         self.collection_name = self.config.collection_name
-        try:
-            self.chroma_collection = self.chroma_client.get_collection(self.collection_name)
-            logger.info(f"Loaded existing collection: {self.collection_name}")
-        except:
-            self.chroma_collection = self.chroma_client.create_collection(self.collection_name)
-            logger.info(f"Created new collection: {self.collection_name}")
+        self.chroma_collection = self.chroma_client.get_or_create_collection(
+            self.collection_name, metadata=self._hnsw_metadata(), embedding_function=None
+        )
+        self._apply_search_ef()
+        logger.info(f"Opened collection: {self.collection_name}")
 
         # Create ChromaVectorStore
         self.vector_store = ChromaVectorStore(chroma_collection=self.chroma_collection)
 
-    def _get_documents_from_directories(self) -> List[str]:
-        """Get all supported documents from target directories."""
-        documents = []
+    def _tune_sqlite(self, db_path: Path) -> None:
+        """Switch Chroma's SQLite store to write-ahead logging.
+
+        journal_mode=WAL is stored in the database file, so setting it once
+        applies to every connection Chroma opens, and readers no longer block
+        the indexing writes. WAL needs the store on a local filesystem, not a
+        network share, and keeps -wal/-shm files next to chroma.sqlite3.
+
+        Args:
+            db_path: Path to Chroma's SQLite database file
+        """
+        try:
+            with closing(sqlite3.connect(db_path)) as conn:
+                conn.execute("PRAGMA journal_mode=WAL")
+        except sqlite3.Error as e:
+            logger.warning(f"Could not enable WAL on {db_path}: {e}")
+
+    # Upper bounds for the HNSW write buffer and persist interval on rebuilds
+    REBUILD_HNSW_BATCH_SIZE = 10000
+    REBUILD_HNSW_SYNC_THRESHOLD = 20000
+
+    def _hnsw_metadata(self, size_hint: int = 0) -> Dict[str, Any]:
+        """HNSW index parameters applied when the collection is created.
+
+        Args:
+            size_hint: Expected number of chunks. When known, vectors are
+                buffered and persisted in larger batches so a bulk load
+                doesn't pay for many small index flushes.
+        """
+        metadata = {
+            "hnsw:space": "l2",
+            "hnsw:M": self.config.hnsw_m,
+            "hnsw:construction_ef": self.config.hnsw_construction_ef,
+            "hnsw:search_ef": self.config.hnsw_search_ef,
+        }
+        if size_hint:
+            # Chroma's defaults are 100 and 1000; batch_size must not exceed sync_threshold
+            batch_size = max(100, min(size_hint, self.REBUILD_HNSW_BATCH_SIZE))
+            metadata["hnsw:batch_size"] = batch_size
+            metadata["hnsw:sync_threshold"] = max(
+                1000, min(2 * batch_size, self.REBUILD_HNSW_SYNC_THRESHOLD)
+            )
+        return metadata
+
+    def _apply_search_ef(self) -> None:
+        """Apply the configured ef_search to the collection.
 
+        M and ef_construction are fixed once the index is built; ef_search can
+        be tuned in place, so existing collections pick up config changes.
+        """
+        try:
+            hnsw = (self.chroma_collection.configuration or {}).get("hnsw") or {}
+            if hnsw.get("ef_search") != self.config.hnsw_search_ef:
+                self.chroma_collection.modify(
+                    configuration={"hnsw": {"ef_search": self.config.hnsw_search_ef}}
+                )
+        except Exception as e:
+            # Older ChromaDB releases can't modify index configuration
+            logger.debug(f"Could not update ef_search on {self.collection_name}: {e}")
+
+    def _existing_target_directories(self) -> List[str]:
+        """Return the configured target directories that exist."""
+        directories = []
         for directory in self.config.target_directories:
-            dir_path = Path(directory)
-            if not dir_path.exists():
+            if not os.path.isdir(directory):
                 logger.warning(f"Directory does not exist: {directory}")
                 continue
+            directories.append(directory)
+        return directories
+
+    def _get_documents_from_directories(self) -> List[str]:
+        """Get all supported documents from target directories."""
+        directories = self._existing_target_directories()
+        if not directories:
+            return []
+
+        # Adding, removing or renaming a file bumps its parent directory's
+        # mtime, so unchanged directory mtimes mean an unchanged file list
+        cached = self._scan_cache
+        if cached is not None and cached[0] == directories and self._dirs_unchanged(cached[1]):
+            return list(cached[2])
+
+        # Each tree is walked once; separate trees are walked concurrently
+        with ThreadPoolExecutor(max_workers=min(32, len(directories))) as executor:
+            results = list(executor.map(lambda d: self._scan_directory(d, self._ext_set), directories))
+
+        documents = [path for paths, _ in results for path in paths]
+        dir_mtimes = {path: mtime for _, mtimes in results for path, mtime in mtimes.items()}
+        self._scan_cache = (directories, dir_mtimes, documents)
+        return list(documents)
 
-            for ext in self.config.file_extensions:
-                documents.extend(dir_path.rglob(f"*{ext}"))
+    def _iter_documents_from_directories(self) -> Iterator[str]:
+        """Yield supported documents from target directories as they are found.
 
-        return [str(doc) for doc in documents]
+        Trees are walked one after another so callers can start on the first
+        files before the walk finishes. A complete walk refreshes the same
+        cache as _get_documents_from_directories.
+        """
+        directories = self._existing_target_directories()
+        if not directories:
+            return
+
+        cached = self._scan_cache
+        if cached is not None and cached[0] == directories and self._dirs_unchanged(cached[1]):
+            yield from list(cached[2])
+            return
+
+        documents = []
+        dir_mtimes: Dict[str, int] = {}
+        for directory in directories:
+            for path in self._iter_directory(directory, self._ext_set, dir_mtimes):
+                documents.append(path)
+                yield path
+        self._scan_cache = (directories, dir_mtimes, documents)
+
+    @staticmethod
+    def _dirs_unchanged(dir_mtimes: Dict[str, int]) -> bool:
+        """Return True if every directory still has its recorded mtime."""
+        try:
+            return all(os.stat(path).st_mtime_ns == mtime for path, mtime in dir_mtimes.items())
+        except OSError:
+            return False
+
+    @staticmethod
+    def _scan_directory(directory: str, extensions: Set[str]) -> Tuple[List[str], Dict[str, int]]:
+        """Walk a directory tree once, collecting files with a supported extension.
+
+        Args:
+            directory: Root directory to walk
+            extensions: Lower-cased extensions to match, including the dot
+
+        Returns:
+            Tuple of (matching file paths, mtime_ns of every directory walked)
+        """
+        dir_mtimes: Dict[str, int] = {}
+        found = list(DocumentIndexer._iter_directory(directory, extensions, dir_mtimes))
+        return found, dir_mtimes
+
+    @staticmethod
+    def _iter_directory(directory: str, extensions: Set[str], dir_mtimes: Dict[str, int]) -> Iterator[str]:
+        """Walk a directory tree once, yielding files with a supported extension.
+
+        Args:
+            directory: Root directory to walk
+            extensions: Lower-cased extensions to match, including the dot
+            dir_mtimes: Filled with the mtime_ns of every directory walked
+        """
+        stack = [directory]
+
+        while stack:
+            current = stack.pop()
+            found = []
+            try:
+                # Stat before listing so a change mid-walk invalidates the cache
+                dir_mtimes[current] = os.stat(current).st_mtime_ns
+                with os.scandir(current) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        # is_file() reuses the d_type from the listing for regular
+                        # files; it only stats symlinks, so sockets, FIFOs and
+                        # dangling links with a matching name are skipped
+                        elif os.path.splitext(entry.name)[1].lower() in extensions and entry.is_file():
+                            found.append(entry.path)
+            except OSError as e:
+                logger.debug(f"Skipping unreadable directory: {e}")
+
+            # Yield after the listing is closed so a paused walk holds no handle
+            yield from found
 
     def load_documents(self, file_paths: Optional[List[str]] = None) -> List[Any]:
         """Load documents using LlamaIndex readers with PDF-specific handling.
@@ -195,14 +373,20 @@ class DocumentIndexer:
         Returns:
             List of loaded documents
         """
+        paths: Iterable[str]
         if file_paths is None:
-            file_paths = self._get_documents_from_directories()
-
-        if not file_paths:
-            logger.warning("No documents found to load")
-            return []
-
-        logger.info(f"Loading {len(file_paths)} documents...")
+            # Start parsing while the directory walk is still running
+            paths = self._iter_documents_from_directories()
+            slice_size = self.LOAD_SLICE_SIZE
+            logger.info("Loading documents from target directories...")
+        else:
+            if not file_paths:
+                logger.warning("No documents found to load")
+                return []
+            paths = file_paths
+            # Spread a known list across every worker
+            slice_size = min(self.LOAD_SLICE_SIZE, -(-len(file_paths) // self.LOAD_WORKERS))
+            logger.info(f"Loading {len(file_paths)} documents...")
 
         # Reset PDF stats for this load operation
         self._pdf_stats = {
@@ -215,67 +399,46 @@ class DocumentIndexer:
         }
 
         documents = []
-        pdf_files = [f for f in file_paths if f.lower().endswith('.pdf')]
-        non_pdf_files = [f for f in file_paths if not f.lower().endswith('.pdf')]
-
-        # Track PDF statistics
-        self._pdf_stats['total'] = len(pdf_files)
-
-        # Load PDFs with enhanced error handling
-        for file_path in pdf_files:
-            start_time = time.time()
-            try:
-                # Validate PDF before processing
-                is_valid, error_cat, error_msg = self._validate_pdf(file_path)
-                if not is_valid:
-                    self._track_pdf_error(file_path, error_cat, error_msg)
-                    continue
-
-                # Load PDF using PyMuPDFReader
-                if self._pdf_reader is None:
-                    logger.error(f"PDF reader not initialized, skipping: {file_path}")
-                    self._track_pdf_error(file_path, 'parse_error', 'PDF reader not initialized')
+        pdf_files = []
+        file_count = 0
+
+        # Non-PDF files parse on worker threads, one reader per slice, while
+        # PDFs load here; PyMuPDF is not thread-safe, so PDFs stay on one thread
+        with ThreadPoolExecutor(max_workers=self.LOAD_WORKERS) as executor:
+            other_results = []
+            pending: List[str] = []
+            for file_path in paths:
+                file_count += 1
+                # Lower-case only the suffix, not the whole path
+                if file_path[-4:].lower() == '.pdf':
+                    pdf_files.append(file_path)
                     continue
-
-                docs = self._pdf_reader.load_data(
-                    file_path=Path(file_path),
-                    metadata=self.config.pdf_extract_metadata
-                )
-
-                if not docs:
-                    self._track_pdf_error(file_path, 'empty', 'No text extracted from PDF')
+                pending.append(file_path)
+                if len(pending) >= slice_size:
+                    other_results.append(executor.submit(self._load_files, pending))
+                    pending = []
+            if pending:
+                other_results.append(executor.submit(self._load_files, pending))
+
+            if file_count == 0:
+                logger.warning("No documents found to load")
+                return []
+
+            # Track PDF statistics
+            self._pdf_stats['total'] = len(pdf_files)
+
+            for file_path, (docs, error_cat, error_msg, elapsed) in zip(pdf_files, self._load_pdfs(pdf_files)):
+                if error_cat:
+                    self._track_pdf_error(file_path, error_cat, error_msg)
                     continue
 
                 documents.extend(docs)
                 self._pdf_stats['successful'] += 1
-                elapsed = time.time() - start_time
                 self._pdf_stats['total_processing_time'] += elapsed
-                logger.info(f"✓ Loaded PDF {Path(file_path).name} ({len(docs)} pages, {elapsed:.2f}s)")
-
-            except TimeoutError:
-                self._track_pdf_error(file_path, 'timeout', 'Processing timeout exceeded')
-            except PermissionError:
-                self._track_pdf_error(file_path, 'permission', 'Permission denied')
-            except Exception as e:
-                error_msg = str(e)
-                # Try to categorize the error
-                if 'encrypt' in error_msg.lower() or 'password' in error_msg.lower():
-                    error_cat = 'encrypted'
-                elif 'corrupt' in error_msg.lower():
-                    error_cat = 'corrupted'
-                else:
-                    error_cat = 'parse_error'
-                self._track_pdf_error(file_path, error_cat, error_msg)
-
-        # Load non-PDF files with generic reader
-        for file_path in non_pdf_files:
-            try:
-                reader = SimpleDirectoryReader(input_files=[file_path])
-                docs = reader.load_data()
-                documents.extend(docs)
-                logger.debug(f"Loaded: {file_path}")
-            except Exception as e:
-                logger.error(f"Failed to load {file_path}: {e}")
+                logger.info(f"✓ Loaded PDF {Path(file_path).name} ({elapsed:.2f}s)")
+
+            for future in other_results:
+                documents.extend(future.result())
 
         logger.info(
             f"Successfully loaded {len(documents)} documents "
@@ -283,6 +446,155 @@ class DocumentIndexer:
         )
         return documents
 
+    def _pdf_options(self) -> PdfOptions:
+        """PDF settings in a form that can be sent to worker processes."""
+        return PdfOptions(
+            max_file_size_mb=self.config.pdf_max_file_size_mb,
+            skip_encrypted=self.config.pdf_skip_encrypted,
+            extract_metadata=self.config.pdf_extract_metadata,
+        )
+
+    def _load_pdf(self, file_path: str) -> PdfResult:
+        """Load one PDF with validation and error categorization.
+
+        Args:
+            file_path: Path to PDF file
+
+        Returns:
+            Tuple of (documents, error_category, error_message, elapsed_seconds)
+        """
+        if not self.config.pdf_enabled:
+            return [], 'parse_error', 'PDF processing is disabled', 0.0
+        return load_pdf(file_path, self._pdf_options())
+
+    def _load_pdfs(self, pdf_files: List[str]) -> Iterator[PdfResult]:
+        """Load PDFs, in worker processes when there are enough of them.
+
+        PyMuPDF is not thread-safe, so parallel parsing needs processes. Each
+        worker pays several seconds of imports at startup, so the pool is kept
+        for the indexer's lifetime, and small sets and single-core machines
+        load in-process.
+
+        Args:
+            pdf_files: PDF paths to load
+
+        Yields:
+            One result per file, in input order
+        """
+        workers = min(self.config.pdf_max_workers, os.cpu_count() or 1)
+        if not self.config.pdf_enabled or workers < 2 or len(pdf_files) < self.PDF_PROCESS_MIN_FILES:
+            for file_path in pdf_files:
+                yield self._load_pdf(file_path)
+            return
+
+        done = 0
+        try:
+            executor = self._get_pdf_pool(workers)
+            for result in executor.map(
+                partial(load_pdf, options=self._pdf_options()), pdf_files, chunksize=4
+            ):
+                done += 1
+                yield result
+        except BrokenProcessPool as e:
+            logger.warning(f"PDF worker processes failed ({e}); loading the rest in-process")
+            self._shutdown_pdf_pool()
+            for file_path in pdf_files[done:]:
+                yield self._load_pdf(file_path)
+
+    def _get_pdf_pool(self, workers: int) -> ProcessPoolExecutor:
+        """Return the PDF worker pool, starting it on first use.
+
+        Args:
+            workers: Number of worker processes to start
+
+        Returns:
+            The shared process pool
+        """
+        with self._pool_lock:
+            if self._pdf_pool is None:
+                # Spawn, not fork: forking a process that runs threads can deadlock
+                self._pdf_pool = ProcessPoolExecutor(
+                    max_workers=workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=init_pdf_worker,
+                )
+            return self._pdf_pool
+
+    def _shutdown_pdf_pool(self) -> None:
+        """Stop the PDF worker processes, if any are running."""
+        with self._pool_lock:
+            pool, self._pdf_pool = self._pdf_pool, None
+        if pool is not None:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    async def run_blocking(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Run a blocking indexing call on the indexer's own threads.
+
+        Loading, chunking and Chroma writes can keep a thread busy for
+        minutes; running them here leaves the default executor free for
+        searches and other request-path work.
+
+        Args:
+            func: Blocking callable
+            *args: Positional arguments for func
+
+        Returns:
+            The callable's result
+        """
+        with self._pool_lock:
+            if self._index_executor is None:
+                self._index_executor = ThreadPoolExecutor(
+                    max_workers=self.INDEX_WORKERS, thread_name_prefix="knw-index"
+                )
+            executor = self._index_executor
+        return await asyncio.get_running_loop().run_in_executor(executor, partial(func, *args))
+
+    def close(self) -> None:
+        """Release the indexer's worker processes and threads."""
+        self._shutdown_pdf_pool()
+        with self._pool_lock:
+            executor, self._index_executor = self._index_executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    def _load_files(self, file_paths: List[str]) -> List[Any]:
+        """Load non-PDF files with one generic reader.
+
+        If the batch fails it is split in half and retried, so a single bad
+        file only costs a few extra reads instead of the whole batch.
+
+        Args:
+            file_paths: Non-PDF files to load
+
+        Returns:
+            Documents from every file that loaded
+        """
+        try:
+            reader = SimpleDirectoryReader(input_files=file_paths, raise_on_error=True)
+            docs = reader.load_data()
+            logger.debug(f"Loaded {len(file_paths)} files")
+            return docs
+        except Exception as e:
+            if len(file_paths) == 1:
+                logger.error(f"Failed to load {file_paths[0]}: {e}")
+                return []
+
+        middle = len(file_paths) // 2
+        return self._load_files(file_paths[:middle]) + self._load_files(file_paths[middle:])
+
+    @staticmethod
+    def document_file_paths(documents: List[Any]) -> List[str]:
+        """Return the source file of each loaded document, without duplicates.
+
+        Args:
+            documents: Documents returned by load_documents
+
+        Returns:
+            File paths in load order
+        """
+        paths = (document.metadata.get('file_path') for document in documents)
+        return list(dict.fromkeys(path for path in paths if path))
+
     def create_index(self, documents: Optional[List[Any]] = None) -> VectorStoreIndex:
         """Create or update the vector index.
 
@@ -299,19 +611,166 @@ class DocumentIndexer:
         if not documents:
             raise ValueError("No documents available for indexing")
 
-        # Create storage context with ChromaDB
-        storage_context = StorageContext.from_defaults(vector_store=self.vector_store)
+        # Chunk and embed everything in one batch, then write straight to the
+        # vector store instead of going through the index's per-node insert
+        logger.info("Creating vector index...")
+        self._setup_settings()
+        nodes = self._parse_nodes(documents)
+        self._embed_nodes(nodes)
+        self._add_nodes(nodes)
+
+        self.index = VectorStoreIndex.from_vector_store(vector_store=self.vector_store)
+
+        logger.info(f"Index created with {len(documents)} documents ({len(nodes)} chunks)")
+        return self.index
+
+    async def acreate_index(self, documents: Optional[List[Any]] = None) -> VectorStoreIndex:
+        """Async variant of create_index that overlaps the embeddings requests.
+
+        Args:
+            documents: Optional list of documents to index.
+                      If None, loads documents from target directories.
+
+        Returns:
+            The created VectorStoreIndex
+        """
+        if documents is None:
+            documents = await self.run_blocking(self.load_documents)
+
+        if not documents:
+            raise ValueError("No documents available for indexing")
 
-        # Create the index
         logger.info("Creating vector index...")
-        self.index = VectorStoreIndex.from_documents(
-            documents,
-            storage_context=storage_context
-        )
+        await self.run_blocking(self._setup_settings)
+        nodes = await self.run_blocking(self._parse_nodes, documents)
+        await self._aembed_nodes(nodes)
+        await self.run_blocking(self._add_nodes, nodes)
+
+        self.index = VectorStoreIndex.from_vector_store(vector_store=self.vector_store)
 
-        logger.info(f"Index created with {len(documents)} documents")
+        logger.info(f"Index created with {len(documents)} documents ({len(nodes)} chunks)")
         return self.index
 
+    # Shortest chunk worth embedding when its document has other chunks
+    MIN_CHUNK_CHARS = 40
+
+    @classmethod
+    def _parse_nodes(cls, documents: List[Any]) -> List[Any]:
+        """Chunk documents, dropping blank chunks and short trailing fragments.
+
+        A short chunk is kept when it is its document's only chunk, so small
+        files stay searchable.
+
+        Args:
+            documents: Documents to chunk
+
+        Returns:
+            Nodes to embed
+        """
+        nodes = Settings.node_parser.get_nodes_from_documents(documents)
+        chunks_per_doc = Counter(node.ref_doc_id for node in nodes)
+
+        kept = []
+        for node in nodes:
+            text = node.get_content(metadata_mode=MetadataMode.NONE).strip()
+            if not text:
+                continue
+            if len(text) < cls.MIN_CHUNK_CHARS and chunks_per_doc[node.ref_doc_id] > 1:
+                continue
+            kept.append(node)
+
+        if len(kept) < len(nodes):
+            logger.debug(f"Skipped {len(nodes) - len(kept)} blank or fragment chunks")
+        return kept
+
+    @staticmethod
+    def _embed_nodes(nodes: List[Any]) -> None:
+        """Embed nodes in place with batched requests.
+
+        Args:
+            nodes: Nodes to embed
+        """
+        embeddings = Settings.embed_model.get_text_embedding_batch(
+            [node.get_content(metadata_mode=MetadataMode.EMBED) for node in nodes],
+            show_progress=False,
+        )
+        for node, embedding in zip(nodes, embeddings):
+            node.embedding = embedding
+
+    @staticmethod
+    async def _aembed_nodes(nodes: List[Any]) -> None:
+        """Embed nodes in place with concurrent async requests.
+
+        At most EMBED_CONCURRENCY requests are in flight; LlamaIndex bounds
+        the batch jobs by the embed model's num_workers.
+
+        Args:
+            nodes: Nodes to embed
+        """
+        embeddings = await Settings.embed_model.aget_text_embedding_batch(
+            [node.get_content(metadata_mode=MetadataMode.EMBED) for node in nodes]
+        )
+        for node, embedding in zip(nodes, embeddings):
+            node.embedding = embedding
+
+    def _add_nodes(self, nodes: List[Any]) -> None:
+        """Write embedded nodes to Chroma in the largest batches it accepts.
+
+        Args:
+            nodes: Nodes whose embeddings are already set
+        """
+        batch_size = self.chroma_client.get_max_batch_size()
+        for i in range(0, len(nodes), batch_size):
+            batch = nodes[i:i + batch_size]
+            metadatas = []
+            for node in batch:
+                # Same metadata layout ChromaVectorStore.add writes
+                metadata = node_to_metadata_dict(node, remove_text=True, flat_metadata=True)
+                metadatas.append({key: "" if value is None else value for key, value in metadata.items()})
+
+            # One (n, d) float32 array per batch instead of a list per node
+            self.chroma_collection.add(
+                ids=[node.node_id for node in batch],
+                embeddings=np.asarray([node.embedding for node in batch], dtype=np.float32),
+                metadatas=metadatas,
+                documents=[node.get_content(metadata_mode=MetadataMode.NONE) for node in batch],
+            )
+        self._count_cache = None
+
+        # Keep the source file set current so stats don't have to rescan
+        if self._source_files_cache is not None:
+            source_files = self._source_files_cache[1]
+            source_files.update(
+                node.metadata['file_path'] for node in nodes if 'file_path' in node.metadata
+            )
+            self._source_files_cache = (self._count(), source_files)
+
+    def _delete_file_chunks(self, file_paths: List[str]) -> None:
+        """Delete every chunk that came from the given files.
+
+        Args:
+            file_paths: Source files whose chunks should be removed
+        """
+        self.chroma_collection.delete(where={"file_path": {"$in": list(file_paths)}})
+        self._count_cache = None
+
+        if self._source_files_cache is not None:
+            source_files = self._source_files_cache[1].difference(file_paths)
+            self._source_files_cache = (self._count(), source_files)
+
+    # Seconds a collection count is reused before asking Chroma again
+    COUNT_CACHE_TTL = 1.0
+
+    def _count(self) -> int:
+        """Return the number of chunks in the collection, cached briefly."""
+        now = time.monotonic()
+        if self._count_cache is not None and now - self._count_cache[0] < self.COUNT_CACHE_TTL:
+            return self._count_cache[1]
+
+        count = self.chroma_collection.count()
+        self._count_cache = (now, count)
+        return count
+
     def load_existing_index(self) -> Optional[VectorStoreIndex]:
         """Load existing index from ChromaDB storage.
 
@@ -320,18 +779,20 @@ class DocumentIndexer:
         """
         try:
             # Check if collection has any documents
-            if self.chroma_collection.count() == 0:
+            doc_count = self._count()
+            if doc_count == 0:
                 logger.info("No existing documents in ChromaDB collection")
                 return None
 
             # Create storage context and load index
+            self._setup_settings()
             storage_context = StorageContext.from_defaults(vector_store=self.vector_store)
             self.index = VectorStoreIndex.from_vector_store(
                 vector_store=self.vector_store,
                 storage_context=storage_context
             )
 
-            logger.info(f"Loaded existing index with {self.chroma_collection.count()} documents")
+            logger.info(f"Loaded existing index with {doc_count} documents")
             return self.index
 
         except Exception as e:
@@ -359,17 +820,83 @@ class DocumentIndexer:
         Args:
             file_paths: List of file paths to add
         """
+        self.insert_documents(self.load_documents(file_paths))
+
+    def insert_documents(self, documents: List[Any]) -> None:
+        """Insert already-loaded documents into the existing index.
+
+        Args:
+            documents: Documents returned by load_documents
+        """
+        if not documents:
+            return
+
         if self.index is None:
             self.index = self.get_or_create_index()
 
-        documents = self.load_documents(file_paths)
-        if documents:
-            logger.info(f"Adding {len(documents)} documents to existing index...")
+        logger.info(f"Adding {len(documents)} documents to existing index...")
+
+        # Chunk everything up front so embeddings and Chroma writes go out in
+        # batches rather than one round trip per document
+        self._setup_settings()
+        nodes = self._parse_nodes(documents)
+        self._embed_nodes(nodes)
+        self._add_nodes(nodes)
+
+        logger.info(f"Documents added successfully ({len(nodes)} chunks)")
+
+    async def ainsert_documents(self, documents: List[Any]) -> None:
+        """Insert already-loaded documents, embedding them with concurrent async requests.
+
+        Chunking and the Chroma write run in worker threads; the embeddings
+        requests overlap on the event loop instead of blocking a thread.
+
+        Args:
+            documents: Documents returned by load_documents
+        """
+        if not documents:
+            return
+
+        logger.info(f"Adding {len(documents)} documents to existing index...")
 
-            for doc in documents:
-                self.index.insert(doc)
+        nodes = await self.aembed_documents(documents)
+        await self.aadd_nodes(nodes)
 
-            logger.info("Documents added successfully")
+        logger.info(f"Documents added successfully ({len(nodes)} chunks)")
+
+    async def aembed_documents(self, documents: List[Any]) -> List[Any]:
+        """Chunk and embed documents without writing them to the index.
+
+        Args:
+            documents: Documents returned by load_documents
+
+        Returns:
+            Nodes with embeddings set, ready for aadd_nodes
+        """
+        await self.run_blocking(self._setup_settings)
+        nodes = await self.run_blocking(self._parse_nodes, documents)
+        await self._aembed_nodes(nodes)
+        return nodes
+
+    async def aadd_nodes(self, nodes: List[Any], replace_files: Optional[List[str]] = None) -> None:
+        """Write embedded nodes to the index, creating the index if needed.
+
+        Args:
+            nodes: Nodes returned by aembed_documents
+            replace_files: Files whose existing chunks are deleted first, so a
+                changed file isn't left with its old chunks alongside the new
+        """
+        if replace_files:
+            await self.run_blocking(self._delete_file_chunks, replace_files)
+
+        if not nodes:
+            return
+
+        if self.index is None:
+            self.index = await self.run_blocking(self.get_or_create_index)
+
+        # Nodes already carry embeddings, so this only writes to Chroma
+        await self.run_blocking(self._add_nodes, nodes)
 
     def refresh_index(self) -> VectorStoreIndex:
         """Refresh the entire index by rebuilding from target directories.
@@ -378,20 +905,49 @@ class DocumentIndexer:
             Newly created VectorStoreIndex
         """
         logger.info("Refreshing index...")
+        self._reset_collection()
+
+        # Create new index
+        return self.create_index()
+
+    async def arefresh_index(self) -> List[str]:
+        """Async variant of refresh_index that embeds with concurrent requests.
+
+        Returns:
+            Paths of the files that were indexed
+        """
+        logger.info("Refreshing index...")
+        await self.run_blocking(self._reset_collection)
+        documents = await self.run_blocking(self.load_documents)
+        await self.acreate_index(documents)
+        return self.document_file_paths(documents)
+
+    def _reset_collection(self) -> None:
+        """Drop the collection and recreate it empty."""
+        # The rebuilt collection will be about as large as the current one
+        try:
+            size_hint = self._count()
+        except Exception as e:
+            logger.debug(f"Could not count {self.collection_name}: {e}")
+            size_hint = 0
 
-        # Clear existing collection
+        # Dropping the collection frees its HNSW index in one step, where
+        # deleting every record would cost a write per chunk
         try:
             self.chroma_client.delete_collection(self.collection_name)
             logger.info("Cleared existing collection")
-        except:
-            pass  # Collection might not exist
-
-        # Recreate collection and vector store
-        self.chroma_collection = self.chroma_client.create_collection(self.collection_name)
+        except (NotFoundError, ValueError):
+            logger.debug(f"Collection {self.collection_name} did not exist")
+
+        # Recreate collection and vector store with the current HNSW settings
+        self.chroma_collection = self.chroma_client.get_or_create_collection(
+            self.collection_name,
+            metadata=self._hnsw_metadata(size_hint),
+            embedding_function=None,
+        )
         self.vector_store = ChromaVectorStore(chroma_collection=self.chroma_collection)
-
-        # Create new index
-        return self.create_index()
+        self._count_cache = None
+        self._source_files_cache = None
 
     def _get_unique_source_files(self) -> int:
         """Count unique source files in the ChromaDB collection.
@@ -400,22 +956,85 @@ class DocumentIndexer:
             Number of unique source files indexed
         """
         try:
-            # Get all documents from the collection
-            all_docs = self.chroma_collection.get()
+            return len(self.get_indexed_source_files())
+        except Exception as e:
+            logger.warning(f"Could not count unique source files: {e}")
+            return 0
 
-            if not all_docs or not all_docs.get('metadatas'):
-                return 0
+    def get_indexed_source_files(self) -> Set[str]:
+        """Return the paths of the source files in the ChromaDB collection.
 
-            # Extract unique file paths from metadata
-            source_files = set()
-            for metadata in all_docs['metadatas']:
+        Returns:
+            Set of indexed file paths
+        """
+        # Reuse the last scan while the collection holds the same chunks
+        doc_count = self._count()
+        cached = self._source_files_cache
+        if cached is not None and cached[0] == doc_count:
+            return cached[1]
+
+        # Page through metadata only; chunk text and embeddings aren't needed
+        source_files = set()
+        page_size = self.chroma_client.get_max_batch_size()
+        offset = 0
+        while True:
+            page = self.chroma_collection.get(
+                include=["metadatas"], limit=page_size, offset=offset
+            )
+            metadatas = page.get('metadatas') or []
+            for metadata in metadatas:
                 if metadata and 'file_path' in metadata:
                     source_files.add(metadata['file_path'])
+            if len(metadatas) < page_size:
+                break
+            offset += page_size
 
-            return len(source_files)
-        except Exception as e:
-            logger.warning(f"Could not count unique source files: {e}")
-            return 0
+        self._source_files_cache = (doc_count, source_files)
+        return source_files
+
+    def _render_pdf_stats(self) -> Optional[Dict[str, Any]]:
+        """Build the PDF section of the index stats, reusing it while unchanged.
+
+        Rates and times are plain numbers so metrics scrapers can read them.
+
+        Returns:
+            PDF processing statistics, or None if no PDFs have been loaded
+        """
+        pdf_stats = self._pdf_stats
+        if pdf_stats['total'] == 0:
+            return None
+
+        # load_documents replaces the stats dict, so its identity plus the
+        # counters tell whether the last rendering is still current
+        counters = (pdf_stats['total'], pdf_stats['successful'], pdf_stats['failed'])
+        cached = self._pdf_stats_render
+        if cached is not None and cached[0] is pdf_stats and cached[1] == counters:
+            return cached[2]
+
+        rendered = {
+            'total_files': pdf_stats['total'],
+            'successful': pdf_stats['successful'],
+            'failed': pdf_stats['failed'],
+            'success_rate': round(pdf_stats['successful'] / pdf_stats['total'] * 100, 1),
+            'total_processing_time_seconds': round(pdf_stats['total_processing_time'], 2),
+            'errors_by_category': {
+                cat: count
+                for cat, count in pdf_stats['errors_by_category'].items()
+                if count > 0
+            },
+        }
+
+        # Include failed files list if there are failures
+        failed_files = pdf_stats['failed_files']
+        if failed_files:
+            rendered['failed_files'] = failed_files[:10]  # Show first 10 failures
+            if len(failed_files) > 10:
+                rendered['failed_files'].append({
+                    'filename': f"... and {len(failed_files) - 10} more"
+                })
+
+        self._pdf_stats_render = (pdf_stats, counters, rendered)
+        return rendered
 
     def get_index_stats(self) -> Dict[str, Any]:
         """Get statistics about the current index including PDF processing metrics.
@@ -426,34 +1045,16 @@ class DocumentIndexer:
         stats = {}
 
         # Always add PDF statistics if available
-        if self._pdf_stats['total'] > 0:
-            stats['pdf_processing'] = {
-                'total_files': self._pdf_stats['total'],
-                'successful': self._pdf_stats['successful'],
-                'failed': self._pdf_stats['failed'],
-                'success_rate': f"{(self._pdf_stats['successful'] / self._pdf_stats['total'] * 100):.1f}%" if self._pdf_stats['total'] > 0 else "N/A",
-                'total_processing_time_seconds': f"{self._pdf_stats['total_processing_time']:.2f}",
-                'errors_by_category': {
-                    cat: count
-                    for cat, count in self._pdf_stats['errors_by_category'].items()
-                    if count > 0
-                },
-            }
-
-            # Include failed files list if there are failures
-            if self._pdf_stats['failed_files']:
-                stats['pdf_processing']['failed_files'] = self._pdf_stats['failed_files'][:10]  # Show first 10 failures
-                if len(self._pdf_stats['failed_files']) > 10:
-                    stats['pdf_processing']['failed_files'].append({
-                        'filename': f"... and {len(self._pdf_stats['failed_files']) - 10} more"
-                    })
+        pdf_stats = self._render_pdf_stats()
+        if pdf_stats is not None:
+            stats['pdf_processing'] = pdf_stats
 
         if self.index is None:
             stats.update({"status": "No index loaded", "document_count": 0, "source_file_count": 0})
             return stats
 
         try:
-            doc_count = self.chroma_collection.count()
+            doc_count = self._count()
             source_file_count = self._get_unique_source_files()
             stats.update({
                 "status": "Index loaded",
@@ -467,3 +1068,9 @@ class DocumentIndexer:
         except Exception as e:
             stats.update({"status": f"Error getting stats: {e}", "document_count": 0, "source_file_count": 0})
             return stats
+
+
+@lru_cache(maxsize=1)
+def get_indexer() -> DocumentIndexer:
+    """Return the shared document indexer, creating it on first use."""
+    return DocumentIndexer()
@@ -1,10 +1,11 @@
 """Central knowledge management system coordinator - simplified facade."""
 
 import logging
+from collections.abc import AsyncIterator
 from typing import Dict, List, Any, Optional
 import asyncio
 
-from .config import config
+from .config import get_config
 from .document_service import DocumentIndexingService
 from .chat_service import KnowledgeChatService
 from .agno_knowledge import AgnoKnowledgeManager
@@ -18,12 +19,14 @@ class KnowledgeSystem:
 
     def __init__(self) -> None:
         """Initialize the knowledge system."""
-        self.config = config
+        self.config = get_config()
         self.operation_manager = OperationManager()
         self.knowledge_manager: Optional[AgnoKnowledgeManager] = None
         self.document_service: Optional[DocumentIndexingService] = None
         self.chat_service: Optional[KnowledgeChatService] = None
         self._initialized = False
+        # Cached result of is_ready_detailed(), checked on every request
+        self._ready = False
 
     async def initialize(self) -> None:
         """Initialize all components of the knowledge system."""
@@ -46,14 +49,26 @@ class KnowledgeSystem:
 
             # Set up event-driven updates: document service notifies chat service
             self.document_service.on_index_updated(self.chat_service.on_knowledge_updated)
+            self.document_service.on_index_updated(self.invalidate_ready)
 
             self._initialized = True
+            self.invalidate_ready()
             logger.info("Knowledge system initialized successfully")
 
         except Exception as exc:
             logger.error("Failed to initialize knowledge system: %s", exc)
             raise
 
+    async def warm_index(self) -> None:
+        """Preload the vector index so the first query doesn't pay the load cost."""
+        if not self.knowledge_manager:
+            return
+
+        try:
+            await asyncio.to_thread(self.knowledge_manager.warm_index)
+        except Exception as exc:
+            logger.warning("Index warm-up failed: %s", exc)
+
     async def cleanup(self) -> None:
         """Clean up resources."""
         logger.info("Cleaning up knowledge system...")
@@ -65,9 +80,22 @@ class KnowledgeSystem:
             await self.chat_service.cleanup()
 
         self._initialized = False
+        self._ready = False
 
     def is_ready(self) -> bool:
-        """Check if the system is ready to process requests."""
+        """Check if the system is ready to process requests.
+
+        Returns the readiness cached at the end of initialize() and after each
+        index update; use is_ready_detailed() to re-check every component.
+        """
+        return self._ready
+
+    def invalidate_ready(self) -> None:
+        """Recompute the cached readiness from the components."""
+        self._ready = self.is_ready_detailed()
+
+    def is_ready_detailed(self) -> bool:
+        """Check every component to see if the system can process requests."""
         return (
             self._initialized
             and self.document_service is not None
@@ -79,7 +107,7 @@ class KnowledgeSystem:
 
     async def get_system_status(self) -> Dict[str, Any]:
         """Get the current system status."""
-        if not self.is_ready():
+        if not self.is_ready_detailed():
             return {
                 "status": "not_ready",
                 "initialized": self._initialized,
@@ -91,7 +119,7 @@ class KnowledgeSystem:
             }
 
         # Get stats from services
-        index_stats = self.document_service.get_index_stats()
+        index_stats = await asyncio.to_thread(self.document_service.get_index_stats)
         chat_stats = self.chat_service.get_service_stats()
         knowledge_stats = self.knowledge_manager.get_knowledge_stats()
 
@@ -152,12 +180,6 @@ class KnowledgeSystem:
             # Directly await the async helper method
             result = await self._run_document_query(query)
 
-            if result is None:
-                return {
-                    "success": False,
-                    "error": "Failed to process query",
-                }
-
             logger.info("Query processed successfully")
             return {"success": True, "result": result}
 
@@ -184,51 +206,78 @@ class KnowledgeSystem:
             logger.error("Chat failed: %s", exc)
             return {"success": False, "error": str(exc)}
 
+    async def chat_stream(self, message: str) -> AsyncIterator[str]:
+        """Process a chat message and stream the response text."""
+        if not self.is_ready():
+            raise RuntimeError("System not ready")
+
+        logger.info("Streaming chat message: %s", message)
+        async for chunk in self.chat_service.chat_stream(message):
+            yield chunk
+
     async def search_documents(self, query: str, top_k: Optional[int] = None) -> List[Dict[str, Any]]:
         """Search documents using the chat service."""
         if not self.is_ready():
             raise RuntimeError("System not ready")
 
-        try:
-            return await self.chat_service.search_documents(query, top_k)
-        except Exception as e:
-            logger.error(f"Document search failed: {e}")
-            return []
+        return await self.chat_service.search_documents(query, top_k)
 
-    async def _run_document_query(self, query: str) -> Optional[Dict[str, Any]]:
-        """Asynchronously run a document query using the chat service."""
-        try:
-            # Get search results
-            documents = await self.search_documents(query)
-
-            sources: List[Dict[str, Any]] = []
-            for doc in documents:
-                text_preview = doc["text"][:200] + ("..." if len(doc["text"]) > 200 else "")
-                sources.append(
-                    {
-                        "text": text_preview,
-                        "full_text": doc["text"],
-                        "score": doc["score"],
-                        "metadata": doc["metadata"],
-                        "document_id": doc["document_id"],
-                    }
-                )
-
-            # Get chat response
-            chat_result = await self.chat(query)
-            answer = chat_result.get("response", "No response available")
+    # Characters of each source shown before the full text is expanded
+    PREVIEW_CHARS = 200
+
+    @classmethod
+    def _preview(cls, text: str) -> str:
+        """Return the start of a source's text, marked when truncated."""
+        if len(text) <= cls.PREVIEW_CHARS:
+            return text
+        return text[:cls.PREVIEW_CHARS] + "..."
+
+    async def _run_document_query(self, query: str) -> Dict[str, Any]:
+        """Search for sources, then answer the query from the chat service.
+
+        The search runs first so a query without sources never starts an LLM
+        call or enters the team's conversation history. Search errors
+        propagate to the caller instead of reading as "no results".
 
+        The two are not gathered: the team run executes on a worker thread,
+        so cancelling its task when the search comes back empty would not
+        stop the LLM call or keep the query out of the history.
+        """
+        documents = await self.search_documents(query)
+
+        if not documents:
             return {
-                "answer": answer,
-                "sources": sources,
+                "answer": "No relevant documents found.",
+                "sources": [],
                 "query": query,
                 "metadata": {
-                    "source_count": len(sources),
-                    "knowledge_status": "ready" if sources else "no_results",
+                    "source_count": 0,
+                    "knowledge_status": "no_results",
                     "architecture": "team-based",
                 },
             }
 
-        except Exception as e:
-            logger.error(f"Document query failed: {e}")
-            return None
+        sources: List[Dict[str, Any]] = [
+            {
+                "text": self._preview(doc["text"]),
+                "full_text": doc["text"],
+                "score": doc["score"],
+                "metadata": doc["metadata"],
+                "document_id": doc["document_id"],
+            }
+            for doc in documents
+        ]
+
+        chat_result = await self.chat(query)
+        answer = chat_result.get("response", "No response available")
+
+        return {
+            "answer": answer,
+            "sources": sources,
+            "query": query,
+            "metadata": {
+                "source_count": len(sources),
+                "knowledge_status": "ready",
+                "architecture": "team-based",
+            },
+        }
@@ -1,31 +1,144 @@
 """Knowledge planning team with specialized agents for intelligent query handling."""
 
+import asyncio
+import io
 import os
 import logging
-from collections.abc import Iterator
-from typing import Optional, Dict, Any
+import threading
+from collections.abc import AsyncIterator, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, Tuple
 
 from agno.agent import Agent
 from agno.models.openai import OpenAIChat
+from agno.run.team import TeamRunEvent
 from agno.team import Team
 from agno.db.sqlite import SqliteDb
 
 from agno.utils.log import set_log_level_to_debug, use_agent_logger
 
-from .config import config
+from .config import get_config
 from .agno_knowledge import AgnoKnowledgeManager
+from .chat_cache import SemanticChatCache
 
 logger = logging.getLogger(__name__)
 
+# Static instruction blocks, kept as module constants so every request sends
+# byte-identical system prompts and the provider's prefix cache can hit.
+# Retrieved passages arrive through the knowledge search tool, after this prefix.
+PLANNING_INSTRUCTIONS = """You are a query planning specialist responsible for analyzing user questions and orchestrating the knowledge team.
+
+Your responsibilities:
+1. Analyze the complexity and scope of user queries
+2. Determine the best search strategy (simple vs multi-step)
+3. Coordinate with specialized team members when needed
+4. Ensure efficient use of the knowledge base
+
+For simple, direct questions:
+- Handle them directly using knowledge search
+- Provide clear, concise answers with sources
+
+For complex, multi-part questions:
+- Break them down into logical search steps
+- Coordinate with team members for specialized tasks
+- Synthesize results into comprehensive responses
+
+Always prioritize efficiency and relevance in knowledge retrieval."""
+
+METADATA_INSTRUCTIONS = """You are a metadata extraction specialist focused on optimizing knowledge base queries.
+
+Your responsibilities:
+1. Analyze user queries to identify relevant metadata filters
+2. Extract key terms that can narrow down document searches
+3. Suggest optimal search strategies for large knowledge bases
+4. Identify document types, topics, and other filtering criteria
+
+When analyzing queries, look for:
+- File types mentioned (pdf, markdown, text)
+- Topic areas or domains
+- Date ranges or temporal references
+- Specific projects or directories
+- Technical terms that indicate document categories
+
+Provide specific filter recommendations to make knowledge searches more efficient."""
+
+SEARCH_INSTRUCTIONS = """You are a search execution specialist focused on retrieving relevant information from the knowledge base.
+
+Your responsibilities:
+1. Execute targeted searches based on planning agent guidance
+2. Apply metadata filters for efficient retrieval
+3. Evaluate search result quality and relevance
+4. Suggest alternative search approaches if initial results are insufficient
+
+Search strategies:
+- Use specific filters when provided by the metadata agent
+- Start with narrow searches and broaden if needed
+- Focus on retrieving the most relevant documents
+- Identify gaps in available information
+
+Always provide source citations and explain the search approach used."""
+
+ASSEMBLY_INSTRUCTIONS = """You are a synthesis specialist responsible for combining multiple search results into coherent, comprehensive responses.
+
+Your responsibilities:
+1. Analyze multiple search results and identify key themes
+2. Synthesize information from different sources
+3. Resolve conflicts or inconsistencies in retrieved information
+4. Create well-structured, comprehensive responses
+5. Ensure proper attribution and source citations
+
+Response guidelines:
+- Organize information logically and clearly
+- Highlight the most important findings
+- Note any limitations or gaps in available information
+- Provide actionable insights when possible
+- Maintain source traceability throughout
+
+Always aim for clarity, accuracy, and usefulness in your synthesized responses."""
+
+TEAM_INSTRUCTIONS = """You are the leader of an intelligent knowledge team specialized in handling complex document queries.
+
+Team Coordination Guidelines:
+1. For simple queries: Handle directly with your knowledge search capabilities
+2. For complex queries: Coordinate with team members as follows:
+   - Metadata Agent: When you need to optimize search filters
+   - Search Agent: For targeted or specialized searches
+   - Assembly Agent: When combining multiple search results
+
+Efficiency Principles:
+- Start with the simplest approach that will work
+- Use team members only when their specialized skills add value
+- Avoid unnecessary complexity or redundant searches
+- Always prioritize user needs and query intent
+
+Quality Standards:
+- Provide accurate, well-sourced information
+- Be transparent about limitations or gaps
+- Offer actionable insights when possible
+- Maintain clear source attribution"""
+
 
 class KnowledgePlanningTeam:
     """Intelligent team-based knowledge system with specialized agents."""
 
     def __init__(self, knowledge_manager: Optional[AgnoKnowledgeManager] = None) -> None:
         """Initialize the knowledge planning team."""
-        self.config = config
+        self.config = get_config()
         self.knowledge_manager = knowledge_manager or AgnoKnowledgeManager()
         self.team: Optional[Team] = None
+        # Team runs are blocking; bound them to match the OpenAI rate limit tier
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.config.max_concurrent_agents,
+            thread_name_prefix="agno-team",
+        )
+        self.response_cache: Optional[SemanticChatCache] = (
+            SemanticChatCache() if self.config.chat_cache_enabled else None
+        )
+        # Turns answered in the current team session; the team runs with its
+        # history in context, so only the opening turn can be served from cache
+        self._session_turns = 0
+        # A cached exchange the team has not seen, replayed on its next run
+        self._unseen_exchange: Optional[Tuple[str, str]] = None
 
         if self.config.enable_debug:
             os.environ.setdefault("AGNO_DEBUG", "true")
@@ -44,24 +157,7 @@ class KnowledgePlanningTeam:
                 api_key=self.config.get_openai_api_key(),
                 temperature=0.3,  # Lower temperature for more focused planning
             ),
-            instructions="""You are a query planning specialist responsible for analyzing user questions and orchestrating the knowledge team.
-
-Your responsibilities:
-1. Analyze the complexity and scope of user queries
-2. Determine the best search strategy (simple vs multi-step)
-3. Coordinate with specialized team members when needed
-4. Ensure efficient use of the knowledge base
-
-For simple, direct questions:
-- Handle them directly using knowledge search
-- Provide clear, concise answers with sources
-
-For complex, multi-part questions:
-- Break them down into logical search steps
-- Coordinate with team members for specialized tasks
-- Synthesize results into comprehensive responses
-
-Always prioritize efficiency and relevance in knowledge retrieval.""",
+            instructions=PLANNING_INSTRUCTIONS,
             knowledge=self.knowledge_manager.get_knowledge_instance(),
             search_knowledge=True,
             enable_agentic_knowledge_filters=True,
@@ -79,22 +175,7 @@ Always prioritize efficiency and relevance in knowledge retrieval.""",
                 api_key=self.config.get_openai_api_key(),
                 temperature=0.2,  # Very focused for metadata extraction
             ),
-            instructions="""You are a metadata extraction specialist focused on optimizing knowledge base queries.
-
-Your responsibilities:
-1. Analyze user queries to identify relevant metadata filters
-2. Extract key terms that can narrow down document searches
-3. Suggest optimal search strategies for large knowledge bases
-4. Identify document types, topics, and other filtering criteria
-
-When analyzing queries, look for:
-- File types mentioned (pdf, markdown, text)
-- Topic areas or domains
-- Date ranges or temporal references
-- Specific projects or directories
-- Technical terms that indicate document categories
-
-Provide specific filter recommendations to make knowledge searches more efficient.""",
+            instructions=METADATA_INSTRUCTIONS,
             knowledge=self.knowledge_manager.get_knowledge_instance(),
             search_knowledge=True,
             enable_agentic_knowledge_filters=True,
@@ -111,21 +192,7 @@ Provide specific filter recommendations to make knowledge searches more efficien
                 api_key=self.config.get_openai_api_key(),
                 temperature=0.4,
             ),
-            instructions="""You are a search execution specialist focused on retrieving relevant information from the knowledge base.
-
-Your responsibilities:
-1. Execute targeted searches based on planning agent guidance
-2. Apply metadata filters for efficient retrieval
-3. Evaluate search result quality and relevance
-4. Suggest alternative search approaches if initial results are insufficient
-
-Search strategies:
-- Use specific filters when provided by the metadata agent
-- Start with narrow searches and broaden if needed
-- Focus on retrieving the most relevant documents
-- Identify gaps in available information
-
-Always provide source citations and explain the search approach used.""",
+            instructions=SEARCH_INSTRUCTIONS,
             knowledge=self.knowledge_manager.get_knowledge_instance(),
             search_knowledge=True,
             enable_agentic_knowledge_filters=True,
@@ -142,23 +209,7 @@ Always provide source citations and explain the search approach used.""",
                 api_key=self.config.get_openai_api_key(),
                 temperature=0.6,  # Higher creativity for synthesis
             ),
-            instructions="""You are a synthesis specialist responsible for combining multiple search results into coherent, comprehensive responses.
-
-Your responsibilities:
-1. Analyze multiple search results and identify key themes
-2. Synthesize information from different sources
-3. Resolve conflicts or inconsistencies in retrieved information
-4. Create well-structured, comprehensive responses
-5. Ensure proper attribution and source citations
-
-Response guidelines:
-- Organize information logically and clearly
-- Highlight the most important findings
-- Note any limitations or gaps in available information
-- Provide actionable insights when possible
-- Maintain source traceability throughout
-
-Always aim for clarity, accuracy, and usefulness in your synthesized responses.""",
+            instructions=ASSEMBLY_INSTRUCTIONS,
             knowledge=self.knowledge_manager.get_knowledge_instance(),
             search_knowledge=True,
             enable_agentic_knowledge_filters=True,
@@ -196,26 +247,7 @@ Always aim for clarity, accuracy, and usefulness in your synthesized responses."
                 members=[metadata_agent, search_agent, assembly_agent],
                 knowledge=knowledge,
                 db=db,
-                instructions="""You are the leader of an intelligent knowledge team specialized in handling complex document queries.
-
-Team Coordination Guidelines:
-1. For simple queries: Handle directly with your knowledge search capabilities
-2. For complex queries: Coordinate with team members as follows:
-   - Metadata Agent: When you need to optimize search filters
-   - Search Agent: For targeted or specialized searches
-   - Assembly Agent: When combining multiple search results
-
-Efficiency Principles:
-- Start with the simplest approach that will work
-- Use team members only when their specialized skills add value
-- Avoid unnecessary complexity or redundant searches
-- Always prioritize user needs and query intent
-
-Quality Standards:
-- Provide accurate, well-sourced information
-- Be transparent about limitations or gaps
-- Offer actionable insights when possible
-- Maintain clear source attribution""",
+                instructions=TEAM_INSTRUCTIONS,
                 search_knowledge=True,
                 enable_agentic_knowledge_filters=True,
                 add_history_to_context=True,
@@ -240,24 +272,141 @@ Quality Standards:
         try:
             logger.info(f"Processing team chat message: {message}")
 
-            # Use the team's run method for coordinated response
-            response = self.team.run(
-                message,
-                stream=stream,
-                debug_mode=self.config.enable_debug,
-                stream_intermediate_steps=self.config.enable_debug,
-            )
+            cached = await self._get_cached(message)
+            if cached is not None:
+                return cached
 
-            if stream and isinstance(response, Iterator):
-                return self._consume_streaming_response(response)
+            opening = self._session_turns == 0
+            team_input = self._team_input(message)
+            self._session_turns += 1
 
-            # Extract the content from the response
-            return self._format_run_output(response)
+            # Run the blocking team call on the bounded executor
+            loop = asyncio.get_running_loop()
+            response = await loop.run_in_executor(self._executor, self._run_sync, team_input, stream)
+
+            if self.response_cache and opening:
+                await self.response_cache.put(message, response)
+
+            return response
 
         except Exception as e:
             logger.error(f"Error processing team chat message: {e}")
             return f"Sorry, I encountered an error: {str(e)}"
 
+    async def _get_cached(self, message: str) -> Optional[str]:
+        """Return a cached answer when the message opens the team session.
+
+        Later turns depend on the conversation history, so they always go to
+        the team. A cached answer is kept aside so the team's next run sees the
+        exchange the user did.
+        """
+        if not self.response_cache or self._session_turns:
+            return None
+
+        cached = await self.response_cache.get(message)
+        if cached is None:
+            return None
+
+        logger.info("Returning cached team response")
+        self._session_turns += 1
+        self._unseen_exchange = (message, cached)
+        return cached
+
+    def _team_input(self, message: str) -> str:
+        """Return the team input, prefixed with a cached exchange it missed."""
+        if self._unseen_exchange is None:
+            return message
+
+        question, answer = self._unseen_exchange
+        self._unseen_exchange = None
+        return (
+            f"Earlier in this conversation the user asked: {question}\n"
+            f"You answered: {answer}\n\n"
+            f"{message}"
+        )
+
+    def _run_sync(self, message: str, stream: bool) -> str:
+        """Run the team synchronously and return the textual response."""
+        # Use the team's run method for coordinated response
+        response = self.team.run(
+            message,
+            stream=stream,
+            debug_mode=self.config.enable_debug,
+            stream_intermediate_steps=self.config.enable_debug,
+        )
+
+        if stream and isinstance(response, Iterator):
+            return self._consume_streaming_response(response)
+
+        # Extract the content from the response
+        return self._format_run_output(response)
+
+    async def chat_stream(self, message: str) -> AsyncIterator[str]:
+        """Stream the team's response to a chat message as text deltas.
+
+        The Agno stream iterator is synchronous, so it is drained on a worker
+        thread and bridged to the event loop through an asyncio.Queue. Shares
+        the response cache with chat(): a cached answer to an opening message
+        is sent as one chunk, and an opening stream that completes is cached.
+        """
+        if not self.team:
+            yield "Error: Knowledge planning team is not initialized properly."
+            return
+
+        cached = await self._get_cached(message)
+        if cached is not None:
+            yield cached
+            return
+
+        logger.info(f"Streaming team chat message: {message}")
+        opening = self._session_turns == 0
+        team_input = self._team_input(message)
+        self._session_turns += 1
+
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue()
+        stop = threading.Event()
+        done = object()
+
+        def _produce() -> None:
+            try:
+                events = self.team.run(
+                    team_input,
+                    stream=True,
+                    debug_mode=self.config.enable_debug,
+                )
+                for event in events:
+                    if stop.is_set():
+                        break
+                    if getattr(event, "event", None) != TeamRunEvent.run_content.value:
+                        continue
+                    content = getattr(event, "content", None)
+                    if isinstance(content, str) and content:
+                        loop.call_soon_threadsafe(queue.put_nowait, content)
+            except Exception as exc:
+                loop.call_soon_threadsafe(queue.put_nowait, exc)
+            finally:
+                loop.call_soon_threadsafe(queue.put_nowait, done)
+
+        producer = loop.run_in_executor(self._executor, _produce)
+        chunks = []
+        try:
+            while True:
+                item = await queue.get()
+                if item is done:
+                    break
+                if isinstance(item, Exception):
+                    raise item
+                chunks.append(item)
+                yield item
+
+            if self.response_cache and opening and chunks:
+                await self.response_cache.put(message, "".join(chunks))
+        finally:
+            # Let the worker thread stop early if the client went away
+            stop.set()
+            await producer
+
     def _format_run_output(self, response: Any) -> str:
         """Extract text content from a Team run output."""
         if response is None:
@@ -283,7 +432,7 @@ Quality Standards:
     def _consume_streaming_response(self, response: Iterator[Any]) -> str:
         """Consume streamed team events and return the final textual content."""
         final_content: Optional[Any] = None
-        text_chunks: list[str] = []
+        text = io.StringIO()
 
         for event in response:
             content = getattr(event, "content", None)
@@ -292,12 +441,12 @@ Quality Standards:
 
             final_content = content
             if isinstance(content, str):
-                text_chunks.append(content)
+                text.write(content)
 
         if isinstance(final_content, str):
             return final_content
-        if text_chunks:
-            return "".join(text_chunks)
+        if text.tell():
+            return text.getvalue()
         if final_content is not None:
             return str(final_content)
         return ""
@@ -310,12 +459,28 @@ Quality Standards:
         """Refresh the knowledge base connection after index updates."""
         try:
             self.knowledge_manager.refresh()
-            # Re-setup the team with refreshed knowledge
-            self._setup_team()
+            # Cached answers may no longer match the updated knowledge base
+            if self.response_cache:
+                self.response_cache.clear()
+
+            if self.team is None:
+                self._setup_team()
+            else:
+                # Agno reads knowledge at run time, so pointing the existing
+                # team and agents at the new connection keeps their model
+                # clients, memory database and history instead of rebuilding
+                knowledge = self.knowledge_manager.get_knowledge_instance()
+                self.team.knowledge = knowledge
+                for member in self.team.members:
+                    member.knowledge = knowledge
             logger.info("Knowledge planning team refreshed successfully")
         except Exception as e:
             logger.error(f"Failed to refresh knowledge planning team: {e}")
 
+    def shutdown(self) -> None:
+        """Release the worker threads used for team runs."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
     def get_team_stats(self) -> Dict[str, Any]:
         """Get statistics about the team and its knowledge base."""
         if not self.team:
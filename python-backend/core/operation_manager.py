@@ -9,7 +9,8 @@ from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Optional, Dict, Any, Callable
 
-from .config import config
+from .config import get_config
+from .ttl_cache import AsyncTTLCache
 
 logger = logging.getLogger(__name__)
 
@@ -24,10 +25,12 @@ class OperationManager:
             db_path: Path to SQLite database file. If None, uses config value.
         """
         if db_path is None:
-            db_path = config.get('operations.database_file', 'tmp/operations.db')
+            db_path = get_config().get('operations.database_file', 'tmp/operations.db')
 
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        # Operation listings are polled by the UI; invalidated on every write
+        self._list_cache = AsyncTTLCache(ttl=get_config().stats_cache_ttl)
         self._initialize_db()
 
     def _initialize_db(self) -> None:
@@ -88,6 +91,7 @@ class OperationManager:
                 conn.commit()
 
         await asyncio.to_thread(_insert)
+        self._list_cache.invalidate()
         logger.info(f"Created operation {operation_id}")
         return operation_id
 
@@ -109,6 +113,7 @@ class OperationManager:
                 conn.commit()
 
         await asyncio.to_thread(_update)
+        self._list_cache.invalidate()
         logger.info(f"Started operation {operation_id}")
 
     async def update_progress(
@@ -158,6 +163,7 @@ class OperationManager:
                 conn.commit()
 
         await asyncio.to_thread(_update)
+        self._list_cache.invalidate()
 
     async def complete_operation(
         self,
@@ -183,6 +189,7 @@ class OperationManager:
                 conn.commit()
 
         await asyncio.to_thread(_update)
+        self._list_cache.invalidate()
         logger.info(f"Completed operation {operation_id}")
 
     async def fail_operation(
@@ -208,6 +215,7 @@ class OperationManager:
                 conn.commit()
 
         await asyncio.to_thread(_update)
+        self._list_cache.invalidate()
         logger.error(f"Failed operation {operation_id}: {error}")
 
     async def cancel_operation(self, operation_id: str) -> None:
@@ -228,6 +236,7 @@ class OperationManager:
                 conn.commit()
 
         await asyncio.to_thread(_update)
+        self._list_cache.invalidate()
         logger.info(f"Cancelled operation {operation_id}")
 
     async def get_operation(self, operation_id: str) -> Optional[Dict[str, Any]]:
@@ -295,7 +304,10 @@ class OperationManager:
 
                 return operations
 
-        return await asyncio.to_thread(_fetch)
+        return await self._list_cache.get_or_load(
+            (limit, status),
+            lambda: asyncio.to_thread(_fetch),
+        )
 
     async def cleanup_old_operations(self, hours: Optional[int] = None) -> int:
         """Clean up operations older than specified hours.
@@ -307,7 +319,7 @@ class OperationManager:
             Number of operations deleted
         """
         if hours is None:
-            hours = config.get('operations.cleanup_after_hours', 24)
+            hours = get_config().get('operations.cleanup_after_hours', 24)
 
         cutoff_time = (datetime.now() - timedelta(hours=hours)).timestamp()
 
@@ -321,6 +333,7 @@ class OperationManager:
                 return cursor.rowcount
 
         deleted = await asyncio.to_thread(_delete)
+        self._list_cache.invalidate()
         if deleted > 0:
             logger.info(f"Cleaned up {deleted} old operations")
 
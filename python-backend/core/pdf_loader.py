@@ -0,0 +1,182 @@
+"""PDF validation and loading, shared by the indexer and its worker processes."""
+
+import logging
+import os
+import re
+import time
+from pathlib import Path
+from typing import Any, List, NamedTuple, Optional, Tuple
+
+from llama_index.core import Document
+
+logger = logging.getLogger(__name__)
+
+# Bytes read from each end of a PDF during validation
+_SCAN_WINDOW = 16 * 1024
+# Reference to an encryption dictionary in a trailer or xref stream
+_ENCRYPT_REF = re.compile(rb'/Encrypt\s*(?:\d+\s+\d+\s+R|<<)')
+
+# Error categories recognized from parser exception messages, checked in order
+_ERROR_KEYWORDS = (
+    (re.compile(r'encrypt|password', re.IGNORECASE), 'encrypted'),
+    (re.compile(r'corrupt', re.IGNORECASE), 'corrupted'),
+)
+
+# (documents, error_category, error_message, elapsed_seconds)
+PdfResult = Tuple[List[Any], Optional[str], Optional[str], float]
+
+
+class PdfOptions(NamedTuple):
+    """PDF settings passed to worker processes, which don't load the config."""
+
+    max_file_size_mb: int
+    skip_encrypted: bool
+    extract_metadata: bool
+
+
+def init_worker() -> None:
+    """Import PyMuPDF once when a worker process starts."""
+    import fitz  # noqa: F401
+
+
+def validate_pdf(
+    file_path: str,
+    max_file_size_mb: int,
+    skip_encrypted: bool,
+) -> Tuple[bool, Optional[str], Optional[str]]:
+    """Validate PDF file before processing.
+
+    Args:
+        file_path: Path to PDF file
+        max_file_size_mb: Largest file size accepted
+        skip_encrypted: Reject password-protected PDFs
+
+    Returns:
+        Tuple of (is_valid, error_category, error_message)
+    """
+    path = Path(file_path)
+
+    # Check file exists and is readable
+    if not path.exists():
+        return False, 'invalid', 'File does not exist'
+
+    if not path.is_file():
+        return False, 'invalid', 'Not a file'
+
+    try:
+        # Check file permissions
+        if not os.access(path, os.R_OK):
+            return False, 'permission', 'File is not readable'
+
+        # Check file size
+        file_size_mb = path.stat().st_size / (1024 * 1024)
+        if file_size_mb > max_file_size_mb:
+            return False, 'oversized', f'File size {file_size_mb:.1f}MB exceeds limit {max_file_size_mb}MB'
+
+        # One read of each end of the file covers the header and the trailer
+        with open(path, 'rb') as f:
+            head = f.read(_SCAN_WINDOW)
+            size = f.seek(0, os.SEEK_END)
+            if size > _SCAN_WINDOW:
+                f.seek(max(_SCAN_WINDOW, size - _SCAN_WINDOW))
+                tail = f.read()
+            else:
+                tail = b''
+
+        # Check if it's a PDF (magic bytes check); the spec allows leading junk
+        if b'%PDF' not in head[:1024]:
+            return False, 'invalid', 'Not a valid PDF file (invalid header)'
+
+        # Check if PDF is encrypted. The trailer (or a linearized file's first
+        # trailer near the start) references the /Encrypt dictionary, so only
+        # files that mention it are opened with PyMuPDF to confirm
+        if skip_encrypted and (_ENCRYPT_REF.search(tail) or _ENCRYPT_REF.search(head)):
+            try:
+                import fitz
+                pdf_doc = fitz.open(path)
+                if pdf_doc.is_pdf and pdf_doc.needs_pass:
+                    pdf_doc.close()
+                    return False, 'encrypted', 'PDF is password-protected'
+                pdf_doc.close()
+            except Exception as e:
+                logger.warning(f"Could not check if PDF is encrypted: {e}")
+                # Continue anyway, let the parser handle it
+
+        return True, None, None
+
+    except OSError as e:
+        return False, 'permission', f'Cannot access file: {str(e)}'
+    except Exception as e:
+        return False, 'corrupted', f'Validation error: {str(e)}'
+
+
+def categorize_error(error_msg: str) -> str:
+    """Map a parser exception message to a PDF error category.
+
+    Args:
+        error_msg: Exception message
+
+    Returns:
+        Error category, 'parse_error' if no keyword matches
+    """
+    for pattern, category in _ERROR_KEYWORDS:
+        if pattern.search(error_msg):
+            return category
+    return 'parse_error'
+
+
+def extract_text(file_path: str) -> Tuple[str, int]:
+    """Extract the text of every page of a PDF.
+
+    Args:
+        file_path: Path to PDF file
+
+    Returns:
+        Tuple of (text of all pages, page count)
+    """
+    import fitz
+
+    # Close the document as soon as the text is out so MuPDF frees its memory
+    with fitz.open(file_path) as pdf_doc:
+        pages = [page.get_text("text") for page in pdf_doc]
+    return "\n\n".join(pages), len(pages)
+
+
+def load_pdf(file_path: str, options: PdfOptions) -> PdfResult:
+    """Load one PDF as a single document, with validation and error categorization.
+
+    Args:
+        file_path: Path to PDF file
+        options: PDF settings from the config
+
+    Returns:
+        Tuple of (documents, error_category, error_message, elapsed_seconds)
+    """
+    start_time = time.time()
+    try:
+        # Validate PDF before processing
+        is_valid, error_cat, error_msg = validate_pdf(
+            file_path, options.max_file_size_mb, options.skip_encrypted
+        )
+        if not is_valid:
+            return [], error_cat, error_msg, 0.0
+
+        # One document per PDF; the node parser chunks it like any other file
+        text, page_count = extract_text(file_path)
+        if not text.strip():
+            return [], 'empty', 'No text extracted from PDF', 0.0
+
+        # file_path identifies the source like SimpleDirectoryReader's metadata
+        metadata = {'file_path': str(file_path)}
+        if options.extract_metadata:
+            metadata['total_pages'] = page_count
+
+        return [Document(text=text, metadata=metadata)], None, None, time.time() - start_time
+
+    except TimeoutError:
+        return [], 'timeout', 'Processing timeout exceeded', 0.0
+    except PermissionError:
+        return [], 'permission', 'Permission denied', 0.0
+    except Exception as e:
+        error_msg = str(e)
+        return [], categorize_error(error_msg), error_msg, 0.0
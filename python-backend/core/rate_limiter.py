@@ -0,0 +1,62 @@
+"""Adaptive concurrency limit for rate-limited API calls."""
+
+import asyncio
+import logging
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+class AdaptiveConcurrencyLimiter:
+    """Async concurrency limit that backs off when the API rate-limits us.
+
+    The limit halves on every rate-limit response and grows back by one per
+    successful call (AIMD), so a burst of 429s quickly drains the queue of
+    in-flight requests and throughput recovers once the API accepts them.
+    """
+
+    def __init__(self, max_limit: int) -> None:
+        """Initialize the limiter.
+
+        Args:
+            max_limit: Most calls allowed in flight at once
+        """
+        self.max_limit = max(1, max_limit)
+        self.limit = self.max_limit
+        self._active = 0
+        self._condition: Optional[asyncio.Condition] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _get_condition(self) -> asyncio.Condition:
+        """Return the condition for the running loop, creating it if needed."""
+        loop = asyncio.get_running_loop()
+        if self._condition is None or self._loop is not loop:
+            self._condition = asyncio.Condition()
+            self._loop = loop
+            self._active = 0
+        return self._condition
+
+    async def __aenter__(self) -> "AdaptiveConcurrencyLimiter":
+        condition = self._get_condition()
+        async with condition:
+            await condition.wait_for(lambda: self._active < self.limit)
+            self._active += 1
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        condition = self._get_condition()
+        async with condition:
+            self._active -= 1
+            condition.notify_all()
+
+    def on_rate_limited(self) -> None:
+        """Halve the limit after a rate-limit response."""
+        new_limit = max(1, self.limit // 2)
+        if new_limit != self.limit:
+            logger.info(f"Rate limited; lowering concurrency from {self.limit} to {new_limit}")
+        self.limit = new_limit
+
+    def on_success(self) -> None:
+        """Raise the limit by one after a successful call."""
+        if self.limit < self.max_limit:
+            self.limit += 1
@@ -0,0 +1,115 @@
+"""Micro-batching of concurrent document searches into one vector query."""
+
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from .agno_knowledge import AgnoKnowledgeManager
+
+logger = logging.getLogger(__name__)
+
+# (query, top_k, precomputed embedding, future resolved with the results)
+_PendingSearch = Tuple[str, int, Optional[Sequence[float]], asyncio.Future]
+
+
+class SearchBatcher:
+    """Coalesce searches arriving within a short window into one batched call.
+
+    Each batch costs one embeddings request and one Chroma query no matter how
+    many callers are waiting on it, so concurrent users share the round trips.
+    """
+
+    def __init__(
+        self,
+        knowledge_manager: AgnoKnowledgeManager,
+        window_ms: float,
+        max_batch_size: int,
+    ) -> None:
+        """Initialize the search batcher.
+
+        Args:
+            knowledge_manager: Knowledge manager that runs the batched search
+            window_ms: How long to wait for more queries after the first arrives
+            max_batch_size: Maximum number of queries per batched search
+        """
+        self.knowledge_manager = knowledge_manager
+        self.window = window_ms / 1000
+        self.max_batch_size = max_batch_size
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+
+    async def search(
+        self,
+        query: str,
+        top_k: int,
+        embedding: Optional[Sequence[float]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Queue a search and wait for its results.
+
+        Args:
+            query: Search query text
+            top_k: Number of results wanted
+            embedding: Query embedding, if the caller already computed it
+
+        Returns:
+            Formatted search results for this query
+        """
+        loop = asyncio.get_running_loop()
+        if self._worker is None or self._worker.done() or self._worker.get_loop() is not loop:
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.create_task(self._run())
+
+        future = loop.create_future()
+        await self._queue.put((query, top_k, embedding, future))
+        return await future
+
+    async def _collect(self) -> List[_PendingSearch]:
+        """Wait for one query, then gather more until the window closes."""
+        batch = [await self._queue.get()]
+        deadline = asyncio.get_running_loop().time() + self.window
+
+        while len(batch) < self.max_batch_size:
+            timeout = deadline - asyncio.get_running_loop().time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+
+        return batch
+
+    async def _run(self) -> None:
+        """Drain the queue in batches until cancelled."""
+        while True:
+            batch = await self._collect()
+            queries = [query for query, _, _, _ in batch]
+            limit = max(top_k for _, top_k, _, _ in batch)
+
+            try:
+                results = await self.knowledge_manager.search_batch(
+                    queries,
+                    limit=limit,
+                    embeddings=[embedding for _, _, embedding, _ in batch],
+                )
+            except Exception as exc:
+                logger.error("Batched search of %d queries failed: %s", len(batch), exc)
+                for _, _, _, future in batch:
+                    if not future.done():
+                        future.set_exception(exc)
+                continue
+
+            logger.debug("Ran %d searches as one batch", len(batch))
+            for (_, top_k, _, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result[:top_k])
+
+    async def close(self) -> None:
+        """Stop the background worker."""
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
@@ -0,0 +1,125 @@
+"""Semantic cache for document search results keyed by query embedding."""
+
+import itertools
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+
+@dataclass
+class _Entry:
+    """A cached search: normalized query vector, result depth, and results."""
+
+    vector: np.ndarray
+    top_k: int
+    results: List[Dict[str, Any]]
+    expires_at: float
+
+
+class SemanticSearchCache:
+    """LRU + TTL cache of search results matched by cosine similarity.
+
+    A lookup returns the results of the most similar cached query when its
+    similarity reaches the threshold and it was run with at least as many
+    results as requested. Near-identical queries overwrite each other instead
+    of filling the cache with duplicates.
+    """
+
+    MAX_ENTRIES = 512
+    TTL_SECONDS = 300.0
+    # Queries at least this similar replace the existing entry on store
+    DUPLICATE_SIMILARITY = 0.95
+
+    def __init__(
+        self,
+        similarity_threshold: float,
+        max_entries: int = MAX_ENTRIES,
+        ttl: float = TTL_SECONDS,
+    ) -> None:
+        """Initialize the search cache.
+
+        Args:
+            similarity_threshold: Minimum cosine similarity for a cache hit
+            max_entries: Maximum number of cached queries
+            ttl: Seconds a cached result set stays valid
+        """
+        self.similarity_threshold = similarity_threshold
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: "OrderedDict[int, _Entry]" = OrderedDict()
+        self._ids = itertools.count()
+        # Stacked entry vectors, rebuilt lazily after the entry set changes
+        self._matrix: Optional[np.ndarray] = None
+        self._matrix_ids: List[int] = []
+
+    @staticmethod
+    def _normalize(embedding: Sequence[float]) -> np.ndarray:
+        """Return the embedding as an L2-normalized float32 vector."""
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def _purge_expired(self) -> None:
+        """Drop entries whose TTL has elapsed."""
+        now = time.monotonic()
+        expired = [entry_id for entry_id, entry in self._entries.items() if entry.expires_at <= now]
+        for entry_id in expired:
+            del self._entries[entry_id]
+        if expired:
+            self._matrix = None
+
+    def _nearest(self, vector: np.ndarray) -> Optional[tuple]:
+        """Return (entry_id, similarity) of the closest cached query."""
+        self._purge_expired()
+        if not self._entries:
+            return None
+
+        if self._matrix is None:
+            self._matrix_ids = list(self._entries)
+            self._matrix = np.stack([self._entries[i].vector for i in self._matrix_ids])
+
+        similarities = self._matrix @ vector
+        best = int(np.argmax(similarities))
+        return self._matrix_ids[best], float(similarities[best])
+
+    def get(self, embedding: Sequence[float], top_k: int) -> Optional[List[Dict[str, Any]]]:
+        """Return cached results for a similar query, or None on a miss."""
+        nearest = self._nearest(self._normalize(embedding))
+        if nearest is None:
+            return None
+
+        entry_id, similarity = nearest
+        entry = self._entries[entry_id]
+        if similarity < self.similarity_threshold or entry.top_k < top_k:
+            return None
+
+        self._entries.move_to_end(entry_id)
+        # Copy so callers can trim or annotate results without touching the cache
+        return [dict(result) for result in entry.results[:top_k]]
+
+    def put(self, embedding: Sequence[float], top_k: int, results: List[Dict[str, Any]]) -> None:
+        """Cache the results of a query."""
+        vector = self._normalize(embedding)
+        entry = _Entry(
+            vector=vector,
+            top_k=top_k,
+            results=[dict(result) for result in results],
+            expires_at=time.monotonic() + self.ttl,
+        )
+
+        nearest = self._nearest(vector)
+        if nearest is not None and nearest[1] >= self.DUPLICATE_SIMILARITY:
+            del self._entries[nearest[0]]
+
+        self._entries[next(self._ids)] = entry
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        self._matrix = None
+
+    def clear(self) -> None:
+        """Drop every cached result, e.g. after the knowledge base changes."""
+        self._entries.clear()
+        self._matrix = None
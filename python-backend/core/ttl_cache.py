@@ -0,0 +1,86 @@
+"""Small in-process TTL cache for async loaders."""
+
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+# Result handed to waiters when the load they joined was cancelled
+_RETRY = object()
+
+
+class AsyncTTLCache:
+    """TTL cache whose misses are single-flight.
+
+    Concurrent callers that miss on the same key share one in-flight load
+    instead of each falling through to the backing store.
+    """
+
+    def __init__(self, ttl: float, maxsize: int = 8) -> None:
+        """Initialize the cache.
+
+        Args:
+            ttl: Seconds an entry stays fresh
+            maxsize: Maximum number of keys kept
+        """
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+        self._generation = 0
+
+    async def get_or_load(self, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """Return the cached value for key, loading it with loader on a miss."""
+        while True:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                return entry[1]
+
+            inflight = self._inflight.get(key)
+            if inflight is None:
+                return await self._load(key, loader)
+
+            value = await asyncio.shield(inflight)
+            if value is not _RETRY:
+                return value
+            # The load was cancelled along with its caller; try again
+
+    async def _load(self, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """Run loader as the single in-flight load for key."""
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        generation = self._generation
+        try:
+            value = await loader()
+        except Exception as exc:
+            future.set_exception(exc)
+            # Mark retrieved so an unobserved failure isn't logged
+            future.exception()
+            raise
+        except BaseException:
+            # Cancellation belongs to this caller only; waiters load again
+            future.set_result(_RETRY)
+            raise
+        else:
+            future.set_result(value)
+            # Don't store a value loaded before an invalidation
+            if generation == self._generation:
+                self._store(key, value)
+            return value
+        finally:
+            self._inflight.pop(key, None)
+
+    def _store(self, key: Hashable, value: Any) -> None:
+        """Store a value and evict the oldest keys beyond maxsize."""
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, key: Optional[Hashable] = None) -> None:
+        """Drop one key, or every key when key is None."""
+        self._generation += 1
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
@@ -1,16 +1,19 @@
 """FastAPI server for the Knowledge Management System."""
 
+import asyncio
 import logging
 import os
+import sys
 from contextlib import asynccontextmanager
 from typing import Dict, Any
 
 from fastapi import FastAPI, HTTPException, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import JSONResponse
 import uvicorn
 
-from api.routes import chat, documents, system, operations
+from api.routes import chat, debug, documents, system, operations
 from core.config import config
 from core.knowledge_system import KnowledgeSystem
 
@@ -47,18 +50,41 @@ async def lifespan(app: FastAPI):
         knowledge_system = KnowledgeSystem()
         await knowledge_system.initialize()
         app.state.knowledge_system = knowledge_system
+        # Load the vector index in the background so the first chat isn't cold
+        warmup_task = asyncio.create_task(knowledge_system.warm_index())
         logger.info("Knowledge system initialized successfully")
     except Exception as e:
-        logger.error(f"Failed to initialize knowledge system: {e}")
+        logger.error("Failed to initialize knowledge system: %s", e)
         raise
 
     yield
 
     # Shutdown
     logger.info("Shutting down Knowledge Management System API...")
+    if not warmup_task.done():
+        warmup_task.cancel()
     if knowledge_system:
         await knowledge_system.cleanup()
 
+class StreamSafeGZipMiddleware(GZipMiddleware):
+    """GZipMiddleware that leaves the given paths uncompressed.
+
+    Starlette versions that don't yet skip text/event-stream buffer and
+    compress SSE responses, holding back streamed chat chunks; the FastAPI
+    floor in requirements.txt still allows them.
+    """
+
+    def __init__(self, app, exclude_paths=(), **kwargs) -> None:
+        super().__init__(app, **kwargs)
+        self.exclude_paths = frozenset(exclude_paths)
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] == "http" and scope["path"] in self.exclude_paths:
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
+
+
 # Create FastAPI app
 app = FastAPI(
     title="Knowledge Management System API",
@@ -76,11 +102,19 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress large search/stats payloads, but never the SSE chat stream
+app.add_middleware(
+    StreamSafeGZipMiddleware,
+    minimum_size=1024,
+    exclude_paths=("/api/chat/message/stream",),
+)
+
 # Include API routes
 app.include_router(system.router, prefix="/api/system", tags=["system"])
 app.include_router(documents.router, prefix="/api/documents", tags=["documents"])
 app.include_router(chat.router, prefix="/api/chat", tags=["chat"])
 app.include_router(operations.router, prefix="/api", tags=["operations"])
+app.include_router(debug.router, prefix="/api/debug", tags=["debug"])
 
 @app.get("/")
 async def root():
@@ -95,7 +129,7 @@ async def health_check():
 @app.exception_handler(Exception)
 async def global_exception_handler(request, exc):
     """Global exception handler."""
-    logger.error(f"Unhandled exception: {exc}")
+    logger.error("Unhandled exception: %s", exc, exc_info=exc)
     return JSONResponse(
         status_code=500,
         content={"detail": "Internal server error"}
@@ -120,6 +154,9 @@ if __name__ == "__main__":
         host="0.0.0.0",
         port=port,
         reload=enable_reload,
+        # uvloop/httptools cut per-request event loop and parsing overhead
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
         log_level=config.log_level_name.lower(),
         log_config=None,
     )
@@ -0,0 +1,11 @@
+"""Shared pytest setup for the backend tests."""
+
+import os
+import sys
+from pathlib import Path
+
+# Tests import the backend as top-level packages (core, api), like main.py
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+# Config validation needs a key; no test talks to OpenAI
+os.environ.setdefault("OPENAI_API_KEY", "sk-test")
@@ -0,0 +1,65 @@
+"""Tests for the Agno knowledge manager's Chroma integration."""
+
+import asyncio
+import threading
+from types import SimpleNamespace
+
+from core.agno_knowledge import AgnoKnowledgeManager, SharedClientChromaDb
+from core.config import get_config
+
+
+def test_shared_client_is_used_instead_of_a_new_one(tmp_path):
+    client = object()
+
+    vector_db = SharedClientChromaDb(
+        client,
+        collection="shared",
+        path=str(tmp_path),
+        persistent_client=True,
+    )
+
+    assert vector_db.client is client
+    assert not any(tmp_path.iterdir())
+
+
+class RecordingCollection:
+    def __init__(self, threads):
+        self.threads = threads
+
+    def query(self, query_embeddings, n_results, include):
+        self.threads.append(threading.get_ident())
+        return {
+            "ids": [["d1"] for _ in query_embeddings],
+            "documents": [["text"] for _ in query_embeddings],
+            "metadatas": [[{"file_path": "a.txt", "name": "a"}] for _ in query_embeddings],
+            "distances": [[0.25] for _ in query_embeddings],
+        }
+
+
+class RecordingClient:
+    def __init__(self):
+        self.threads = []
+
+    def get_or_create_collection(self, name, embedding_function=None):
+        self.threads.append(threading.get_ident())
+        return RecordingCollection(self.threads)
+
+
+def test_search_batch_keeps_chroma_calls_off_the_event_loop():
+    client = RecordingClient()
+    manager = AgnoKnowledgeManager.__new__(AgnoKnowledgeManager)
+    manager.config = get_config()
+    manager.vector_db = SimpleNamespace(client=client)
+
+    results = asyncio.run(manager.search_batch(["q1", "q2"], limit=1, embeddings=[[0.1], [0.2]]))
+
+    assert len(client.threads) == 2
+    assert threading.get_ident() not in client.threads
+    assert results[1] == [
+        {
+            "text": "text",
+            "score": None,
+            "metadata": {"file_path": "a.txt", "distances": 0.25, "similarity_score": 0.25},
+            "document_id": "d1",
+        }
+    ]
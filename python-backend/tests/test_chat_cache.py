@@ -0,0 +1,151 @@
+"""Tests for the chat response cache and how the team uses it."""
+
+import asyncio
+import uuid
+from types import SimpleNamespace
+
+import chromadb
+
+from core.chat_cache import SemanticChatCache
+from core.knowledge_team import KnowledgePlanningTeam
+
+
+class FakeCollection:
+    """Chroma collection stub returning one stored answer at a fixed distance."""
+
+    def __init__(self, distance: float, response: str = "stored answer") -> None:
+        self.distance = distance
+        self.response = response
+        self.added = []
+
+    def count(self) -> int:
+        return 1
+
+    def query(self, **kwargs):
+        return {"distances": [[self.distance]], "metadatas": [[{"response": self.response}]]}
+
+    def add(self, **kwargs):
+        self.added.append(kwargs)
+
+
+class FakeClient:
+    def __init__(self) -> None:
+        self.deleted = []
+
+    def delete_collection(self, name: str) -> None:
+        self.deleted.append(name)
+
+
+def make_semantic_cache(distance: float) -> SemanticChatCache:
+    cache = SemanticChatCache(max_entries=4, similarity_threshold=0.05, semantic=True)
+    cache._collection = FakeCollection(distance)
+    cache._client = FakeClient()
+    cache._embed = lambda message: [0.0, 1.0]
+    return cache
+
+
+def test_semantic_tier_is_off_by_default():
+    assert SemanticChatCache().semantic is False
+
+
+def test_exact_hit_ignores_case_and_spacing():
+    cache = SemanticChatCache(semantic=False)
+    asyncio.run(cache.put("What is RAG?", "an answer"))
+
+    assert asyncio.run(cache.get("  what   is rag? ")) == "an answer"
+    assert asyncio.run(cache.get("What is an LLM?")) is None
+
+
+def test_exact_cache_evicts_least_recently_used():
+    cache = SemanticChatCache(max_entries=2, semantic=False)
+    for message in ("a", "b", "c"):
+        asyncio.run(cache.put(message, message.upper()))
+
+    assert asyncio.run(cache.get("a")) is None
+    assert asyncio.run(cache.get("c")) == "C"
+
+
+def test_semantic_miss_above_threshold():
+    cache = make_semantic_cache(distance=0.2)
+
+    assert asyncio.run(cache.get("a different question")) is None
+
+
+def test_semantic_hit_within_threshold():
+    cache = make_semantic_cache(distance=0.01)
+
+    assert asyncio.run(cache.get("nearly the same question")) == "stored answer"
+
+
+def test_clear_drops_entries_and_collection():
+    cache = make_semantic_cache(distance=0.2)
+    client = cache._client
+    asyncio.run(cache.put("question", "answer"))
+
+    cache.clear()
+
+    assert asyncio.run(cache.get("question")) is None
+    assert client.deleted == [SemanticChatCache.COLLECTION_NAME]
+
+
+def test_restart_does_not_serve_answers_from_previous_run():
+    client = chromadb.EphemeralClient()
+    name = f"chat_cache_{uuid.uuid4().hex}"
+
+    def start_backend() -> SemanticChatCache:
+        cache = SemanticChatCache(similarity_threshold=0.05, semantic=True)
+        cache.COLLECTION_NAME = name
+        cache._client = client
+        cache._embed = lambda message: [0.0, 1.0]
+        return cache
+
+    asyncio.run(start_backend().put("question", "stale answer"))
+
+    restarted = start_backend()
+    assert asyncio.run(restarted.get("question")) is None
+    asyncio.run(restarted.put("question", "fresh answer"))
+    assert asyncio.run(restarted.get("question")) == "fresh answer"
+
+
+def make_team(answers):
+    """Build a team whose blocking run returns canned answers and records inputs."""
+    team = KnowledgePlanningTeam.__new__(KnowledgePlanningTeam)
+    team.team = SimpleNamespace(members=[])
+    team.knowledge_manager = SimpleNamespace(refresh=lambda: None, get_knowledge_instance=lambda: None)
+    team.response_cache = SemanticChatCache(semantic=False)
+    team._session_turns = 0
+    team._unseen_exchange = None
+    team._executor = None
+    team.inputs = []
+
+    def run_sync(message, stream):
+        team.inputs.append(message)
+        return answers.pop(0)
+
+    team._run_sync = run_sync
+    return team
+
+
+def test_team_serves_only_opening_turn_from_cache():
+    first = make_team(["fresh answer", "follow-up answer"])
+    asyncio.run(first.chat("What is RAG?"))
+
+    # A new session with the same opening question is answered from cache
+    second = make_team(["follow-up answer"])
+    second.response_cache = first.response_cache
+    assert asyncio.run(second.chat("what is rag?")) == "fresh answer"
+    assert second.inputs == []
+
+    # A follow-up goes to the team, with the cached exchange replayed
+    assert asyncio.run(second.chat("What is RAG?")) == "follow-up answer"
+    assert "You answered: fresh answer" in second.inputs[0]
+    assert asyncio.run(second.response_cache.get("What is RAG?")) == "fresh answer"
+
+
+def test_refresh_clears_response_cache():
+    team = make_team(["answer"])
+    asyncio.run(team.chat("question"))
+
+    team.refresh_knowledge()
+
+    assert asyncio.run(team.response_cache.get("question")) is None
@@ -0,0 +1,39 @@
+"""Tests for the shared API route dependencies."""
+
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+
+from api.dependencies import require_ready
+
+
+class FakeKnowledgeSystem:
+    def __init__(self, ready):
+        self.ready = ready
+
+    def is_ready(self):
+        return self.ready
+
+
+def make_request(knowledge_system):
+    return SimpleNamespace(app=SimpleNamespace(state=SimpleNamespace(knowledge_system=knowledge_system)))
+
+
+def test_require_ready_follows_the_knowledge_system():
+    knowledge_system = FakeKnowledgeSystem(ready=False)
+    request = make_request(knowledge_system)
+
+    with pytest.raises(HTTPException) as excinfo:
+        require_ready(request)
+    assert excinfo.value.status_code == 503
+
+    knowledge_system.ready = True
+    assert require_ready(request) is knowledge_system
+
+
+def test_missing_knowledge_system_is_unavailable():
+    with pytest.raises(HTTPException) as excinfo:
+        require_ready(make_request(None))
+
+    assert excinfo.value.status_code == 503
@@ -0,0 +1,100 @@
+"""Tests for how the indexing service keeps the file manifest in step with the index."""
+
+import asyncio
+from types import SimpleNamespace
+
+from core.config import get_config
+from core.document_service import DocumentIndexingService
+from core.file_manifest import FileManifest
+from core.indexer import DocumentIndexer
+
+
+class FakeIndexer:
+    """Indexer stub: loads every path except those listed as failing."""
+
+    document_file_paths = staticmethod(DocumentIndexer.document_file_paths)
+
+    def __init__(self, indexed=(), failing=()):
+        self.indexed = set(indexed)
+        self.failing = set(failing)
+        self.written = []
+        self.replaced = []
+
+    async def run_blocking(self, func, *args):
+        return func(*args)
+
+    def load_documents(self, paths):
+        return [
+            SimpleNamespace(metadata={"file_path": path})
+            for path in paths
+            if path not in self.failing
+        ]
+
+    async def aembed_documents(self, documents):
+        return list(documents)
+
+    async def aadd_nodes(self, nodes, replace_files=None):
+        self.replaced.extend(replace_files or [])
+        self.written.extend(nodes)
+
+    def get_indexed_source_files(self):
+        return set(self.indexed)
+
+    def _get_documents_from_directories(self):
+        return sorted(self.indexed | self.failing)
+
+
+class FakeOperations:
+    async def update_progress(self, operation_id, **kwargs):
+        pass
+
+
+def make_service(tmp_path, indexer):
+    service = DocumentIndexingService.__new__(DocumentIndexingService)
+    service.indexer = indexer
+    service.manifest = FileManifest(str(tmp_path / "manifest.db"))
+    service.operation_manager = FakeOperations()
+    service.config = get_config()
+    service._write_lock = asyncio.Lock()
+    service._manifest_checked = False
+    service._initialized = True
+    return service
+
+
+def make_files(tmp_path, *names):
+    paths = []
+    for name in names:
+        path = tmp_path / name
+        path.write_text(name)
+        paths.append(str(path))
+    return paths
+
+
+def test_only_loaded_files_are_recorded(tmp_path):
+    good, bad, other = make_files(tmp_path, "good.txt", "bad.txt", "other.txt")
+    service = make_service(tmp_path, FakeIndexer(failing=[bad]))
+    service._manifest_checked = True
+
+    asyncio.run(service._add_in_batches("op", [good, bad, other]))
+
+    assert asyncio.run(service.manifest.filter_unindexed([good, bad, other])) == [bad]
+
+
+def test_changed_files_replace_their_old_chunks(tmp_path):
+    path, unchanged = make_files(tmp_path, "a.txt", "b.txt")
+    indexer = FakeIndexer()
+    service = make_service(tmp_path, indexer)
+    service._manifest_checked = True
+    asyncio.run(service.manifest.record([path, unchanged]))
+    (tmp_path / "a.txt").write_text("edited and longer")
+
+    asyncio.run(service._add_in_batches("op", [path, unchanged]))
+
+    assert indexer.replaced == [path]
+
+
+def test_scan_backfills_an_empty_manifest_from_the_index(tmp_path):
+    indexed, failing = make_files(tmp_path, "indexed.txt", "failing.txt")
+    service = make_service(tmp_path, FakeIndexer(indexed=[indexed], failing=[failing]))
+
+    assert asyncio.run(service.scan_for_new_documents()) == [failing]
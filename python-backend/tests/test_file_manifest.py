@@ -0,0 +1,74 @@
+"""Tests for the persistent manifest of indexed files."""
+
+import asyncio
+import os
+
+from core.file_manifest import FileManifest
+
+
+def make_files(tmp_path, *names):
+    paths = []
+    for name in names:
+        path = tmp_path / name
+        path.write_text(name)
+        paths.append(str(path))
+    return paths
+
+
+def test_recorded_files_are_not_reported(tmp_path):
+    manifest = FileManifest(str(tmp_path / "manifest.db"))
+    indexed, new = make_files(tmp_path, "a.txt", "b.txt")
+
+    asyncio.run(manifest.record([indexed]))
+
+    assert asyncio.run(manifest.filter_unindexed([indexed, new])) == [new]
+
+
+def test_changed_file_is_reported_again(tmp_path):
+    manifest = FileManifest(str(tmp_path / "manifest.db"))
+    (path,) = make_files(tmp_path, "a.txt")
+    asyncio.run(manifest.record([path]))
+
+    with open(path, "a") as f:
+        f.write(" more text")
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert asyncio.run(manifest.filter_unindexed([path])) == [path]
+
+
+def test_missing_files_are_skipped(tmp_path):
+    manifest = FileManifest(str(tmp_path / "manifest.db"))
+    missing = str(tmp_path / "gone.txt")
+
+    asyncio.run(manifest.record([missing]))
+
+    assert asyncio.run(manifest.filter_unindexed([missing])) == []
+
+
+def test_replace_drops_previous_entries(tmp_path):
+    manifest = FileManifest(str(tmp_path / "manifest.db"))
+    old, current = make_files(tmp_path, "old.txt", "current.txt")
+    asyncio.run(manifest.record([old]))
+
+    asyncio.run(manifest.record([current], replace=True))
+
+    assert asyncio.run(manifest.filter_unindexed([old, current])) == [old]
+
+
+def test_manifest_persists_across_instances(tmp_path):
+    db_path = str(tmp_path / "manifest.db")
+    (path,) = make_files(tmp_path, "a.txt")
+    asyncio.run(FileManifest(db_path).record([path]))
+
+    assert asyncio.run(FileManifest(db_path).filter_unindexed([path])) == []
+
+
+def test_is_empty_until_a_file_is_recorded(tmp_path):
+    manifest = FileManifest(str(tmp_path / "manifest.db"))
+    (path,) = make_files(tmp_path, "a.txt")
+    assert asyncio.run(manifest.is_empty())
+
+    asyncio.run(manifest.record([path]))
+
+    assert not asyncio.run(manifest.is_empty())
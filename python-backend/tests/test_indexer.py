@@ -0,0 +1,59 @@
+"""Tests for indexer helpers that work on loaded documents and the Chroma collection."""
+
+import uuid
+from types import SimpleNamespace
+
+import chromadb
+
+from core.indexer import DocumentIndexer
+
+
+def make_indexer(collection):
+    indexer = DocumentIndexer.__new__(DocumentIndexer)
+    indexer.chroma_client = SimpleNamespace(get_max_batch_size=lambda: 2)
+    indexer.chroma_collection = collection
+    indexer._count_cache = None
+    indexer._source_files_cache = None
+    return indexer
+
+
+def make_collection(*file_paths):
+    # Ephemeral clients share one in-memory store, so each test gets its own collection
+    collection = chromadb.EphemeralClient().create_collection(
+        f"test_{uuid.uuid4().hex}", embedding_function=None
+    )
+    collection.add(
+        ids=[f"chunk-{i}" for i in range(len(file_paths))],
+        embeddings=[[1.0, float(i)] for i in range(len(file_paths))],
+        metadatas=[{"file_path": path} for path in file_paths],
+    )
+    return collection
+
+
+def test_document_file_paths_are_unique_and_ordered():
+    documents = [
+        SimpleNamespace(metadata={"file_path": "b.txt"}),
+        SimpleNamespace(metadata={"file_path": "a.pdf"}),
+        SimpleNamespace(metadata={"file_path": "b.txt"}),
+        SimpleNamespace(metadata={}),
+    ]
+
+    assert DocumentIndexer.document_file_paths(documents) == ["b.txt", "a.pdf"]
+
+
+def test_indexed_source_files_page_through_the_collection():
+    indexer = make_indexer(make_collection("a.txt", "a.txt", "b.txt", "c.txt", "c.txt"))
+
+    assert indexer.get_indexed_source_files() == {"a.txt", "b.txt", "c.txt"}
+    assert indexer._get_unique_source_files() == 3
+
+
+def test_delete_file_chunks_removes_only_those_files():
+    collection = make_collection("a.txt", "a.txt", "b.txt")
+    indexer = make_indexer(collection)
+    indexer.get_indexed_source_files()
+
+    indexer._delete_file_chunks(["a.txt", "missing.txt"])
+
+    assert collection.count() == 1
+    assert indexer.get_indexed_source_files() == {"b.txt"}
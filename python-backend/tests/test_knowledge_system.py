@@ -0,0 +1,57 @@
+"""Tests for the document query flow of the knowledge system facade."""
+
+import asyncio
+
+from core.knowledge_system import KnowledgeSystem
+
+
+class FakeChatService:
+    def __init__(self, documents=None, error=None):
+        self.documents = documents or []
+        self.error = error
+        self.messages = []
+
+    async def search_documents(self, query, top_k=None):
+        if self.error:
+            raise self.error
+        return self.documents
+
+    async def chat(self, message):
+        self.messages.append(message)
+        return "an answer"
+
+
+def make_system(chat_service):
+    system = KnowledgeSystem.__new__(KnowledgeSystem)
+    system.chat_service = chat_service
+    system._ready = True
+    return system
+
+
+def test_query_without_sources_never_calls_the_model():
+    chat_service = FakeChatService()
+
+    result = asyncio.run(make_system(chat_service).query_documents("anything"))
+
+    assert result["result"]["metadata"]["knowledge_status"] == "no_results"
+    assert chat_service.messages == []
+
+
+def test_query_with_sources_answers_with_previews():
+    document = {"text": "x" * 300, "score": 0.9, "metadata": {}, "document_id": "d1"}
+    chat_service = FakeChatService(documents=[document])
+
+    result = asyncio.run(make_system(chat_service).query_documents("question"))["result"]
+
+    assert result["answer"] == "an answer"
+    assert result["sources"][0]["text"] == "x" * KnowledgeSystem.PREVIEW_CHARS + "..."
+    assert chat_service.messages == ["question"]
+
+
+def test_search_errors_are_reported_not_hidden():
+    chat_service = FakeChatService(error=RuntimeError("chroma down"))
+
+    result = asyncio.run(make_system(chat_service).query_documents("question"))
+
+    assert result == {"success": False, "error": "chroma down"}
+    assert chat_service.messages == []
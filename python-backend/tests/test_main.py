@@ -0,0 +1,37 @@
+"""Tests for the app-level middleware setup."""
+
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
+from fastapi.testclient import TestClient
+
+from main import StreamSafeGZipMiddleware
+
+BODY = "x" * 4096
+
+
+def make_client():
+    app = FastAPI()
+    app.add_middleware(StreamSafeGZipMiddleware, minimum_size=1024, exclude_paths=("/stream",))
+
+    @app.get("/stream")
+    async def stream():
+        return PlainTextResponse(BODY)
+
+    @app.get("/large")
+    async def large():
+        return PlainTextResponse(BODY)
+
+    return TestClient(app)
+
+
+def test_excluded_path_is_not_compressed():
+    response = make_client().get("/stream", headers={"Accept-Encoding": "gzip"})
+
+    assert "content-encoding" not in response.headers
+    assert response.text == BODY
+
+
+def test_other_paths_are_still_compressed():
+    response = make_client().get("/large", headers={"Accept-Encoding": "gzip"})
+
+    assert response.headers["content-encoding"] == "gzip"
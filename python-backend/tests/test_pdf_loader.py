@@ -0,0 +1,70 @@
+"""Tests for PDF validation and error categorization."""
+
+import fitz
+
+from core.pdf_loader import categorize_error, validate_pdf
+
+
+def write_pdf(path, **save_options):
+    doc = fitz.open()
+    doc.new_page().insert_text((72, 72), "Hello PDF")
+    doc.save(str(path), **save_options)
+    doc.close()
+    return str(path)
+
+
+def test_valid_pdf_passes(tmp_path):
+    path = write_pdf(tmp_path / "ok.pdf")
+
+    assert validate_pdf(path, max_file_size_mb=10, skip_encrypted=True) == (True, None, None)
+
+
+def test_missing_file_is_invalid(tmp_path):
+    valid, category, _ = validate_pdf(str(tmp_path / "none.pdf"), 10, True)
+
+    assert (valid, category) == (False, "invalid")
+
+
+def test_directory_is_invalid(tmp_path):
+    valid, category, message = validate_pdf(str(tmp_path), 10, True)
+
+    assert (valid, category, message) == (False, "invalid", "Not a file")
+
+
+def test_non_pdf_header_is_invalid(tmp_path):
+    path = tmp_path / "fake.pdf"
+    path.write_bytes(b"just some text")
+
+    valid, category, _ = validate_pdf(str(path), 10, True)
+
+    assert (valid, category) == (False, "invalid")
+
+
+def test_oversized_file_is_rejected(tmp_path):
+    path = tmp_path / "big.pdf"
+    path.write_bytes(b"%PDF-1.7\n" + b"0" * (2 * 1024 * 1024))
+
+    valid, category, _ = validate_pdf(str(path), max_file_size_mb=1, skip_encrypted=True)
+
+    assert (valid, category) == (False, "oversized")
+
+
+def test_encrypted_pdf_is_rejected_only_when_skipping(tmp_path):
+    path = write_pdf(
+        tmp_path / "locked.pdf",
+        encryption=fitz.PDF_ENCRYPT_AES_256,
+        user_pw="secret",
+        owner_pw="owner",
+    )
+
+    valid, category, _ = validate_pdf(path, 10, skip_encrypted=True)
+    assert (valid, category) == (False, "encrypted")
+
+    assert validate_pdf(path, 10, skip_encrypted=False)[0] is True
+
+
+def test_categorize_error():
+    assert categorize_error("Document is encrypted") == "encrypted"
+    assert categorize_error("needs a PASSWORD") == "encrypted"
+    assert categorize_error("file is Corrupted") == "corrupted"
+    assert categorize_error("unexpected token") == "parse_error"
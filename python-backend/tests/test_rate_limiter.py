@@ -0,0 +1,56 @@
+"""Tests for the adaptive (AIMD) concurrency limiter."""
+
+import asyncio
+
+from core.rate_limiter import AdaptiveConcurrencyLimiter
+
+
+def test_rate_limit_halves_and_success_grows_back():
+    limiter = AdaptiveConcurrencyLimiter(max_limit=8)
+
+    limiter.on_rate_limited()
+    limiter.on_rate_limited()
+    assert limiter.limit == 2
+
+    for _ in range(10):
+        limiter.on_success()
+    assert limiter.limit == 8
+
+
+def test_limit_never_drops_below_one():
+    limiter = AdaptiveConcurrencyLimiter(max_limit=0)
+    assert limiter.max_limit == 1
+
+    limiter.on_rate_limited()
+    assert limiter.limit == 1
+
+
+def test_in_flight_calls_respect_the_limit():
+    limiter = AdaptiveConcurrencyLimiter(max_limit=4)
+    limiter.on_rate_limited()
+    active = peak = 0
+
+    async def call():
+        nonlocal active, peak
+        async with limiter:
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+
+    async def main():
+        await asyncio.gather(*(call() for _ in range(10)))
+
+    asyncio.run(main())
+    assert peak == 2
+
+
+def test_limiter_can_be_reused_across_event_loops():
+    limiter = AdaptiveConcurrencyLimiter(max_limit=1)
+
+    async def call():
+        async with limiter:
+            return True
+
+    assert asyncio.run(call())
+    assert asyncio.run(call())
@@ -0,0 +1,85 @@
+"""Tests for micro-batching of concurrent searches."""
+
+import asyncio
+
+from core.search_batcher import SearchBatcher
+
+
+class FakeKnowledgeManager:
+    """Records batched calls and returns five results per query."""
+
+    def __init__(self, error=None):
+        self.calls = []
+        self.error = error
+
+    async def search_batch(self, queries, limit, embeddings):
+        self.calls.append((list(queries), limit, list(embeddings)))
+        if self.error:
+            raise self.error
+        return [[{"query": query, "rank": i} for i in range(5)] for query in queries]
+
+
+def test_concurrent_searches_share_one_batch():
+    manager = FakeKnowledgeManager()
+    batcher = SearchBatcher(manager, window_ms=20, max_batch_size=8)
+
+    async def main():
+        try:
+            return await asyncio.gather(
+                batcher.search("a", 1),
+                batcher.search("b", 3, embedding=[0.1]),
+            )
+        finally:
+            await batcher.close()
+
+    first, second = asyncio.run(main())
+    assert manager.calls == [(["a", "b"], 3, [None, [0.1]])]
+    assert first == [{"query": "a", "rank": 0}]
+    assert [r["query"] for r in second] == ["b"] * 3
+
+
+def test_batches_are_capped_at_max_size():
+    manager = FakeKnowledgeManager()
+    batcher = SearchBatcher(manager, window_ms=20, max_batch_size=2)
+
+    async def main():
+        try:
+            await asyncio.gather(*(batcher.search(q, 1) for q in "abc"))
+        finally:
+            await batcher.close()
+
+    asyncio.run(main())
+    assert [len(queries) for queries, _, _ in manager.calls] == [2, 1]
+
+
+def test_batch_failure_reaches_every_caller():
+    batcher = SearchBatcher(FakeKnowledgeManager(RuntimeError("down")), window_ms=20, max_batch_size=8)
+
+    async def main():
+        try:
+            return await asyncio.gather(
+                batcher.search("a", 1),
+                batcher.search("b", 1),
+                return_exceptions=True,
+            )
+        finally:
+            await batcher.close()
+
+    assert all(isinstance(result, RuntimeError) for result in asyncio.run(main()))
+
+
+def test_worker_restarts_on_a_new_event_loop():
+    manager = FakeKnowledgeManager()
+    batcher = SearchBatcher(manager, window_ms=1, max_batch_size=8)
+
+    assert asyncio.run(batcher.search("a", 1))
+    assert asyncio.run(batcher.search("b", 1))
+    assert len(manager.calls) == 2
+
+
+def test_close_without_searches_is_a_no_op():
+    batcher = SearchBatcher(FakeKnowledgeManager(), window_ms=1, max_batch_size=8)
+
+    asyncio.run(batcher.close())
+
+    assert batcher._worker is None
@@ -0,0 +1,62 @@
+"""Tests for the semantic document search cache."""
+
+from core.search_cache import SemanticSearchCache
+
+
+def results(n):
+    return [{"content": f"chunk {i}", "score": 1.0 - i / 10} for i in range(n)]
+
+
+def test_similar_query_hits_and_returns_copies():
+    cache = SemanticSearchCache(similarity_threshold=0.9)
+    cache.put([1.0, 0.0], top_k=3, results=results(3))
+
+    hit = cache.get([0.99, 0.05], top_k=2)
+    assert [r["content"] for r in hit] == ["chunk 0", "chunk 1"]
+
+    hit[0]["content"] = "changed"
+    assert cache.get([1.0, 0.0], top_k=1)[0]["content"] == "chunk 0"
+
+
+def test_dissimilar_query_misses():
+    cache = SemanticSearchCache(similarity_threshold=0.9)
+    cache.put([1.0, 0.0], top_k=3, results=results(3))
+
+    assert cache.get([0.0, 1.0], top_k=3) is None
+
+
+def test_deeper_request_than_cached_misses():
+    cache = SemanticSearchCache(similarity_threshold=0.9)
+    cache.put([1.0, 0.0], top_k=2, results=results(2))
+
+    assert cache.get([1.0, 0.0], top_k=5) is None
+
+
+def test_near_duplicate_replaces_existing_entry():
+    cache = SemanticSearchCache(similarity_threshold=0.9)
+    cache.put([1.0, 0.0], top_k=3, results=results(3))
+    cache.put([1.0, 0.01], top_k=3, results=results(1))
+
+    assert len(cache._entries) == 1
+    assert len(cache.get([1.0, 0.0], top_k=1)) == 1
+
+
+def test_expired_and_evicted_entries_miss():
+    expired = SemanticSearchCache(similarity_threshold=0.9, ttl=0)
+    expired.put([1.0, 0.0], top_k=1, results=results(1))
+    assert expired.get([1.0, 0.0], top_k=1) is None
+
+    small = SemanticSearchCache(similarity_threshold=0.9, max_entries=1)
+    small.put([1.0, 0.0], top_k=1, results=results(1))
+    small.put([0.0, 1.0], top_k=1, results=results(1))
+    assert small.get([1.0, 0.0], top_k=1) is None
+    assert small.get([0.0, 1.0], top_k=1) is not None
+
+
+def test_clear_drops_everything():
+    cache = SemanticSearchCache(similarity_threshold=0.9)
+    cache.put([1.0, 0.0], top_k=1, results=results(1))
+
+    cache.clear()
+
+    assert cache.get([1.0, 0.0], top_k=1) is None
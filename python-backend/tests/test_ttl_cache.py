@@ -0,0 +1,134 @@
+"""Tests for the single-flight TTL cache."""
+
+import asyncio
+
+from core.ttl_cache import AsyncTTLCache
+
+
+def test_concurrent_misses_share_one_load():
+    cache = AsyncTTLCache(ttl=60)
+    calls = []
+
+    async def loader():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return "value"
+
+    async def main():
+        return await asyncio.gather(*(cache.get_or_load("key", loader) for _ in range(5)))
+
+    assert asyncio.run(main()) == ["value"] * 5
+    assert len(calls) == 1
+
+
+def test_fresh_entry_is_served_without_loading():
+    cache = AsyncTTLCache(ttl=60)
+    values = iter(["first", "second"])
+
+    async def loader():
+        return next(values)
+
+    async def main():
+        return [await cache.get_or_load("key", loader) for _ in range(2)]
+
+    assert asyncio.run(main()) == ["first", "first"]
+
+
+def test_expired_entry_is_reloaded():
+    cache = AsyncTTLCache(ttl=0)
+    values = iter(["first", "second"])
+
+    async def loader():
+        return next(values)
+
+    async def main():
+        return [await cache.get_or_load("key", loader) for _ in range(2)]
+
+    assert asyncio.run(main()) == ["first", "second"]
+
+
+def test_invalidation_during_load_discards_stale_value():
+    cache = AsyncTTLCache(ttl=60)
+    values = iter(["stale", "fresh"])
+
+    async def loader():
+        value = next(values)
+        if value == "stale":
+            cache.invalidate()
+        return value
+
+    async def main():
+        first = await cache.get_or_load("key", loader)
+        second = await cache.get_or_load("key", loader)
+        return first, second
+
+    assert asyncio.run(main()) == ("stale", "fresh")
+
+
+def test_failed_load_propagates_to_waiters_and_is_not_cached():
+    cache = AsyncTTLCache(ttl=60)
+
+    async def failing():
+        await asyncio.sleep(0.01)
+        raise RuntimeError("boom")
+
+    async def ok():
+        return "value"
+
+    async def main():
+        results = await asyncio.gather(
+            cache.get_or_load("key", failing),
+            cache.get_or_load("key", failing),
+            return_exceptions=True,
+        )
+        return results, await cache.get_or_load("key", ok)
+
+    results, value = asyncio.run(main())
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert value == "value"
+
+
+def test_maxsize_evicts_oldest_key():
+    cache = AsyncTTLCache(ttl=60, maxsize=2)
+
+    async def main():
+        for key in ("a", "b", "c"):
+            await cache.get_or_load(key, lambda key=key: asyncio.sleep(0, key))
+
+    asyncio.run(main())
+    assert list(cache._entries) == ["b", "c"]
+
+
+def test_invalidate_single_key():
+    cache = AsyncTTLCache(ttl=60)
+
+    async def main():
+        for key in ("a", "b"):
+            await cache.get_or_load(key, lambda key=key: asyncio.sleep(0, key))
+        cache.invalidate("a")
+
+    asyncio.run(main())
+    assert list(cache._entries) == ["b"]
+
+
+def test_cancelled_load_does_not_cancel_waiters():
+    cache = AsyncTTLCache(ttl=60)
+    started = []
+
+    async def loader():
+        started.append(1)
+        await asyncio.sleep(0.05)
+        return "value"
+
+    async def main():
+        leader = asyncio.create_task(cache.get_or_load("key", loader))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(cache.get_or_load("key", loader))
+        await asyncio.sleep(0.01)
+        leader.cancel()
+        return await asyncio.gather(leader, follower, return_exceptions=True)
+
+    leader_result, follower_result = asyncio.run(main())
+    assert isinstance(leader_result, asyncio.CancelledError)
+    assert follower_result == "value"
+    assert len(started) == 2